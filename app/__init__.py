@@ -0,0 +1,4 @@
+import time
+
+# app 패키지를 처음 import한 시각 (서버 기동 시간 측정 기준)
+IMPORT_STARTED_AT = time.perf_counter()
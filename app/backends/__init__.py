@@ -0,0 +1,18 @@
+"""
+교정 모델 추론 백엔드
+WorkflowNodes는 모델을 직접 호출하지 않고 CorrectionBackend 인터페이스를 통해 교정합니다.
+"""
+
+from .base import BackendCapabilities, CorrectionBackend, Seq2SeqBackend
+from .onnx_backend import OnnxSeq2SeqBackend
+from .stub_backend import StubCorrectionBackend
+from .torch_backend import TorchSeq2SeqBackend
+
+__all__ = [
+    "BackendCapabilities",
+    "CorrectionBackend",
+    "Seq2SeqBackend",
+    "TorchSeq2SeqBackend",
+    "OnnxSeq2SeqBackend",
+    "StubCorrectionBackend",
+]
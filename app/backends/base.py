@@ -0,0 +1,136 @@
+import math
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Protocol, runtime_checkable
+
+from ..utils.metrics import CHUNK_BUCKETS, TOKEN_BUCKETS, metrics_registry
+
+STAGE_SECONDS = metrics_registry.histogram(
+    "fixme_backend_stage_seconds",
+    "seq2seq 백엔드 배치의 단계별(tokenize/generate/decode) 실행 시간",
+    ["backend", "model", "stage"],
+)
+BATCH_TOKENS = metrics_registry.histogram(
+    "fixme_backend_batch_tokens",
+    "seq2seq 백엔드 배치의 입력/출력 토큰 수 (패딩과 디코더 시작 토큰 제외)",
+    ["backend", "model", "direction"],
+    buckets=TOKEN_BUCKETS,
+)
+BATCH_CHUNKS = metrics_registry.histogram(
+    "fixme_backend_batch_chunks",
+    "seq2seq 백엔드 generate 호출당 청크 수",
+    ["backend", "model"],
+    buckets=CHUNK_BUCKETS,
+)
+
+
+@dataclass(frozen=True)
+class BackendCapabilities:
+    """백엔드가 지원하는 기능"""
+
+    batching: bool = True  # 여러 청크를 한 번의 호출로 처리
+    beam_search: bool = True  # num_beams 등 생성 설정을 반영
+    deterministic: bool = True  # 같은 입력에 항상 같은 출력 (청크 캐시 사용 가능)
+    requires_model_files: bool = True  # 모델 가중치 다운로드/로드 필요
+
+
+@runtime_checkable
+class CorrectionBackend(Protocol):
+    """WorkflowNodes가 교정 모델을 호출하는 인터페이스
+
+    correct는 청크 목록을 받아 같은 순서의 교정 결과 목록을 반환합니다.
+    options는 생성 설정(max_new_tokens, num_beams 등)이며 지원하지 않는 백엔드는 무시합니다.
+    """
+
+    name: str
+    capabilities: BackendCapabilities
+
+    def correct(self, chunks: List[str], **options) -> List[str]:
+        ...
+
+
+class Seq2SeqBackend:
+    """transformers generate 기반 seq2seq 교정 백엔드 공통 구현 (토크나이징 -> 생성 -> 디코딩)"""
+
+    name = "base"
+    capabilities = BackendCapabilities()
+
+    def __init__(self, model, tokenizer, model_name: str = ""):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.model_name = model_name  # 메트릭 레이블
+
+    def correct(
+        self,
+        chunks: List[str],
+        max_input_length: Optional[int] = None,
+        clean_up_tokenization_spaces: Optional[bool] = None,
+        max_new_tokens_ratio: Optional[float] = None,
+        max_new_tokens_margin: int = 0,
+        **generation_config,
+    ) -> List[str]:
+        """여러 청크를 패딩하여 한 번에 생성하고 디코딩된 결과를 순서대로 반환
+
+        max_new_tokens_ratio가 주어지면 배치에서 가장 긴 입력의 토큰 수 * ratio + margin으로
+        max_new_tokens를 정합니다.
+        """
+        started = time.perf_counter()
+        inputs = self._tokenize(chunks, max_input_length)
+        tokenized = time.perf_counter()
+        if max_new_tokens_ratio is not None:
+            input_tokens = int(inputs["attention_mask"].sum(dim=1).max())
+            generation_config["max_new_tokens"] = (
+                math.ceil(input_tokens * max_new_tokens_ratio) + max_new_tokens_margin
+            )
+        outputs = self._generate(inputs, generation_config)
+        generated = time.perf_counter()
+
+        decode_options = {"skip_special_tokens": True}
+        if clean_up_tokenization_spaces is not None:
+            decode_options["clean_up_tokenization_spaces"] = clean_up_tokenization_spaces
+        decoded = self.tokenizer.batch_decode(outputs, **decode_options)
+        finished = time.perf_counter()
+
+        self._observe(
+            len(chunks),
+            {"tokenize": tokenized - started, "generate": generated - tokenized, "decode": finished - generated},
+            input_tokens=int(inputs["attention_mask"].sum()),
+            output_tokens=self._count_output_tokens(outputs),
+        )
+        return [text.strip() for text in decoded]
+
+    def _count_output_tokens(self, outputs) -> int:
+        """생성된 토큰 수 (패딩과, 인코더-디코더 모델의 출력 맨 앞에 붙는 디코더 시작 토큰은 제외)"""
+        config = getattr(self.model, "config", None)
+        if getattr(config, "is_encoder_decoder", False):
+            outputs = outputs[:, 1:]
+        return int((outputs != self.tokenizer.pad_token_id).sum())
+
+    def _observe(self, chunks: int, stage_seconds: dict, input_tokens: int, output_tokens: int):
+        """배치의 단계별 실행 시간, 토큰 수, 청크 수를 메트릭에 기록"""
+        labels = {"backend": self.name, "model": self.model_name}
+        for stage, seconds in stage_seconds.items():
+            STAGE_SECONDS.observe(seconds, stage=stage, **labels)
+        BATCH_TOKENS.observe(input_tokens, direction="in", **labels)
+        BATCH_TOKENS.observe(output_tokens, direction="out", **labels)
+        BATCH_CHUNKS.observe(chunks, **labels)
+
+    def _tokenize(self, texts: List[str], max_input_length: Optional[int]):
+        if max_input_length is None:
+            return self.tokenizer(texts, return_tensors="pt", padding=True)
+        return self.tokenizer(
+            texts,
+            return_tensors="pt",
+            padding=True,
+            max_length=max_input_length,
+            truncation=True,
+        )
+
+    def _generate(self, inputs, generation_config: dict):
+        return self.model.generate(
+            input_ids=inputs["input_ids"],
+            attention_mask=inputs["attention_mask"],
+            pad_token_id=self.tokenizer.pad_token_id,
+            eos_token_id=self.tokenizer.eos_token_id,
+            **generation_config,
+        )
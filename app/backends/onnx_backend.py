@@ -0,0 +1,40 @@
+import os
+
+from .base import Seq2SeqBackend
+
+
+class OnnxSeq2SeqBackend(Seq2SeqBackend):
+    """ONNX Runtime(CPU)으로 생성하는 백엔드
+
+    optimum으로 인코더, 디코더, past key values를 사용하는 디코더를 ONNX로 내보내고
+    transformers generate의 greedy/beam search를 그대로 사용합니다.
+    """
+
+    name = "onnx"
+
+    @classmethod
+    def from_pretrained(cls, model_name: str, export_dir: str) -> "OnnxSeq2SeqBackend":
+        try:
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        except ImportError as e:
+            raise ImportError(
+                "INFERENCE_BACKEND=onnx를 사용하려면 optimum[onnxruntime] 패키지가 필요합니다."
+            ) from e
+        from transformers import AutoTokenizer
+
+        # 한 번 내보낸 모델은 디스크에서 다시 사용
+        local_dir = os.path.join(export_dir, model_name.replace("/", "--"))
+        if os.path.exists(os.path.join(local_dir, "config.json")):
+            model = ORTModelForSeq2SeqLM.from_pretrained(
+                local_dir, use_cache=True, provider="CPUExecutionProvider"
+            )
+            tokenizer = AutoTokenizer.from_pretrained(local_dir)
+        else:
+            print(f"Exporting {model_name} to ONNX ({local_dir})...")
+            model = ORTModelForSeq2SeqLM.from_pretrained(
+                model_name, export=True, use_cache=True, provider="CPUExecutionProvider"
+            )
+            tokenizer = AutoTokenizer.from_pretrained(model_name)
+            model.save_pretrained(local_dir)
+            tokenizer.save_pretrained(local_dir)
+        return cls(model, tokenizer, model_name)
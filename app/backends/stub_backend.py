@@ -0,0 +1,42 @@
+import threading
+import time
+from typing import Callable, List, Optional
+
+from .base import BackendCapabilities
+
+
+class StubCorrectionBackend:
+    """모델 없이 동작하는 결정적 교정 백엔드 (테스트와 벤치마크용)
+
+    입력 청크를 그대로(또는 transform을 적용해) 반환하며,
+    호출당 latency_ms와 청크당 per_chunk_latency_ms만큼 모델 추론 시간을 흉내냅니다.
+    """
+
+    name = "stub"
+    capabilities = BackendCapabilities(beam_search=False, requires_model_files=False)
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        per_chunk_latency_ms: float = 0.0,
+        transform: Optional[Callable[[str], str]] = None,
+    ):
+        self.latency_ms = latency_ms
+        self.per_chunk_latency_ms = per_chunk_latency_ms
+        self.transform = transform
+        self.calls = 0
+        self.chunks = 0
+        self._lock = threading.Lock()
+
+    def correct(self, chunks: List[str], **options) -> List[str]:
+        with self._lock:
+            self.calls += 1
+            self.chunks += len(chunks)
+
+        delay_ms = self.latency_ms + self.per_chunk_latency_ms * len(chunks)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000.0)
+
+        if self.transform is None:
+            return list(chunks)
+        return [self.transform(chunk) for chunk in chunks]
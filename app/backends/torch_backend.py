@@ -0,0 +1,132 @@
+import os
+from typing import List, Optional
+
+from .base import Seq2SeqBackend
+
+
+def quantize_dynamic_int8(model):
+    """Linear 레이어에 동적 int8 양자화 적용 (CPU 전용)"""
+    import torch
+
+    model.eval()
+    quantized = torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+    print(f"Applied dynamic int8 quantization to {type(model).__name__}")
+    return quantized
+
+
+def shared_weights_dir(weights_dir: str, model_name: str, torch_dtype=None) -> str:
+    dtype_name = str(torch_dtype).replace("torch.", "") if torch_dtype is not None else "float32"
+    return os.path.join(weights_dir, f"{model_name.replace('/', '--')}-{dtype_name}")
+
+
+def export_shared_weights(model_name: str, weights_dir: str, torch_dtype=None) -> str:
+    """state_dict를 mmap으로 읽을 수 있는 파일로 저장 (이미 있으면 재사용)
+
+    워커 프로세스들이 같은 파일을 mmap으로 읽으면 가중치 페이지가 페이지 캐시에서
+    공유되므로 워커 수만큼 모델 메모리가 늘어나지 않습니다.
+    """
+    import torch
+    from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+    local_dir = shared_weights_dir(weights_dir, model_name, torch_dtype)
+    weights_path = os.path.join(local_dir, "state_dict.pt")
+    if os.path.exists(weights_path):
+        return local_dir
+
+    print(f"Exporting {model_name} weights for shared loading ({local_dir})...")
+    options = {"torch_dtype": torch_dtype} if torch_dtype is not None else {}
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name, **options)
+    model.config.save_pretrained(local_dir)
+    if model.generation_config is not None:
+        model.generation_config.save_pretrained(local_dir)
+    AutoTokenizer.from_pretrained(model_name).save_pretrained(local_dir)
+    # 가중치 파일을 마지막에 교체하여 중간에 멈추면 다음 실행에서 다시 내보냄
+    tmp_path = f"{weights_path}.{os.getpid()}.tmp"
+    torch.save(model.state_dict(), tmp_path)
+    os.replace(tmp_path, weights_path)
+    return local_dir
+
+
+def load_shared_model(local_dir: str):
+    """meta 디바이스에 모델 구조만 만든 뒤 mmap한 state_dict를 복사 없이 할당"""
+    import torch
+    from transformers import AutoConfig, AutoModelForSeq2SeqLM, GenerationConfig
+
+    config = AutoConfig.from_pretrained(local_dir)
+    with torch.device("meta"):
+        model = AutoModelForSeq2SeqLM.from_config(config)
+    state_dict = torch.load(
+        os.path.join(local_dir, "state_dict.pt"), mmap=True, weights_only=True
+    )
+    model.load_state_dict(state_dict, assign=True)
+    model.tie_weights()
+
+    missing = [name for name, tensor in model.state_dict().items() if tensor.is_meta]
+    if missing:
+        raise RuntimeError(f"공유 가중치 파일에 없는 텐서가 있습니다: {missing[:5]}")
+    try:
+        model.generation_config = GenerationConfig.from_pretrained(local_dir)
+    except OSError:
+        pass
+    return model.eval()
+
+
+class TorchSeq2SeqBackend(Seq2SeqBackend):
+    """PyTorch(transformers) 모델로 생성하는 백엔드"""
+
+    name = "torch"
+
+    def __init__(self, model, tokenizer, device, model_name: str = ""):
+        super().__init__(model, tokenizer, model_name)
+        self.device = device
+
+    @classmethod
+    def from_pretrained(
+        cls,
+        model_name: str,
+        device: str,
+        torch_dtype=None,
+        device_map: Optional[str] = None,
+        quantize: bool = False,
+        weights_dir: Optional[str] = None,
+    ) -> "TorchSeq2SeqBackend":
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+        if weights_dir is not None:
+            if device == "cpu":
+                local_dir = export_shared_weights(model_name, weights_dir, torch_dtype)
+                model = load_shared_model(local_dir)
+                tokenizer = AutoTokenizer.from_pretrained(local_dir)
+                if quantize:
+                    # 양자화된 가중치는 워커마다 새로 만들어지므로 공유되지 않음
+                    model = quantize_dynamic_int8(model)
+                return cls(model, tokenizer, device, model_name)
+            print("Shared weights are CPU-only, loading the model per process")
+
+        options = {}
+        if torch_dtype is not None:
+            options["torch_dtype"] = torch_dtype
+        if device_map is not None:
+            options["device_map"] = device_map
+
+        model = AutoModelForSeq2SeqLM.from_pretrained(model_name, **options)
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        if device_map is None:
+            model.to(device)
+        else:
+            # device_map으로 배치된 경우 입력은 모델이 올라간 디바이스로 보냄
+            device = model.device
+        if quantize:
+            model = quantize_dynamic_int8(model)
+        return cls(model, tokenizer, device, model_name)
+
+    def _tokenize(self, texts: List[str], max_input_length: Optional[int]):
+        return super()._tokenize(texts, max_input_length).to(self.device)
+
+    def _generate(self, inputs, generation_config: dict):
+        import torch
+
+        with torch.no_grad():
+            return super()._generate(inputs, generation_config)
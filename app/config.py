@@ -7,10 +7,47 @@ load_dotenv()
 class Settings:
     MODEL_NAME: str = os.getenv("MODEL_NAME", "theSOL1/kogrammar-base")
     MAX_LENGTH: int = int(os.getenv("MAX_LENGTH", "2000"))
+    BATCH_MAX_ITEMS: int = int(os.getenv("BATCH_MAX_ITEMS", "256"))
     CHUNK_SIZE: int = int(os.getenv("CHUNK_SIZE", "300"))
+    GENERATION_BATCH_SIZE: int = int(os.getenv("GENERATION_BATCH_SIZE", "8"))
+    MICRO_BATCHING: bool = os.getenv("MICRO_BATCHING", "true").lower() == "true"
+    BATCH_MAX_WAIT_MS: float = float(os.getenv("BATCH_MAX_WAIT_MS", "10"))
+    INFERENCE_SLOTS: int = int(os.getenv("INFERENCE_SLOTS", "4"))
+    RESULT_CACHE_ENABLED: bool = os.getenv("RESULT_CACHE_ENABLED", "true").lower() == "true"
+    RESULT_CACHE_MAX_BYTES: int = int(os.getenv("RESULT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    RESULT_CACHE_TTL_SECONDS: float = float(os.getenv("RESULT_CACHE_TTL_SECONDS", "600"))
+    CHUNK_CACHE_ENABLED: bool = os.getenv("CHUNK_CACHE_ENABLED", "true").lower() == "true"
+    CHUNK_CACHE_MAX_BYTES: int = int(os.getenv("CHUNK_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+    CHUNK_CACHE_TTL_SECONDS: float = float(os.getenv("CHUNK_CACHE_TTL_SECONDS", "3600"))
+    SESSION_TTL_SECONDS: float = float(os.getenv("SESSION_TTL_SECONDS", "1800"))
+    SESSION_MAX_COUNT: int = int(os.getenv("SESSION_MAX_COUNT", "1000"))
+    JOB_DIR: str = os.getenv("JOB_DIR", "jobs")
+    JOB_MAX_LENGTH: int = int(os.getenv("JOB_MAX_LENGTH", "1000000"))
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "2"))
+    JOB_BATCH_CHUNKS: int = int(os.getenv("JOB_BATCH_CHUNKS", "16"))
+    JOB_TTL_SECONDS: float = float(os.getenv("JOB_TTL_SECONDS", "86400"))
+    QUANTIZATION: str = os.getenv("QUANTIZATION", "none").lower()
+    INFERENCE_BACKEND: str = os.getenv("INFERENCE_BACKEND", "torch").lower()
+    ONNX_MODEL_DIR: str = os.getenv("ONNX_MODEL_DIR", "onnx_models")
+    SHARED_WEIGHTS: bool = os.getenv("SHARED_WEIGHTS", "false").lower() == "true"
+    SHARED_WEIGHTS_DIR: str = os.getenv("SHARED_WEIGHTS_DIR", "shared_weights")
+    DECODING_POLICY: str = os.getenv("DECODING_POLICY", "beam").lower()
+    ADAPTIVE_GREEDY_MAX_CHARS: int = int(os.getenv("ADAPTIVE_GREEDY_MAX_CHARS", "150"))
+    MAX_NEW_TOKENS_RATIO: float = float(os.getenv("MAX_NEW_TOKENS_RATIO", "1.5"))
+    MAX_NEW_TOKENS_MARGIN: int = int(os.getenv("MAX_NEW_TOKENS_MARGIN", "16"))
+    DIFF_ENGINE: str = os.getenv("DIFF_ENGINE", "dmp").lower()
+    SKIP_MODEL_MODE: str = os.getenv("SKIP_MODEL_MODE", "off").lower()
+    CLEAN_FILTER_CAPACITY: int = int(os.getenv("CLEAN_FILTER_CAPACITY", "100000"))
+    CLEAN_FILTER_ERROR_RATE: float = float(os.getenv("CLEAN_FILTER_ERROR_RATE", "0.001"))
+    CLEAN_SENTENCES_FILE: str = os.getenv("CLEAN_SENTENCES_FILE", "")
+    STUB_LATENCY_MS: float = float(os.getenv("STUB_LATENCY_MS", "0"))
+    STUB_PER_CHUNK_LATENCY_MS: float = float(os.getenv("STUB_PER_CHUNK_LATENCY_MS", "0"))
+    MODEL_PRELOAD: bool = os.getenv("MODEL_PRELOAD", "true").lower() == "true"
     DEVICE: str = os.getenv("DEVICE", "auto")
     HOST: str = os.getenv("HOST", "0.0.0.0")
     PORT: int = int(os.getenv("PORT", "8000"))
+    RELOAD: bool = os.getenv("RELOAD", "false").lower() == "true"
+    WORKERS: int = int(os.getenv("WORKERS", "1"))
 
 
 settings = Settings()
@@ -1,20 +1,62 @@
-from fastapi import FastAPI, HTTPException
+import asyncio
+import json
+import threading
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from typing import AsyncIterator, Iterator, List, Optional
+from . import IMPORT_STARTED_AT
 from .models.models import (
     CorrectionRequest, CorrectionResponse, HealthResponse, Correction, Suggestion,
-    ComprehensiveRequest, ComprehensiveResponse, StyleImprovement, StyleOption
+    ComprehensiveRequest, ComprehensiveResponse, StyleImprovement, StyleOption,
+    ServiceStatsResponse, IncrementalEditRequest, IncrementalResponse, ReadinessResponse,
+    BatchCorrectionRequest, BatchCorrectionResponse, BatchCorrectionResult,
+    JobStatusResponse, JobResultResponse
 )
 from .services.advanced_spellcheck_service import (
     advanced_spellcheck_service as spellcheck_service,
 )
 from .services.comprehensive_style_service import comprehensive_style_service
+from .services.inference_executor import inference_executor
+from .services.incremental_service import incremental_correction_service
+from .services.job_service import document_job_service
+from .utils.metrics import MetricsRegistry, metrics_registry
 from .config import settings
 
+startup_seconds: Optional[float] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작/종료 처리 - 모델은 연결 수락을 막지 않도록 백그라운드에서 로드"""
+    global startup_seconds
+    if settings.MODEL_PRELOAD:
+        threading.Thread(
+            target=spellcheck_service.ensure_models_loaded,
+            name="model-loader",
+            daemon=True,
+        ).start()
+    # 문서 작업 스레드도 대화형 요청과 같은 추론 슬롯을 거치도록 서버 이벤트 루프를 등록
+    inference_executor.attach_loop(asyncio.get_running_loop())
+    resumed_jobs = document_job_service.resume()
+    if resumed_jobs:
+        print(f"Resumed {resumed_jobs} unfinished document jobs")
+    startup_seconds = round(time.perf_counter() - IMPORT_STARTED_AT, 3)
+    print(f"Server started in {startup_seconds}s (model preload: {settings.MODEL_PRELOAD})")
+
+    yield
+
+    document_job_service.shutdown()
+    inference_executor.shutdown()
+
+
 app = FastAPI(
     title="FixMe 맞춤법 교정 API",
     description="theSOL1/kogrammar-base 모델을 사용한 한국어 맞춤법 교정 서비스",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -26,24 +68,77 @@ app.add_middleware(
 )
 
 
+def _use_result_cache(cache_control: Optional[str]) -> bool:
+    """Cache-Control: no-cache / no-store 요청 헤더가 있으면 결과 캐시를 사용하지 않음"""
+    if not cache_control:
+        return True
+    directives = {d.strip().lower() for d in cache_control.split(",")}
+    return not ({"no-cache", "no-store"} & directives)
+
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
-    """서버 상태 확인"""
+    """서버 상태 확인 (liveness) - 모델 로딩 중에도 응답하며, 모델 로드에 실패한 경우에만 unhealthy"""
+    inference_stats = inference_executor.get_stats()
     return HealthResponse(
-        status="healthy" if spellcheck_service.is_model_loaded() else "unhealthy",
+        status="unhealthy" if spellcheck_service.has_model_failure() else "healthy",
         is_model_loaded=spellcheck_service.is_model_loaded(),
         device=spellcheck_service.get_device_info(),
+        queue_depth=inference_stats["queue_depth"],
+        inference_running=inference_stats["running"],
+        ready=spellcheck_service.is_ready(),
+        startup_seconds=startup_seconds,
+        models=spellcheck_service.get_model_status(),
+    )
+
+
+@app.get("/ready", response_model=ReadinessResponse)
+async def readiness_check():
+    """요청 처리 준비 상태 확인 (readiness) - 준비되지 않았으면 503"""
+    readiness = ReadinessResponse(
+        ready=spellcheck_service.is_ready(),
+        models=spellcheck_service.get_model_status(),
+    )
+    if not readiness.ready:
+        return JSONResponse(status_code=503, content=readiness.model_dump())
+    return readiness
+
+
+@app.get("/api/v1/stats", response_model=ServiceStatsResponse)
+async def service_stats():
+    """추론 대기열, 배칭, 캐시, 디코딩 정책, 사전 검사, 노드 실행 시간 통계 조회"""
+    return ServiceStatsResponse(
+        inference=inference_executor.get_stats(),
+        batching=spellcheck_service.get_batching_stats(),
+        result_cache=spellcheck_service.get_cache_stats(),
+        chunk_cache=spellcheck_service.get_chunk_cache_stats(),
+        decoding=spellcheck_service.get_decoding_stats(),
+        prescreen=spellcheck_service.get_prescreen_stats(),
+        nodes=spellcheck_service.get_node_stats(),
     )
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """노드/백엔드 단계별 실행 시간, 토큰 수, 청크 수 히스토그램 (Prometheus 텍스트 형식)"""
+    return PlainTextResponse(metrics_registry.render(), media_type=MetricsRegistry.CONTENT_TYPE)
+
+
 @app.post("/api/v1/pipeline/run", response_model=CorrectionResponse)
-async def pipeline_run(request: CorrectionRequest):
+async def pipeline_run(
+    request: CorrectionRequest, cache_control: Optional[str] = Header(None)
+):
     """기본 맞춤법 교정 API - 프론트엔드 호환"""
     try:
         if not request.text.strip():
             raise HTTPException(status_code=400, detail="텍스트가 비어있습니다.")
 
-        result = spellcheck_service.correct_text(request.text)
+        result = await inference_executor.run(
+            spellcheck_service.correct_text,
+            request.text,
+            use_cache=_use_result_cache(cache_control),
+            include_stages=request.include_stages,
+        )
 
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
@@ -72,6 +167,7 @@ async def pipeline_run(request: CorrectionRequest):
             corrected_text=result["corrected_text"],
             corrections=corrections,
             suggestions=suggestions,
+            stage_texts=result.get("stage_texts"),
         )
 
     except HTTPException:
@@ -83,15 +179,19 @@ async def pipeline_run(request: CorrectionRequest):
 
 
 @app.post("/api/v1/comprehensive/comprehensive", response_model=ComprehensiveResponse)
-async def comprehensive_correction(request: ComprehensiveRequest):
+async def comprehensive_correction(
+    request: ComprehensiveRequest, cache_control: Optional[str] = Header(None)
+):
     """종합 교정 API - 맞춤법 교정 + 문체 변환"""
     try:
         if not request.text.strip():
             raise HTTPException(status_code=400, detail="텍스트가 비어있습니다.")
 
-        result = comprehensive_style_service.comprehensive_correction(
-            request.text, 
-            request.target_style
+        result = await inference_executor.run(
+            comprehensive_style_service.comprehensive_correction,
+            request.text,
+            request.target_style,
+            use_cache=_use_result_cache(cache_control),
         )
 
         if "error" in result:
@@ -141,13 +241,20 @@ async def comprehensive_correction(request: ComprehensiveRequest):
 
 
 @app.post("/api/v1/spellcheck", response_model=CorrectionResponse)
-async def spellcheck(request: CorrectionRequest):
+async def spellcheck(
+    request: CorrectionRequest, cache_control: Optional[str] = Header(None)
+):
     """맞춤법 교정 API"""
     try:
         if not request.text.strip():
             raise HTTPException(status_code=400, detail="텍스트가 비어있습니다.")
 
-        result = spellcheck_service.correct_text(request.text)
+        result = await inference_executor.run(
+            spellcheck_service.correct_text,
+            request.text,
+            use_cache=_use_result_cache(cache_control),
+            include_stages=request.include_stages,
+        )
 
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
@@ -176,8 +283,189 @@ async def spellcheck(request: CorrectionRequest):
             corrected_text=result["corrected_text"],
             corrections=corrections,
             suggestions=suggestions,
+            stage_texts=result.get("stage_texts"),
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@app.post("/api/v1/spellcheck/batch", response_model=BatchCorrectionResponse)
+async def spellcheck_batch(
+    request: BatchCorrectionRequest, cache_control: Optional[str] = Header(None)
+):
+    """일괄 맞춤법 교정 API - 여러 텍스트를 공유 모델 배치로 교정하고 항목별 결과/오류를 반환"""
+    try:
+        if not request.items:
+            raise HTTPException(status_code=400, detail="교정할 항목이 없습니다.")
+        if len(request.items) > settings.BATCH_MAX_ITEMS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"한 번에 최대 {settings.BATCH_MAX_ITEMS}개까지 교정할 수 있습니다.",
+            )
+
+        batch = await inference_executor.run(
+            spellcheck_service.correct_batch,
+            [item.text for item in request.items],
+            use_cache=_use_result_cache(cache_control),
+        )
+
+        if "error" in batch:
+            raise HTTPException(status_code=400, detail=batch["error"])
+
+        results = []
+        for index, (item, result) in enumerate(zip(request.items, batch["results"])):
+            if "error" in result:
+                results.append(
+                    BatchCorrectionResult(
+                        index=index, id=item.id, original_text=item.text, error=result["error"]
+                    )
+                )
+                continue
+            results.append(
+                BatchCorrectionResult(
+                    index=index,
+                    id=item.id,
+                    original_text=item.text,
+                    corrected_text=result["corrected_text"],
+                    corrections=[
+                        Correction(
+                            original=correction["original"],
+                            corrected=correction["corrected"],
+                            type=correction["type"],
+                        )
+                        for correction in result["corrections"]
+                    ],
+                    suggestions=[
+                        Suggestion(
+                            type=suggestion["type"],
+                            original=suggestion["original"],
+                            suggestion=suggestion["suggestion"],
+                            reason=suggestion["reason"],
+                        )
+                        for suggestion in result.get("suggestions", [])
+                    ],
+                )
+            )
+
+        failed = sum(1 for result in results if result.error)
+        return BatchCorrectionResponse(
+            results=results, succeeded=len(results) - failed, failed=failed
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}"
+        )
+
+
+async def _sse_events(events: Iterator[dict]) -> AsyncIterator[str]:
+    """동기 이벤트 생성기를 추론 실행기에서 한 단계씩 실행하여 SSE 형식으로 변환"""
+    finished = object()
+    while True:
+        try:
+            event = await inference_executor.run(next, events, finished)
+        except Exception as e:
+            event = {"event": "error", "data": {"error": f"서버 오류가 발생했습니다: {str(e)}"}}
+        if event is finished:
+            break
+        data = json.dumps(event["data"], ensure_ascii=False)
+        yield f"event: {event['event']}\ndata: {data}\n\n"
+        if event["event"] == "error":
+            break
+
+
+@app.post("/api/v1/spellcheck/stream")
+async def spellcheck_stream(request: CorrectionRequest):
+    """스트리밍 맞춤법 교정 API - 청크별 교정 결과를 Server-Sent Events로 전송"""
+    if not request.text.strip():
+        raise HTTPException(status_code=400, detail="텍스트가 비어있습니다.")
+
+    return StreamingResponse(
+        _sse_events(spellcheck_service.stream_correction(request.text)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _to_incremental_response(result: dict) -> IncrementalResponse:
+    return IncrementalResponse(
+        session_id=result["session_id"],
+        version=result["version"],
+        original_text=result["original_text"],
+        corrected_text=result["corrected_text"],
+        corrections=[
+            Correction(
+                original=correction["original"],
+                corrected=correction["corrected"],
+                type=correction["type"],
+            )
+            for correction in result["corrections"]
+        ],
+        suggestions=[
+            Suggestion(
+                type=suggestion["type"],
+                original=suggestion["original"],
+                suggestion=suggestion["suggestion"],
+                reason=suggestion["reason"],
+            )
+            for suggestion in result.get("suggestions", [])
+        ],
+        region=result["region"],
+    )
+
+
+@app.post("/api/v1/spellcheck/incremental", response_model=IncrementalResponse)
+async def open_incremental_session(request: CorrectionRequest):
+    """증분 교정 세션 시작 - 전체 텍스트를 교정하고 세션 ID를 반환"""
+    try:
+        if not request.text.strip():
+            raise HTTPException(status_code=400, detail="텍스트가 비어있습니다.")
+
+        result = await inference_executor.run(
+            incremental_correction_service.open_session, request.text
+        )
+
+        if "error" in result:
+            raise HTTPException(
+                status_code=result.get("status_code", 400), detail=result["error"]
+            )
+
+        return _to_incremental_response(result)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}"
         )
 
+
+@app.patch("/api/v1/spellcheck/incremental/{session_id}", response_model=IncrementalResponse)
+async def apply_incremental_edit(session_id: str, request: IncrementalEditRequest):
+    """증분 교정 - 편집 델타를 적용하고 영향받은 구간의 교정 결과를 반환"""
+    try:
+        result = await inference_executor.run(
+            incremental_correction_service.apply_edit,
+            session_id,
+            delta=request.delta,
+            patch=request.patch,
+            base_version=request.base_version,
+        )
+
+        if "error" in result:
+            raise HTTPException(
+                status_code=result.get("status_code", 400), detail=result["error"]
+            )
+
+        return _to_incremental_response(result)
+
     except HTTPException:
         raise
     except Exception as e:
@@ -186,6 +474,107 @@ async def spellcheck(request: CorrectionRequest):
         )
 
 
+@app.delete("/api/v1/spellcheck/incremental/{session_id}")
+async def close_incremental_session(session_id: str):
+    """증분 교정 세션 종료"""
+    if not incremental_correction_service.close_session(session_id):
+        raise HTTPException(status_code=404, detail="문서 세션을 찾을 수 없습니다.")
+    return {"session_id": session_id, "closed": True}
+
+
+JOB_EVENT_POLL_SECONDS = 0.5
+
+
+def _to_job_status_response(job: dict) -> JobStatusResponse:
+    total = job["total_chunks"]
+    return JobStatusResponse(
+        **job,
+        progress=round(job["done_chunks"] / total, 4) if total else 1.0,
+    )
+
+
+@app.post("/api/v1/jobs", response_model=JobStatusResponse, status_code=202)
+async def submit_document_job(request: CorrectionRequest):
+    """문서 교정 작업 등록 - 큰 문서를 백그라운드에서 교정하고 작업 ID를 즉시 반환"""
+    if not request.text.strip():
+        raise HTTPException(status_code=400, detail="텍스트가 비어있습니다.")
+
+    job = await asyncio.to_thread(document_job_service.submit, request.text)
+    if job.get("error"):
+        raise HTTPException(status_code=job.get("status_code", 400), detail=job["error"])
+    return _to_job_status_response(job)
+
+
+@app.get("/api/v1/jobs/{job_id}", response_model=JobStatusResponse)
+async def get_document_job(job_id: str):
+    """문서 교정 작업 상태와 진행률 조회"""
+    job = document_job_service.get_status(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return _to_job_status_response(job)
+
+
+@app.get("/api/v1/jobs/{job_id}/result", response_model=JobResultResponse)
+async def get_document_job_result(job_id: str):
+    """완료된 문서 교정 작업 결과 조회 (완료 전에는 409)"""
+    result = await asyncio.to_thread(document_job_service.get_result, job_id)
+    if "error" in result:
+        raise HTTPException(status_code=result.get("status_code", 400), detail=result["error"])
+    return JobResultResponse(**result)
+
+
+async def _job_events(job_id: str) -> AsyncIterator[str]:
+    """작업 진행률과 새로 완료된 청크 결과를 상태가 끝날 때까지 SSE로 전송"""
+    sent_chunks = 0
+    offset = 0
+    last_status = None
+    while True:
+        job = document_job_service.get_status(job_id)
+        if job is None:
+            # 스트리밍 중 DELETE로 취소되면 작업 정보도 함께 삭제됨
+            data = json.dumps({"job_id": job_id, "status": "cancelled"}, ensure_ascii=False)
+            yield f"event: cancelled\ndata: {data}\n\n"
+            break
+
+        if job["done_chunks"] > sent_chunks or job["status"] != last_status:
+            # 진행률은 상태(meta.json)에서 얻고, 청크 결과는 지난번 이후 추가된 부분만 읽음
+            chunks, offset = await asyncio.to_thread(document_job_service.read_chunks, job_id, offset)
+            chunks = [chunk for chunk in chunks if chunk["index"] >= sent_chunks]
+            sent_chunks += len(chunks)
+            last_status = job["status"]
+            payload = _to_job_status_response(job).model_dump()
+            payload["chunks"] = chunks
+            data = json.dumps(payload, ensure_ascii=False)
+            yield f"event: progress\ndata: {data}\n\n"
+
+        if job["status"] in document_job_service.FINISHED:
+            data = json.dumps(_to_job_status_response(job).model_dump(), ensure_ascii=False)
+            yield f"event: {job['status']}\ndata: {data}\n\n"
+            break
+        await asyncio.sleep(JOB_EVENT_POLL_SECONDS)
+
+
+@app.get("/api/v1/jobs/{job_id}/events")
+async def stream_document_job(job_id: str):
+    """문서 교정 작업 진행 상황 스트리밍 (Server-Sent Events)"""
+    if document_job_service.get_status(job_id) is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+
+    return StreamingResponse(
+        _job_events(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.delete("/api/v1/jobs/{job_id}")
+async def cancel_document_job(job_id: str):
+    """문서 교정 작업 취소 및 저장된 결과 삭제"""
+    if not await asyncio.to_thread(document_job_service.cancel, job_id):
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return {"job_id": job_id, "cancelled": True}
+
+
 @app.get("/api/v1/comprehensive/styles", response_model=List[StyleOption])
 async def get_available_styles():
     """사용 가능한 문체 스타일 목록 조회"""
@@ -4,6 +4,7 @@ from typing import List, Optional, Dict
 
 class CorrectionRequest(BaseModel):
     text: str
+    include_stages: bool = False  # 단계별 교정문과 노드 실행 시간을 stage_texts로 반환
 
 
 class Correction(BaseModel):
@@ -27,10 +28,98 @@ class CorrectionResponse(BaseModel):
     stage_texts: Optional[dict] = None
 
 
+class BatchCorrectionItem(BaseModel):
+    id: Optional[str] = None  # 요청 측 식별자 (결과에 그대로 반환)
+    text: str
+
+
+class BatchCorrectionRequest(BaseModel):
+    items: List[BatchCorrectionItem]
+
+
+class BatchCorrectionResult(BaseModel):
+    index: int
+    id: Optional[str] = None
+    original_text: str
+    corrected_text: Optional[str] = None
+    corrections: List[Correction] = []
+    suggestions: List[Suggestion] = []
+    error: Optional[str] = None
+
+
+class BatchCorrectionResponse(BaseModel):
+    results: List[BatchCorrectionResult]
+    succeeded: int
+    failed: int
+
+
+class IncrementalEditRequest(BaseModel):
+    delta: Optional[str] = None  # diff_toDelta 형식 (세션의 현재 텍스트 기준)
+    patch: Optional[str] = None  # patch_toText 형식
+    base_version: Optional[int] = None
+
+
+class IncrementalRegion(BaseModel):
+    start: int
+    end: int
+    chunk_start: int
+    chunk_end: int
+    chunk_count: int
+
+
+class IncrementalResponse(BaseModel):
+    session_id: str
+    version: int
+    original_text: str
+    corrected_text: str
+    corrections: List[Correction]
+    suggestions: Optional[List[Suggestion]] = []
+    region: IncrementalRegion
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    status: str  # queued, running, completed, failed, cancelled
+    length: int
+    total_chunks: int
+    done_chunks: int
+    progress: float
+    created_at: float
+    updated_at: float
+    error: Optional[str] = None
+
+
+class JobResultResponse(BaseModel):
+    job_id: str
+    corrected_text: str
+    corrections: List[Correction]
+    suggestions: Optional[List[Suggestion]] = []
+
+
 class HealthResponse(BaseModel):
     status: str
     is_model_loaded: bool
     device: str
+    queue_depth: int = 0
+    inference_running: int = 0
+    ready: bool = False
+    startup_seconds: Optional[float] = None  # 모듈 import부터 연결 수락 가능 시점까지
+    models: Dict[str, Dict] = {}
+
+
+class ReadinessResponse(BaseModel):
+    ready: bool
+    models: Dict[str, Dict]
+
+
+class ServiceStatsResponse(BaseModel):
+    inference: Dict
+    batching: Dict
+    result_cache: Dict
+    chunk_cache: Dict
+    decoding: Dict
+    prescreen: Dict
+    nodes: Dict
 
 
 # 종합 교정 관련 모델들
@@ -1,4 +1,9 @@
-from typing import List, Dict, TypedDict
+from typing import Annotated, List, Dict, TypedDict
+
+
+def merge_dicts(left: Dict, right: Dict) -> Dict:
+    """병렬 분기에서 온 부분 결과를 하나로 합치는 리듀서"""
+    return {**(left or {}), **(right or {})}
 
 
 class GraphState(TypedDict):
@@ -9,4 +14,13 @@ class GraphState(TypedDict):
     error: str
     text_chunks: List[str]
     processed_chunks: List[str]
-    suggestions: List[Dict[str, str]]
\ No newline at end of file
+    suggestions: List[Dict[str, str]]
+    initial_results: Annotated[Dict[int, str], merge_dicts]  # 청크 번호 -> 기본 교정 결과
+    chunk_results: Annotated[Dict[int, str], merge_dicts]  # 청크 번호 -> 교정 결과
+    timings: Annotated[Dict[str, float], merge_dicts]  # 노드 이름 -> 실행 시간(ms)
+
+
+class ChunkBatchState(TypedDict):
+    """청크 배치 교정 분기에 전달되는 상태"""
+    start: int  # 배치 첫 청크의 번호
+    chunks: List[str]
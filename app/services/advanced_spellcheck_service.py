@@ -1,106 +1,310 @@
-import torch
-from transformers import (
-    AutoTokenizer,
-    AutoModelForSeq2SeqLM,
-    pipeline,
-)
+import copy
+import threading
+import time
 import traceback
 from ..config import settings
 from app.utils import diff_match_patch as dmp_module
+from app.utils.result_cache import ResultCache
+from ..backends import (
+    CorrectionBackend,
+    OnnxSeq2SeqBackend,
+    StubCorrectionBackend,
+    TorchSeq2SeqBackend,
+)
 from langgraph.graph import StateGraph, END
 from ..models.state_models import GraphState
+from ..utils.text_processor import TextProcessor
 from ..workflow.nodes import WorkflowNodes
+from typing import Dict, Iterator, List, Optional, Tuple
 
 
 class AdvancedSpellCheckService:
+    LM_MODEL_NAME = "j5ng/et5-typos-corrector"
+
+    # 모델별 로딩 상태
+    MODEL_NOT_LOADED = "not_loaded"
+    MODEL_LOADING = "loading"
+    MODEL_LOADED = "loaded"
+    MODEL_FAILED = "failed"
+
     def __init__(self):
         self.device = None
-        self.tokenizer_base = None
-        self.model_base = None
-        self.pipe_lm = None
+        self.base_backend = None
+        self.refine_backend = None
         self.dmp = dmp_module.diff_match_patch()
-        self._initialize_models()
+        self.nodes = None
+        self.result_cache = (
+            ResultCache(
+                settings.RESULT_CACHE_MAX_BYTES,
+                ttl_seconds=settings.RESULT_CACHE_TTL_SECONDS,
+            )
+            if settings.RESULT_CACHE_ENABLED
+            else None
+        )
+        # 모델은 import 시점이 아니라 서버 시작 후 백그라운드 또는 첫 요청에서 모델별로 로드
+        self._model_loaders = {
+            settings.MODEL_NAME: self._load_base_model,
+            self.LM_MODEL_NAME: self._load_lm_model,
+        }
+        self._model_locks = {name: threading.Lock() for name in self._model_loaders}
+        self._model_status = {name: self.MODEL_NOT_LOADED for name in self._model_loaders}
+        self._model_load_seconds: Dict[str, float] = {}
         self.workflow = self._build_graph()
 
-    def _initialize_models(self):
-        """두 개의 언어 모델을 초기화하고 로드합니다."""
-        try:
-            self.device = "cuda" if torch.cuda.is_available() else "cpu"
-            print(f"Using device: {self.device}")
-
-            # 1. 기본 교정 모델 (kogrammar-base)
-            print("Loading kogrammar-base model...")
-            self.tokenizer_base = AutoTokenizer.from_pretrained(settings.MODEL_NAME)
-            self.model_base = AutoModelForSeq2SeqLM.from_pretrained(settings.MODEL_NAME)
-            self.model_base.to(self.device)
-            print("kogrammar-base model loaded.")
-
-            # 2. LLM 기반 교정 모델 (j5ng/et5-typos-corrector)
-            print("Loading j5ng/et5-typos-corrector model...")
-            lm_model_name = "j5ng/et5-typos-corrector"
-
-            model = AutoModelForSeq2SeqLM.from_pretrained(
-                lm_model_name,
-                torch_dtype=torch.bfloat16,
-                device_map="auto",
-            )
-            tokenizer = AutoTokenizer.from_pretrained(lm_model_name)
+    def _select_device(self) -> str:
+        if self.device is None:
+            if settings.INFERENCE_BACKEND in ("onnx", "stub"):
+                # ONNX Runtime 백엔드는 CPU 실행 전용, 스텁 백엔드는 모델을 사용하지 않음
+                self.device = "cpu"
+            else:
+                import torch
+
+                self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            print(f"Using device: {self.device} ({settings.INFERENCE_BACKEND} backend)")
+        return self.device
 
-            self.pipe_lm = pipeline(
-                "text2text-generation",
-                model=model,
-                tokenizer=tokenizer,
+    def _create_backend(self, model_name: str, device: str, **torch_options) -> CorrectionBackend:
+        """INFERENCE_BACKEND 설정에 맞는 교정 백엔드 생성 (torch_options는 PyTorch 백엔드에만 적용)"""
+        if settings.INFERENCE_BACKEND == "stub":
+            # 모델 다운로드 없이 파이프라인의 나머지 단계를 실행 (테스트/벤치마크용)
+            return StubCorrectionBackend(
+                latency_ms=settings.STUB_LATENCY_MS,
+                per_chunk_latency_ms=settings.STUB_PER_CHUNK_LATENCY_MS,
             )
-            print("j5ng/et5-typos-corrector model loaded.")
+        if settings.INFERENCE_BACKEND == "onnx":
+            return OnnxSeq2SeqBackend.from_pretrained(model_name, settings.ONNX_MODEL_DIR)
+        if settings.SHARED_WEIGHTS:
+            torch_options["weights_dir"] = settings.SHARED_WEIGHTS_DIR
+        return TorchSeq2SeqBackend.from_pretrained(model_name, device, **torch_options)
+
+    def _load_base_model(self):
+        """기본 교정 모델 (kogrammar-base) 로드"""
+        device = self._select_device()
+        print("Loading kogrammar-base model...")
+        backend = self._create_backend(
+            settings.MODEL_NAME, device, quantize=self._use_int8(device)
+        )
+
+        self.base_backend = backend
+        self.nodes.base_backend = backend
+        print("kogrammar-base model loaded.")
+
+    def _load_lm_model(self):
+        """LLM 기반 교정 모델 (j5ng/et5-typos-corrector) 로드"""
+        device = self._select_device()
+        print("Loading j5ng/et5-typos-corrector model...")
+
+        if self._use_int8(device):
+            # 동적 양자화는 fp32 CPU 모델에만 적용 가능
+            torch_options = {"quantize": True}
+        elif settings.INFERENCE_BACKEND == "torch":
+            import torch
+
+            torch_options = {"torch_dtype": torch.bfloat16, "device_map": "auto"}
+        else:
+            torch_options = {}
+        backend = self._create_backend(self.LM_MODEL_NAME, device, **torch_options)
+
+        self.refine_backend = backend
+        self.nodes.refine_backend = backend
+        print("j5ng/et5-typos-corrector model loaded.")
+
+    def prepare_shared_weights(self):
+        """여러 워커가 동시에 내보내지 않도록 서버 시작 전에 공유 가중치 파일을 한 번만 생성"""
+        if self._select_device() != "cpu":
+            # GPU에 올린 가중치는 mmap으로 공유되지 않으므로 파일을 만들지 않음
+            print("Shared weights are CPU-only, skipping export")
+            return
 
-        except Exception as e:
-            print(f"Error during model initialization: {e}")
-            traceback.print_exc()
-            self.model_base = None
-            self.pipe_lm = None
+        import torch
+
+        from ..backends.torch_backend import export_shared_weights
+
+        lm_dtype = None if self._use_int8("cpu") else torch.bfloat16
+        for model_name, torch_dtype in (
+            (settings.MODEL_NAME, None),
+            (self.LM_MODEL_NAME, lm_dtype),
+        ):
+            export_shared_weights(model_name, settings.SHARED_WEIGHTS_DIR, torch_dtype)
+
+    @staticmethod
+    def _use_int8(device: str) -> bool:
+        if settings.QUANTIZATION != "int8":
+            return False
+        if settings.INFERENCE_BACKEND != "torch":
+            print("int8 dynamic quantization is only applied to the torch backend")
+            return False
+        if device != "cpu":
+            print("int8 dynamic quantization is CPU-only, loading without quantization")
+            return False
+        return True
+
+    def _ensure_model(self, name: str) -> bool:
+        """모델이 아직 로드되지 않았다면 로드 (다른 스레드가 로드 중이면 완료될 때까지 대기)"""
+        if self._model_status[name] == self.MODEL_LOADED:
+            return True
+
+        with self._model_locks[name]:
+            status = self._model_status[name]
+            if status == self.MODEL_LOADED:
+                return True
+            if status == self.MODEL_FAILED:
+                return False
+
+            self._model_status[name] = self.MODEL_LOADING
+            started = time.perf_counter()
+            try:
+                self._model_loaders[name]()
+            except Exception as e:
+                print(f"Error during model initialization ({name}): {e}")
+                traceback.print_exc()
+                self._model_status[name] = self.MODEL_FAILED
+                return False
+
+            self._model_load_seconds[name] = round(time.perf_counter() - started, 2)
+            self._model_status[name] = self.MODEL_LOADED
+            return True
+
+    def ensure_models_loaded(self) -> bool:
+        """교정에 필요한 모델을 로드하고 모두 사용 가능한지 반환"""
+        loaded = [self._ensure_model(name) for name in self._model_loaders]
+        return all(loaded)
 
     def is_model_loaded(self) -> bool:
-        return self.model_base is not None and self.pipe_lm is not None
+        return self.base_backend is not None and self.refine_backend is not None
+
+    def has_model_failure(self) -> bool:
+        return self.MODEL_FAILED in self._model_status.values()
+
+    def is_ready(self) -> bool:
+        """요청을 받을 준비가 되었는지 반환 (사전 로드 모드에서는 모든 모델 로드 완료 시)"""
+        if settings.MODEL_PRELOAD:
+            return self.is_model_loaded()
+        # 지연 로드 모드에서는 첫 요청이 모델을 로드하므로 실패한 모델이 없으면 준비된 상태
+        return not self.has_model_failure()
+
+    def get_model_status(self) -> Dict[str, Dict]:
+        """모델별 로딩 상태와 로딩 시간 반환"""
+        return {
+            name: {
+                "status": status,
+                "load_seconds": self._model_load_seconds.get(name),
+            }
+            for name, status in self._model_status.items()
+        }
 
     def get_device_info(self) -> str:
-        return str(self.device)
+        return str(self.device) if self.device else "unknown"
+
+    def get_cache_stats(self) -> dict:
+        """교정 결과 캐시 통계 반환"""
+        if self.result_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.result_cache.get_stats()}
+
+    def get_chunk_cache_stats(self) -> dict:
+        """청크 단위 교정 캐시 통계 반환"""
+        chunk_cache = self.nodes.chunk_cache
+        if chunk_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **chunk_cache.get_stats()}
 
+    def _result_cache_key(self, text: str) -> str:
+        """입력 텍스트, 모델 이름, 생성 설정으로 결과 캐시 키 생성"""
+        return ResultCache.make_key(
+            text,
+            settings.MODEL_NAME,
+            self.LM_MODEL_NAME,
+            settings.INFERENCE_BACKEND,
+            settings.QUANTIZATION,
+            settings.CHUNK_SIZE,
+            settings.DECODING_POLICY,
+            settings.SKIP_MODEL_MODE,
+            settings.ADAPTIVE_GREEDY_MAX_CHARS,
+            settings.MAX_NEW_TOKENS_RATIO,
+            settings.MAX_NEW_TOKENS_MARGIN,
+            WorkflowNodes.BASE_GENERATION_CONFIG,
+            WorkflowNodes.GREEDY_GENERATION_CONFIG,
+            WorkflowNodes.REFINE_GENERATION_CONFIG,
+        )
+
+    def get_batching_stats(self) -> dict:
+        """마이크로 배칭 스케줄러 통계 반환"""
+        scheduler = self.nodes.batch_scheduler
+        if scheduler is None:
+            return {"enabled": False}
+        return {
+            "enabled": True,
+            **scheduler.get_stats(),
+            "refine": self.nodes.refine_scheduler.get_stats(),
+        }
+
+    def get_prescreen_stats(self) -> dict:
+        """모델 호출을 생략한 깨끗한 청크 통계 반환"""
+        return self.nodes.get_prescreen_stats()
 
+    def get_node_stats(self) -> dict:
+        """워크플로우 노드별 실행 시간 통계 반환"""
+        return self.nodes.get_node_stats()
 
+    def get_decoding_stats(self) -> dict:
+        """디코딩 정책별 지연 시간 통계 반환"""
+        return self.nodes.get_decoding_stats()
 
     def _build_graph(self):
         """LangGraph 워크플로우를 정의하고 컴파일합니다."""
         nodes = WorkflowNodes(
-            self.tokenizer_base,
-            self.model_base,
-            self.pipe_lm,
-            self.device,
+            self.base_backend,
+            self.refine_backend,
             self.dmp
         )
+        self.nodes = nodes
         
         workflow = StateGraph(GraphState)
-        workflow.add_node("smart_text_splitting", nodes.smart_text_splitting)
-        workflow.add_node("initial_correction", nodes.initial_correction)
-        workflow.add_node("refine_correction", nodes.refine_correction)
-        workflow.add_node("generate_suggestions", nodes.generate_suggestions)
-        workflow.add_node("generate_diff", nodes.generate_diff)
+        for name in (
+            "smart_text_splitting",
+            "correct_chunk_batch",
+            "merge_chunks",
+            "generate_suggestions",
+            "generate_diff",
+        ):
+            workflow.add_node(name, nodes.timed(name, getattr(nodes, name)))
 
         workflow.set_entry_point("smart_text_splitting")
-        workflow.add_edge("smart_text_splitting", "initial_correction")
-        workflow.add_edge("initial_correction", "refine_correction")
-        workflow.add_edge("refine_correction", "generate_suggestions")
-        workflow.add_edge("generate_suggestions", "generate_diff")
-        workflow.add_edge("generate_diff", END)
+        # 청크 배치별로 기본 교정 -> LLM 교정 분기를 병렬 실행하여, 앞 배치의 LLM 교정이
+        # 뒤 배치의 기본 교정과 동시에 진행되도록 함
+        workflow.add_conditional_edges(
+            "smart_text_splitting",
+            nodes.route_chunk_batches,
+            ["correct_chunk_batch", "merge_chunks"],
+        )
+        workflow.add_edge("correct_chunk_batch", "merge_chunks")
+        # 제안과 diff는 교정문만 읽으므로 동시에 실행
+        workflow.add_edge("merge_chunks", "generate_suggestions")
+        workflow.add_edge("merge_chunks", "generate_diff")
+        workflow.add_edge(["generate_suggestions", "generate_diff"], END)
 
         return workflow.compile()
 
-    def correct_text(self, text: str) -> dict:
-        """LangGraph를 사용하여 다단계 맞춤법 교정을 실행합니다."""
-        if not self.is_model_loaded():
+    def correct_text(self, text: str, use_cache: bool = True, include_stages: bool = False) -> dict:
+        """LangGraph를 사용하여 다단계 맞춤법 교정을 실행합니다.
+
+        include_stages가 True이면 단계별 교정문과 노드 실행 시간(ms)을 stage_texts로 함께 반환합니다.
+        (캐시된 결과에는 단계별 정보가 없으므로 결과 캐시를 사용하지 않음)
+        """
+        if not self.ensure_models_loaded():
             return {
                 "error": "교정 모델이 로드되지 않았습니다. 서버 로그를 확인해주세요."
             }
 
+        # 같은 텍스트를 최근에 교정했다면 모델과 diff를 모두 건너뜀
+        cache_key = None
+        if self.result_cache is not None and use_cache and not include_stages:
+            cache_key = self._result_cache_key(text)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return {**copy.deepcopy(cached), "original_text": text}
+
         inputs = {
             "original_text": text,
             "corrected_text": "",
@@ -109,19 +313,159 @@ class AdvancedSpellCheckService:
             "text_chunks": [],
             "processed_chunks": [],
             "suggestions": [],
+            "initial_results": {},
+            "chunk_results": {},
+            "timings": {},
         }
         result_state = self.workflow.invoke(inputs)
 
         if result_state.get("error"):
             raise Exception(result_state["error"])
 
-        return {
+        result = {
             "original_text": result_state["original_text"],
             "corrected_text": result_state["corrected_text"],
             "corrections": result_state["corrections"],
             "suggestions": result_state.get("suggestions", []),
         }
 
+        if cache_key is not None:
+            self.result_cache.put(cache_key, copy.deepcopy(result))
+
+        if include_stages:
+            result["stage_texts"] = self._stage_texts(result_state)
+
+        return result
+
+    @staticmethod
+    def _stage_texts(result_state: dict) -> dict:
+        """기본 교정(kogrammar-base)과 LLM 교정 단계의 교정문, 노드별 실행 시간"""
+        initial_results = result_state.get("initial_results", {})
+        initial_chunks = [
+            initial_results.get(i, chunk) for i, chunk in enumerate(result_state["text_chunks"])
+        ]
+        return {
+            "initial_correction": TextProcessor.rejoin_chunks(initial_chunks),
+            "refine_correction": result_state["corrected_text"],
+            "timings": result_state.get("timings", {}),
+        }
+
+    def correct_batch(self, texts: List[str], use_cache: bool = True) -> dict:
+        """여러 텍스트를 한 번에 교정 - 모든 텍스트의 청크를 모아 공유 배치로 모델을 호출
+
+        항목별 결과는 입력 순서대로 results에 담기며, 실패한 항목은 error만 포함하고
+        나머지 항목의 교정에는 영향을 주지 않습니다.
+        """
+        if not self.ensure_models_loaded():
+            return {
+                "error": "교정 모델이 로드되지 않았습니다. 서버 로그를 확인해주세요."
+            }
+
+        results: List[Optional[dict]] = [None] * len(texts)
+        cache_keys: Dict[int, str] = {}
+        pending: List[int] = []
+        for i, text in enumerate(texts):
+            if not text.strip():
+                results[i] = {"error": "텍스트가 비어있습니다."}
+            elif len(text) > settings.MAX_LENGTH:
+                results[i] = {"error": f"텍스트가 최대 길이({settings.MAX_LENGTH}자)를 초과했습니다."}
+            else:
+                if self.result_cache is not None and use_cache:
+                    cache_keys[i] = self._result_cache_key(text)
+                    cached = self.result_cache.get(cache_keys[i])
+                    if cached is not None:
+                        results[i] = {**copy.deepcopy(cached), "original_text": text}
+                        continue
+                pending.append(i)
+
+        # 모든 항목의 청크를 이어 붙여 사전 교정/모델 배치를 함께 처리 (중복 청크는 한 번만 생성)
+        chunk_ranges: Dict[int, Tuple[int, int]] = {}
+        all_chunks: List[str] = []
+        for i in pending:
+            chunks = TextProcessor.smart_split_text(texts[i])
+            chunk_ranges[i] = (len(all_chunks), len(all_chunks) + len(chunks))
+            all_chunks.extend(chunks)
+        corrected_chunks = self.nodes.correct_and_refine_chunks(all_chunks)
+
+        for i in pending:
+            start, end = chunk_ranges[i]
+            try:
+                corrected_text = TextProcessor.rejoin_chunks(corrected_chunks[start:end])
+                result = {
+                    "original_text": texts[i],
+                    "corrected_text": corrected_text,
+                    "corrections": self.nodes.diff_corrections(
+                        texts[i], corrected_text, all_chunks[start:end], corrected_chunks[start:end]
+                    ),
+                    "suggestions": self.nodes.build_suggestions(corrected_text),
+                }
+            except Exception as e:
+                traceback.print_exc()
+                results[i] = {"error": f"교정 중 오류가 발생했습니다: {str(e)}"}
+                continue
+            if i in cache_keys:
+                self.result_cache.put(cache_keys[i], copy.deepcopy(result))
+            results[i] = result
+
+        return {"results": results}
+
+    def stream_correction(self, text: str) -> Iterator[Dict]:
+        """청크별 교정 결과를 완료되는 대로 이벤트로 반환하고 마지막에 요약 이벤트를 반환"""
+        if not self.ensure_models_loaded():
+            yield {
+                "event": "error",
+                "data": {"error": "교정 모델이 로드되지 않았습니다. 서버 로그를 확인해주세요."},
+            }
+            return
+
+        if len(text) > settings.MAX_LENGTH:
+            yield {
+                "event": "error",
+                "data": {"error": f"텍스트가 최대 길이({settings.MAX_LENGTH}자)를 초과했습니다."},
+            }
+            return
+
+        nodes = self.nodes
+        text_chunks = TextProcessor.smart_split_text(text)
+        total = len(text_chunks)
+        processed_chunks = []
+
+        # 첫 청크는 단독으로 처리하여 첫 교정 결과를 최대한 빨리 보내고, 나머지는 배치로 처리
+        batch_size = max(1, settings.GENERATION_BATCH_SIZE)
+        bounds = [0, 1] + list(range(1 + batch_size, total, batch_size)) + [total]
+        for start, end in zip(bounds, bounds[1:]):
+            if start >= end:
+                continue
+            batch = text_chunks[start:end]
+            for offset, (chunk, corrected_chunk) in enumerate(
+                zip(batch, nodes.correct_and_refine_chunks(batch))
+            ):
+                processed_chunks.append(corrected_chunk)
+                yield {
+                    "event": "chunk",
+                    "data": {
+                        "index": start + offset,
+                        "total": total,
+                        "original": chunk,
+                        "corrected": corrected_chunk,
+                        "corrections": nodes.diff_corrections(chunk, corrected_chunk),
+                    },
+                }
+
+        corrected_text = TextProcessor.rejoin_chunks(processed_chunks)
+
+        yield {
+            "event": "summary",
+            "data": {
+                "original_text": text,
+                "corrected_text": corrected_text,
+                "corrections": nodes.diff_corrections(
+                    text, corrected_text, text_chunks, processed_chunks
+                ),
+                "suggestions": nodes.build_suggestions(corrected_text),
+            },
+        }
+
 
 # 싱글톤 인스턴스
 advanced_spellcheck_service = AdvancedSpellCheckService()
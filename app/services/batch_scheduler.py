@@ -0,0 +1,139 @@
+"""
+동적 마이크로 배칭 스케줄러
+여러 요청에서 들어온 청크를 모아 하나의 배치로 모델을 실행하는 서비스
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+
+class MicroBatchScheduler:
+    """요청 간 청크를 모아 최대 배치 크기 또는 최대 대기 시간에 도달하면 실행
+
+    한가할 때 들어온 요청은 기다리지 않고 바로 실행하고, 배치 실행 중이거나 큐가 차 있을 때
+    들어온 요청이 있을 때만 최대 대기 시간까지 다음 배치를 채웁니다.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[..., List[str]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+
+        self._pending: Deque[Tuple[str, Hashable, Future]] = deque()
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._busy = False
+        self._contended = False
+
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._items = 0
+        self._max_observed_batch = 0
+
+    def submit(self, texts: List[str], params: Optional[Dict] = None) -> List[Future]:
+        """청크 목록을 큐에 넣고 각 청크의 결과를 받을 Future 목록을 순서대로 반환"""
+        if not texts:
+            return []
+
+        params = params or {}
+        key = tuple(sorted(params.items()))
+        futures = [Future() for _ in texts]
+
+        with self._condition:
+            self._ensure_worker()
+            if self._busy or self._pending:
+                self._contended = True
+            for text, future in zip(texts, futures):
+                self._pending.append((text, key, future))
+            self._condition.notify()
+
+        return futures
+
+    def get_stats(self) -> Dict:
+        """배치 실행 통계 반환"""
+        with self._stats_lock:
+            batches = self._batches
+            items = self._items
+            max_batch = self._max_observed_batch
+        with self._condition:
+            queued = len(self._pending)
+
+        return {
+            "batches": batches,
+            "items": items,
+            "avg_batch_size": round(items / batches, 2) if batches else 0.0,
+            "max_batch_size_observed": max_batch,
+            "queued_items": queued,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000.0,
+        }
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._run, name="micro-batch-scheduler", daemon=True
+            )
+            self._worker.start()
+
+    def _collect_batch(self) -> List[Tuple[str, Hashable, Future]]:
+        """첫 항목과 같은 생성 파라미터를 가진 항목들을 배치 크기/대기 시간 한도까지 수집"""
+        with self._condition:
+            self._busy = False
+            while not self._pending:
+                self._condition.wait()
+
+            if self._contended:
+                # 동시에 들어온 요청이 있을 때만 배치를 채우기 위해 기다림
+                deadline = time.monotonic() + self.max_wait
+                while len(self._pending) < self.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+            self._contended = False
+            self._busy = True
+
+            key = self._pending[0][1]
+            batch = []
+            skipped = deque()
+            while self._pending and len(batch) < self.max_batch_size:
+                item = self._pending.popleft()
+                if item[1] == key:
+                    batch.append(item)
+                else:
+                    skipped.append(item)
+            # 다른 파라미터의 항목은 순서를 유지한 채 큐 앞쪽으로 되돌림
+            self._pending.extendleft(reversed(skipped))
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect_batch()
+            texts = [text for text, _, _ in batch]
+            params = dict(batch[0][1])
+
+            try:
+                outputs = self.batch_fn(texts, **params)
+                if len(outputs) != len(texts):
+                    raise RuntimeError(
+                        f"배치 결과 개수가 일치하지 않습니다: {len(outputs)} != {len(texts)}"
+                    )
+            except Exception as e:
+                for _, _, future in batch:
+                    future.set_exception(e)
+            else:
+                for (_, _, future), output in zip(batch, outputs):
+                    future.set_result(output)
+
+            with self._stats_lock:
+                self._batches += 1
+                self._items += len(batch)
+                self._max_observed_batch = max(self._max_observed_batch, len(batch))
@@ -15,11 +15,13 @@ class ComprehensiveStyleService:
         self.spellcheck_service = advanced_spellcheck_service
         self.style_transformer = StyleTransformer()
     
-    def comprehensive_correction(self, text: str, target_style: Optional[str] = None) -> Dict:
+    def comprehensive_correction(
+        self, text: str, target_style: Optional[str] = None, use_cache: bool = True
+    ) -> Dict:
         """종합 교정 실행: 맞춤법 교정 + 문체 변환"""
         try:
             # 1단계: 기본 맞춤법 교정
-            spellcheck_result = self.spellcheck_service.correct_text(text)
+            spellcheck_result = self.spellcheck_service.correct_text(text, use_cache=use_cache)
             
             if 'error' in spellcheck_result:
                 return {
@@ -0,0 +1,262 @@
+"""
+증분 교정 서비스
+문서 세션을 유지하고 편집 델타가 영향을 준 청크 구간만 다시 분할/교정하는 서비스
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from ..config import settings
+from ..utils.text_processor import TextProcessor
+from .advanced_spellcheck_service import advanced_spellcheck_service
+
+
+class DocumentSession:
+    """증분 교정 문서 세션 상태"""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.version = 0
+        self.text = ""
+        # (탐색 시작, 청크 시작, 청크 끝, 다음 탐색 시작)
+        self.spans: List[Tuple[int, int, int, int]] = []
+        self.corrected_chunks: List[str] = []
+        self.chunk_corrections: List[List[Dict[str, str]]] = []
+        self.corrected_text = ""
+        self.lock = threading.Lock()
+        self.touched_at = time.monotonic()
+
+
+class IncrementalCorrectionService:
+    """편집 델타를 받아 영향받은 청크 구간만 다시 교정하는 서비스"""
+
+    def __init__(self):
+        self.spellcheck_service = advanced_spellcheck_service
+        self._sessions: "OrderedDict[str, DocumentSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def open_session(self, text: str) -> Dict:
+        """새 문서 세션을 만들고 전체 텍스트를 교정"""
+        error = self._validate(text)
+        if error:
+            return error
+
+        session = DocumentSession(uuid.uuid4().hex)
+        with session.lock:
+            spans = self._split_spans(text)
+            corrected = self._correct_spans(text, spans)
+            self._commit(session, text, spans, corrected)
+            result = self._build_result(session, 0, len(spans))
+
+        with self._lock:
+            self._evict_expired()
+            self._sessions[session.session_id] = session
+            while len(self._sessions) > settings.SESSION_MAX_COUNT:
+                self._sessions.popitem(last=False)
+
+        return result
+
+    def apply_edit(
+        self,
+        session_id: str,
+        delta: Optional[str] = None,
+        patch: Optional[str] = None,
+        base_version: Optional[int] = None,
+    ) -> Dict:
+        """diff_toDelta 또는 patch_toText 형식의 편집을 적용하고 영향받은 구간만 재교정"""
+        session = self._get_session(session_id)
+        if session is None:
+            return {"error": "문서 세션을 찾을 수 없습니다.", "status_code": 404}
+
+        with session.lock:
+            if base_version is not None and base_version != session.version:
+                return {
+                    "error": f"문서 버전이 일치하지 않습니다. (현재 버전: {session.version})",
+                    "status_code": 409,
+                }
+
+            new_text, error = self._apply_to_text(session.text, delta, patch)
+            if error:
+                return error
+
+            error = self._validate(new_text)
+            if error:
+                return error
+
+            old_text = session.text
+            dmp = self.spellcheck_service.dmp
+            prefix = dmp.diff_commonPrefix(old_text, new_text)
+            suffix = dmp.diff_commonSuffix(old_text[prefix:], new_text[prefix:])
+
+            window = self._resplit_window(session, new_text, prefix, suffix)
+            if window is None:
+                # 짧은 문서 등은 전체를 다시 교정 (청크 캐시가 변경되지 않은 청크를 재사용)
+                spans = self._split_spans(new_text)
+                corrected = self._correct_spans(new_text, spans)
+                self._commit(session, new_text, spans, corrected)
+                return self._build_result(session, 0, len(spans))
+
+            first, new_spans, resume, shift = window
+            tail_spans = [
+                tuple(pos + shift for pos in span) for span in session.spans[resume:]
+            ]
+            spans = session.spans[:first] + new_spans + tail_spans
+            window_corrected = self._correct_spans(new_text, new_spans)
+            corrected = (
+                list(zip(session.corrected_chunks[:first], session.chunk_corrections[:first]))
+                + window_corrected
+                + list(
+                    zip(session.corrected_chunks[resume:], session.chunk_corrections[resume:])
+                )
+            )
+            self._commit(session, new_text, spans, corrected)
+            return self._build_result(session, first, first + len(new_spans))
+
+    def close_session(self, session_id: str) -> bool:
+        """문서 세션 종료"""
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def _validate(self, text: str) -> Optional[Dict]:
+        if not self.spellcheck_service.ensure_models_loaded():
+            return {"error": "교정 모델이 로드되지 않았습니다. 서버 로그를 확인해주세요."}
+        if not text.strip():
+            return {"error": "텍스트가 비어있습니다."}
+        if len(text) > settings.MAX_LENGTH:
+            return {"error": f"텍스트가 최대 길이({settings.MAX_LENGTH}자)를 초과했습니다."}
+        return None
+
+    def _get_session(self, session_id: str) -> Optional[DocumentSession]:
+        with self._lock:
+            self._evict_expired()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.touched_at = time.monotonic()
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def _evict_expired(self):
+        deadline = time.monotonic() - settings.SESSION_TTL_SECONDS
+        expired = [sid for sid, s in self._sessions.items() if s.touched_at < deadline]
+        for session_id in expired:
+            del self._sessions[session_id]
+
+    def _apply_to_text(
+        self, text: str, delta: Optional[str], patch: Optional[str]
+    ) -> Tuple[str, Optional[Dict]]:
+        dmp = self.spellcheck_service.dmp
+        if delta is not None:
+            try:
+                diffs = dmp.diff_fromDelta(text, delta)
+            except ValueError as e:
+                return text, {"error": f"델타를 적용할 수 없습니다: {e}", "status_code": 409}
+            return dmp.diff_text2(diffs), None
+
+        if patch is not None:
+            try:
+                patches = dmp.patch_fromText(patch)
+            except ValueError as e:
+                return text, {"error": f"패치 형식이 올바르지 않습니다: {e}"}
+            new_text, applied = dmp.patch_apply(patches, text)
+            if not all(applied):
+                return text, {"error": "패치를 적용할 수 없습니다.", "status_code": 409}
+            return new_text, None
+
+        return text, {"error": "delta 또는 patch 중 하나가 필요합니다."}
+
+    @staticmethod
+    def _split_spans(text: str) -> List[Tuple[int, int, int, int]]:
+        if len(text) <= settings.CHUNK_SIZE:
+            # smart_split_text와 동일하게 짧은 텍스트는 하나의 청크로 처리
+            return [(0, 0, len(text), len(text))]
+        return list(TextProcessor.iter_split_spans(text))
+
+    def _resplit_window(
+        self, session: DocumentSession, new_text: str, prefix: int, suffix: int
+    ) -> Optional[Tuple[int, List[Tuple[int, int, int, int]], int, int]]:
+        """편집 영향 구간만 다시 분할하여 (첫 청크 번호, 새 청크들, 재사용 시작 번호, 위치 이동량) 반환"""
+        old_text = session.text
+        if len(old_text) <= settings.CHUNK_SIZE or len(new_text) <= settings.CHUNK_SIZE:
+            return None
+
+        # 분할 결정이 편집 위치를 읽지 않은 앞쪽 청크는 그대로 유지
+        first = 0
+        for pos, _, _, next_pos in session.spans:
+            if pos + settings.CHUNK_SIZE < prefix and next_pos < prefix:
+                first += 1
+            else:
+                break
+        if first == len(session.spans):
+            return None
+
+        shift = len(new_text) - len(old_text)
+        edit_end = len(new_text) - suffix
+        old_positions = {span[0]: i for i, span in enumerate(session.spans)}
+
+        new_spans = []
+        resume = len(session.spans)
+        for span in TextProcessor.iter_split_spans(new_text, session.spans[first][0]):
+            new_spans.append(span)
+            next_pos = span[3]
+            # 편집 이후 위치에서 기존 분할 지점과 다시 맞물리면 나머지는 재사용
+            if next_pos >= edit_end and next_pos - shift in old_positions:
+                resume = old_positions[next_pos - shift]
+                break
+
+        return first, new_spans, resume, shift
+
+    def _correct_spans(
+        self, text: str, spans: List[Tuple[int, int, int, int]]
+    ) -> List[Tuple[str, List[Dict[str, str]]]]:
+        nodes = self.spellcheck_service.nodes
+        chunks = [text[start:end] for _, start, end, _ in spans]
+        corrected_chunks = nodes.correct_and_refine_chunks(chunks)
+        return [
+            (corrected, nodes.diff_corrections(chunk, corrected))
+            for chunk, corrected in zip(chunks, corrected_chunks)
+        ]
+
+    def _commit(
+        self,
+        session: DocumentSession,
+        text: str,
+        spans: List[Tuple[int, int, int, int]],
+        corrected: List[Tuple[str, List[Dict[str, str]]]],
+    ):
+        session.text = text
+        session.spans = spans
+        session.corrected_chunks = [chunk for chunk, _ in corrected]
+        session.chunk_corrections = [corrections for _, corrections in corrected]
+        session.corrected_text = TextProcessor.rejoin_chunks(session.corrected_chunks)
+        session.version += 1
+
+    def _build_result(self, session: DocumentSession, first: int, last: int) -> Dict:
+        nodes = self.spellcheck_service.nodes
+        corrected_text = session.corrected_text
+        corrections = [c for chunk in session.chunk_corrections[first:last] for c in chunk]
+
+        region_start = session.spans[first][1] if first < len(session.spans) else len(session.text)
+        region_end = session.spans[last - 1][2] if last > first else region_start
+
+        return {
+            "session_id": session.session_id,
+            "version": session.version,
+            "original_text": session.text,
+            "corrected_text": corrected_text,
+            "corrections": corrections,
+            "suggestions": nodes.build_suggestions(corrected_text),
+            "region": {
+                "start": region_start,
+                "end": region_end,
+                "chunk_start": first,
+                "chunk_end": last,
+                "chunk_count": len(session.spans),
+            },
+        }
+
+
+# 싱글톤 인스턴스
+incremental_correction_service = IncrementalCorrectionService()
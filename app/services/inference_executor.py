@@ -0,0 +1,127 @@
+"""
+추론 실행기
+동기 모델 추론을 스레드 풀에서 실행하여 asyncio 이벤트 루프가 막히지 않도록 하는 서비스
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+from ..config import settings
+from ..utils.metrics import metrics_registry
+
+QUEUE_SECONDS = metrics_registry.histogram(
+    "fixme_inference_queue_seconds",
+    "추론 슬롯을 얻을 때까지 대기한 시간",
+)
+
+
+class InferenceExecutor:
+    """추론 슬롯 세마포어로 동시 실행 수를 제한하는 스레드 풀 실행기"""
+
+    def __init__(self, slots: int = 4):
+        self.slots = max(1, slots)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.slots, thread_name_prefix="inference"
+        )
+        # asyncio.Semaphore는 대기 순서(FIFO)대로 슬롯을 넘겨주므로 공정하게 대기함
+        self._semaphore = asyncio.Semaphore(self.slots)
+        # 이벤트 루프 밖의 스레드(문서 작업 등)가 슬롯을 얻을 때 사용하는 서버 이벤트 루프
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._running = 0
+        self._started = 0
+        self._completed = 0
+        self._failed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """추론 슬롯을 얻을 때까지 대기한 뒤 스레드 풀에서 함수를 실행"""
+        enqueued_at = time.perf_counter()
+        with self._lock:
+            self._waiting += 1
+
+        try:
+            await self._semaphore.acquire()
+        except BaseException:
+            with self._lock:
+                self._waiting -= 1
+            raise
+
+        waited = time.perf_counter() - enqueued_at
+        with self._lock:
+            self._waiting -= 1
+            self._running += 1
+            self._started += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+        QUEUE_SECONDS.observe(waited)
+
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._executor.submit(partial(fn, *args, **kwargs))
+        except BaseException:
+            self._finish(loop, None)
+            raise
+        # 기다리던 코루틴이 취소되어도(클라이언트 연결 종료 등) 스레드의 추론이 끝날 때까지
+        # 슬롯을 잡고 있도록 슬롯은 스레드 작업의 완료 콜백에서 반환
+        future.add_done_callback(partial(self._finish, loop))
+        return await asyncio.wrap_future(future)
+
+    def _finish(self, loop: asyncio.AbstractEventLoop, future: Optional[Future]):
+        """스레드 작업 완료 콜백: 통계를 갱신하고 이벤트 루프에서 슬롯을 반환"""
+        with self._lock:
+            self._running -= 1
+            self._completed += 1
+            if future is None or future.cancelled() or future.exception() is not None:
+                self._failed += 1
+        try:
+            loop.call_soon_threadsafe(self._semaphore.release)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힘 (서버 종료)
+            pass
+
+    def attach_loop(self, loop: asyncio.AbstractEventLoop):
+        """서버 이벤트 루프를 등록하여 run_from_thread가 같은 슬롯 대기열을 사용하도록 함"""
+        self._loop = loop
+
+    def run_from_thread(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """이벤트 루프 밖의 스레드에서 대화형 요청과 같은 추론 슬롯을 얻어 함수를 실행 (완료까지 대기)
+
+        등록된 이벤트 루프가 없으면(서버 밖에서 실행) 슬롯 없이 바로 실행합니다.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return fn(*args, **kwargs)
+        return asyncio.run_coroutine_threadsafe(self.run(fn, *args, **kwargs), loop).result()
+
+    def get_stats(self) -> Dict:
+        """대기열 깊이와 실행 통계 반환"""
+        with self._lock:
+            started = self._started
+            return {
+                "slots": self.slots,
+                "queue_depth": self._waiting,
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "avg_wait_ms": round(self._total_wait / started * 1000.0, 2)
+                if started
+                else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000.0, 2),
+                "total_wait_ms": round(self._total_wait * 1000.0, 2),
+            }
+
+    def shutdown(self):
+        self._loop = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# 싱글톤 인스턴스
+inference_executor = InferenceExecutor(settings.INFERENCE_SLOTS)
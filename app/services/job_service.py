@@ -0,0 +1,370 @@
+"""
+문서 작업 서비스
+MAX_LENGTH를 넘는 큰 문서를 작업(job)으로 받아 작업자 풀에서 청크 배치 단위로 교정하고,
+진행 상황과 부분 결과를 디스크(JOB_DIR)에 저장하여 서버가 재시작되어도 이어서 처리하는 서비스
+여러 워커 프로세스(WORKERS)가 JOB_DIR을 공유하면 작업별 잠금 파일로 한 워커만 작업을 처리하고,
+다른 워커는 디스크의 meta.json으로 상태를 조회합니다.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: 작업별 잠금 없이 단일 워커로 실행
+    fcntl = None
+
+from ..config import settings
+from ..utils.text_processor import TextProcessor
+from .advanced_spellcheck_service import advanced_spellcheck_service
+from .inference_executor import inference_executor
+
+
+class DocumentJobService:
+    """큰 문서 교정 작업을 디스크에 저장하며 백그라운드에서 처리하는 서비스
+
+    작업 디렉토리 구성 (JOB_DIR/<job_id>/):
+        text.txt      원문
+        meta.json     상태와 진행률
+        chunks.jsonl  완료된 청크 배치 결과 (배치마다 한 줄씩 추가)
+        result.json   최종 교정 결과
+        lock          처리 중인 워커가 잡고 있는 잠금 파일
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    FINISHED = (COMPLETED, FAILED, CANCELLED)
+
+    def __init__(self):
+        self.spellcheck_service = advanced_spellcheck_service
+        self.inference_executor = inference_executor
+        self.job_dir = settings.JOB_DIR
+        self.batch_chunks = max(1, settings.JOB_BATCH_CHUNKS)
+        self._jobs: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.JOB_WORKERS), thread_name_prefix="job"
+        )
+
+    def submit(self, text: str) -> Dict:
+        """문서를 저장하고 작업을 대기열에 추가"""
+        if len(text) > settings.JOB_MAX_LENGTH:
+            return {
+                "error": f"텍스트가 작업 최대 길이({settings.JOB_MAX_LENGTH}자)를 초과했습니다.",
+                "status_code": 413,
+            }
+
+        self._evict_expired()
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        meta = {
+            "job_id": job_id,
+            "status": self.QUEUED,
+            "length": len(text),
+            "total_chunks": len(TextProcessor.smart_split_text(text)),
+            "done_chunks": 0,
+            "created_at": now,
+            "updated_at": now,
+            "error": None,
+        }
+        os.makedirs(self._path(job_id), exist_ok=True)
+        with open(self._path(job_id, "text.txt"), "w", encoding="utf-8") as f:
+            f.write(text)
+        self._write_meta(meta)
+
+        with self._lock:
+            self._jobs[job_id] = meta
+        self._executor.submit(self._run, job_id)
+        return dict(meta)
+
+    def get_status(self, job_id: str) -> Optional[Dict]:
+        """작업 상태와 진행률 반환 (없으면 None)"""
+        with self._lock:
+            meta = self._jobs.get(job_id)
+            if meta is not None and os.path.isdir(self._path(job_id)):
+                return dict(meta)
+            # 다른 워커 프로세스에서 취소되어 디렉토리가 삭제된 작업
+            self._jobs.pop(job_id, None)
+        # 다른 워커 프로세스가 등록/처리 중인 작업
+        return self._read_meta(job_id)
+
+    def get_result(self, job_id: str) -> Dict:
+        """완료된 작업의 교정 결과 반환"""
+        meta = self.get_status(job_id)
+        if meta is None:
+            return {"error": "작업을 찾을 수 없습니다.", "status_code": 404}
+        if meta["status"] == self.FAILED:
+            return {"error": f"작업이 실패했습니다: {meta['error']}", "status_code": 409}
+        if meta["status"] != self.COMPLETED:
+            return {
+                "error": f"작업이 아직 완료되지 않았습니다. (상태: {meta['status']})",
+                "status_code": 409,
+            }
+
+        with open(self._path(job_id, "result.json"), encoding="utf-8") as f:
+            return {"job_id": job_id, **json.load(f)}
+
+    def read_chunks(self, job_id: str, offset: int = 0) -> Tuple[List[Dict], int]:
+        """chunks.jsonl의 offset(바이트) 이후에 추가된 청크별 교정 결과와 다음 offset 반환 (진행 상황 스트리밍용)
+
+        아직 다 쓰이지 않은 마지막 줄은 다음 호출에서 읽습니다.
+        """
+        if self.get_status(job_id) is None:
+            return [], offset
+        try:
+            with open(self._path(job_id, "chunks.jsonl"), "rb") as f:
+                if offset > os.fstat(f.fileno()).st_size:
+                    # 재시작 시 저장된 결과가 처음부터 다시 쓰인 경우
+                    offset = 0
+                f.seek(offset)
+                data = f.read()
+        except OSError:
+            return [], offset
+
+        end = data.rfind(b"\n") + 1
+        chunks = []
+        for line in data[:end].splitlines():
+            record = json.loads(line)
+            for index, (corrected_chunk, chunk_corrections) in enumerate(
+                zip(record["corrected"], record["corrections"]), start=record["start"]
+            ):
+                chunks.append({
+                    "index": index,
+                    "corrected": corrected_chunk,
+                    "corrections": chunk_corrections,
+                })
+        return chunks, offset + end
+
+    def cancel(self, job_id: str) -> bool:
+        """작업을 취소하고 저장된 파일을 삭제 (처리 중인 배치가 끝나면 작업자가 멈춤)"""
+        with self._lock:
+            meta = self._jobs.pop(job_id, None)
+            if meta is not None:
+                meta["status"] = self.CANCELLED
+        if meta is None and self._read_meta(job_id) is None:
+            return False
+        shutil.rmtree(self._path(job_id), ignore_errors=True)
+        return True
+
+    def resume(self) -> int:
+        """서버 시작 시 JOB_DIR의 작업을 불러오고, 끝나지 않은 작업은 다시 대기열에 추가"""
+        if not os.path.isdir(self.job_dir):
+            return 0
+
+        resumed = 0
+        for job_id in sorted(os.listdir(self.job_dir)):
+            meta = self._read_meta(job_id)
+            if meta is None:
+                continue
+
+            with self._lock:
+                if job_id in self._jobs:
+                    continue
+                self._jobs[job_id] = meta
+            if meta["status"] not in self.FINISHED:
+                print(f"Resuming job {job_id} ({meta['done_chunks']}/{meta['total_chunks']} chunks)")
+                meta["status"] = self.QUEUED
+                self._executor.submit(self._run, job_id)
+                resumed += 1
+
+        self._evict_expired()
+        return resumed
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job_id: str):
+        """작업자 스레드: 완료되지 않은 청크 배치부터 교정하고 배치마다 결과를 디스크에 추가"""
+        lock_file = self._acquire(job_id)
+        if lock_file is None:
+            # 다른 워커 프로세스가 처리 중이면 상태는 디스크에서 조회하도록 목록에서 제외
+            with self._lock:
+                self._jobs.pop(job_id, None)
+            return
+        try:
+            if not self.spellcheck_service.ensure_models_loaded():
+                raise RuntimeError("교정 모델이 로드되지 않았습니다.")
+
+            with open(self._path(job_id, "text.txt"), encoding="utf-8") as f:
+                text = f.read()
+            chunks = TextProcessor.smart_split_text(text)
+            batches = self._load_batches(job_id)
+            if batches and batches[-1][0] + len(batches[-1][1]) > len(chunks):
+                # 분할 설정(CHUNK_SIZE)이 바뀌어 저장된 결과와 청크가 맞지 않으면 처음부터
+                batches = []
+                self._rewrite_batches(job_id, batches)
+            done = sum(len(corrected) for _, corrected, _ in batches)
+            self._update(job_id, status=self.RUNNING, total_chunks=len(chunks), done_chunks=done)
+
+            nodes = self.spellcheck_service.nodes
+            for start in range(done, len(chunks), self.batch_chunks):
+                if self._is_cancelled(job_id):
+                    return
+                batch = chunks[start:start + self.batch_chunks]
+                # 대화형 요청과 같은 추론 슬롯을 배치마다 얻어 큰 작업이 모델을 독점하지 않도록 함
+                corrected = self.inference_executor.run_from_thread(nodes.correct_and_refine_chunks, batch)
+                corrections = [
+                    nodes.diff_corrections(chunk, corrected_chunk)
+                    for chunk, corrected_chunk in zip(batch, corrected)
+                ]
+                self._append_batch(job_id, start, corrected, corrections)
+                batches.append((start, corrected, corrections))
+                self._update(job_id, done_chunks=start + len(batch))
+
+            corrected_chunks = [chunk for _, corrected, _ in batches for chunk in corrected]
+            corrected_text = TextProcessor.rejoin_chunks(corrected_chunks)
+            result = {
+                "corrected_text": corrected_text,
+                "corrections": [
+                    correction for _, _, corrections in batches
+                    for chunk_corrections in corrections
+                    for correction in chunk_corrections
+                ],
+                "suggestions": nodes.build_suggestions(corrected_text),
+            }
+            self._write_json(self._path(job_id, "result.json"), result)
+            self._update(job_id, status=self.COMPLETED)
+        except CancelledError:
+            # 서버 종료로 추론 슬롯 대기가 취소됨: 상태를 그대로 두어 다음 시작 때 이어서 처리
+            return
+        except Exception as e:
+            if self._is_cancelled(job_id) or not os.path.isdir(self._path(job_id)):
+                # 취소로 작업 디렉토리가 삭제된 경우 (다른 워커에서 취소되었을 수 있음)
+                return
+            traceback.print_exc()
+            self._update(job_id, status=self.FAILED, error=str(e))
+        finally:
+            lock_file.close()
+
+    def _acquire(self, job_id: str):
+        """작업 잠금 파일을 잡아 이 프로세스만 작업을 처리하도록 함 (이미 잡혀 있거나 작업이 없으면 None)"""
+        if self._is_cancelled(job_id):
+            return None
+        try:
+            lock_file = open(self._path(job_id, "lock"), "a")
+        except OSError:
+            return None
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                return None
+        return lock_file
+
+    def _read_meta(self, job_id: str) -> Optional[Dict]:
+        if not job_id.isalnum():
+            # 작업 ID(uuid hex)가 아닌 경로는 JOB_DIR 밖을 가리킬 수 있으므로 무시
+            return None
+        try:
+            with open(self._path(job_id, "meta.json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _load_batches(self, job_id: str) -> List[Tuple[int, List[str], List[List[Dict]]]]:
+        """chunks.jsonl에서 앞에서부터 이어지는 완료 배치를 읽음 (중간에 끊긴 마지막 줄은 버림)"""
+        path = self._path(job_id, "chunks.jsonl")
+        if not os.path.exists(path):
+            return []
+
+        batches = []
+        expected_start = 0
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if record["start"] != expected_start:
+                    break
+                batches.append((record["start"], record["corrected"], record["corrections"]))
+                expected_start += len(record["corrected"])
+        return batches
+
+    def _append_batch(self, job_id: str, start: int, corrected: List[str], corrections: List[List[Dict]]):
+        line = json.dumps(
+            {"start": start, "corrected": corrected, "corrections": corrections}, ensure_ascii=False
+        )
+        path = self._path(job_id, "chunks.jsonl")
+        if start == 0 or not self._ends_with_newline(path):
+            # 이전 실행이 줄 중간에 멈췄다면 읽을 수 있는 배치만 남기고 다시 씀
+            self._rewrite_batches(job_id, self._load_batches(job_id))
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _rewrite_batches(self, job_id: str, batches):
+        lines = "".join(
+            json.dumps({"start": start, "corrected": corrected, "corrections": corrections}, ensure_ascii=False) + "\n"
+            for start, corrected, corrections in batches
+        )
+        tmp_path = self._path(job_id, "chunks.jsonl.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(lines)
+        os.replace(tmp_path, self._path(job_id, "chunks.jsonl"))
+
+    @staticmethod
+    def _ends_with_newline(path: str) -> bool:
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return True
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _update(self, job_id: str, **changes):
+        with self._lock:
+            meta = self._jobs.get(job_id)
+            if meta is None or meta["status"] == self.CANCELLED:
+                return
+            meta.update(changes, updated_at=time.time())
+            snapshot = dict(meta)
+        self._write_meta(snapshot)
+
+    def _is_cancelled(self, job_id: str) -> bool:
+        with self._lock:
+            meta = self._jobs.get(job_id)
+            return meta is None or meta["status"] == self.CANCELLED
+
+    def _write_meta(self, meta: Dict):
+        self._write_json(self._path(meta["job_id"], "meta.json"), meta)
+
+    @staticmethod
+    def _write_json(path: str, data: Dict):
+        """임시 파일에 쓴 뒤 교체하여 중간에 멈춰도 깨진 파일이 남지 않도록 함"""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _evict_expired(self):
+        """JOB_TTL_SECONDS가 지난 완료/실패 작업 삭제"""
+        expires_before = time.time() - settings.JOB_TTL_SECONDS
+        with self._lock:
+            expired = [
+                job_id
+                for job_id, meta in self._jobs.items()
+                if meta["status"] in self.FINISHED and meta["updated_at"] < expires_before
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+        for job_id in expired:
+            shutil.rmtree(self._path(job_id), ignore_errors=True)
+
+    def _path(self, job_id: str, *names: str) -> str:
+        return os.path.join(self.job_dir, job_id, *names)
+
+
+# 싱글톤 인스턴스
+document_job_service = DocumentJobService()
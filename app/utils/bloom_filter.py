@@ -0,0 +1,60 @@
+import hashlib
+import math
+import threading
+from typing import Dict
+
+
+class BloomFilter:
+    """고정 크기 비트 배열 기반 Bloom 필터 (거짓 양성만 허용, 스레드 안전)
+
+    추가된 항목 수가 capacity를 넘으면 거짓 양성률이 올라가지 않도록 비우고 다시 채웁니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = max(1, capacity)
+        self.error_rate = min(max(error_rate, 1e-9), 0.5)
+        self.num_bits = max(8, math.ceil(-self.capacity * math.log(self.error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._lock = threading.Lock()
+        self._count = 0
+        self._resets = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        # 두 해시의 선형 결합으로 k개 위치 생성 (Kirsch-Mitzenmacher)
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str):
+        positions = self._positions(item)
+        with self._lock:
+            if self._count >= self.capacity:
+                self._bits = bytearray(len(self._bits))
+                self._count = 0
+                self._resets += 1
+            for pos in positions:
+                self._bits[pos >> 3] |= 1 << (pos & 7)
+            self._count += 1
+
+    def __contains__(self, item: str) -> bool:
+        positions = self._positions(item)
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in positions)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get_stats(self) -> Dict:
+        """항목 수와 크기 통계 반환"""
+        with self._lock:
+            return {
+                "items": self._count,
+                "capacity": self.capacity,
+                "error_rate": self.error_rate,
+                "bytes": len(self._bits),
+                "num_hashes": self.num_hashes,
+                "resets": self._resets,
+            }
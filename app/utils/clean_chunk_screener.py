@@ -0,0 +1,123 @@
+import os
+import re
+import threading
+import unicodedata
+from typing import Dict, List
+
+from .bloom_filter import BloomFilter
+
+
+class CleanChunkScreener:
+    """모델을 거치지 않아도 되는 깨끗한 청크를 가려내는 사전 검사기
+
+    - bloom: 청크의 모든 문장이 이전에 모델이 고치지 않은 문장(Bloom 필터)이면 건너뜀
+    - heuristic: bloom 조건에 더해, 사전 규칙이 하나도 적용되지 않았고
+      의심 패턴 점수가 0인 청크도 건너뜀
+    """
+
+    MODES = ("off", "bloom", "heuristic")
+
+    SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n+")
+    WHITESPACE = re.compile(r"\s+")
+
+    # 오류가 있을 가능성이 높은 문자 패턴 (하나라도 있으면 모델로 교정)
+    SUSPICIOUS_PATTERNS = [
+        re.compile(r"[ㄱ-ㅎㅏ-ㅣ]"),  # 완성되지 않은 자모
+        re.compile(r"[가-힣]{10,}"),  # 띄어쓰기 없이 긴 한글 (띄어쓰기 오류)
+        re.compile(r"([가-힣ㄱ-ㅎ.!?~])\1{2,}"),  # 같은 글자나 문장부호 3회 이상 반복
+        re.compile(r"[가-힣][a-zA-Z]|[a-zA-Z][가-힣]"),  # 한글과 영문이 붙어 있음
+        re.compile(r"\s[.,!?]|[,]\S"),  # 문장부호 앞 공백, 쉼표 뒤 공백 누락
+        re.compile(r" {2,}"),  # 연속 공백
+    ]
+
+    def __init__(
+        self,
+        mode: str = "bloom",
+        capacity: int = 100000,
+        error_rate: float = 0.001,
+        seed_file: str = "",
+    ):
+        self.mode = mode if mode in self.MODES else "off"
+        self.known_clean = BloomFilter(capacity, error_rate)
+
+        self._lock = threading.Lock()
+        self._screened = 0
+        self._skipped_bloom = 0
+        self._skipped_heuristic = 0
+        self._learned = 0
+
+        if seed_file and os.path.exists(seed_file):
+            # 한 줄에 한 문장씩 알려진 정상 문장을 미리 등록
+            with open(seed_file, encoding="utf-8") as f:
+                for line in f:
+                    for sentence in self.split_sentences(line):
+                        self.known_clean.add(sentence)
+            print(f"Loaded {len(self.known_clean)} known-clean sentences from {seed_file}")
+
+    @classmethod
+    def split_sentences(cls, text: str) -> List[str]:
+        """문장 단위로 나누고 NFC 정규화 및 공백 정리"""
+        normalized = unicodedata.normalize("NFC", text)
+        sentences = (cls.WHITESPACE.sub(" ", s).strip() for s in cls.SENTENCE_BOUNDARY.split(normalized))
+        return [s for s in sentences if s]
+
+    @classmethod
+    def suspicion_score(cls, chunk: str, text_after_dict: str) -> int:
+        """사전 규칙 적용 여부와 의심 패턴 수를 합친 점수 (0이면 오류 신호 없음)"""
+        score = 1 if chunk != text_after_dict else 0
+        return score + sum(1 for pattern in cls.SUSPICIOUS_PATTERNS if pattern.search(text_after_dict))
+
+    def should_skip(self, chunk: str, text_after_dict: str) -> bool:
+        """청크를 모델 없이 사전 교정 결과 그대로 사용해도 되는지 판단"""
+        if self.mode == "off":
+            return False
+
+        sentences = self.split_sentences(text_after_dict)
+        skipped_bloom = bool(sentences) and all(s in self.known_clean for s in sentences)
+        skipped_heuristic = (
+            not skipped_bloom
+            and self.mode == "heuristic"
+            and self.suspicion_score(chunk, text_after_dict) == 0
+        )
+
+        with self._lock:
+            self._screened += 1
+            self._skipped_bloom += skipped_bloom
+            self._skipped_heuristic += skipped_heuristic
+        return skipped_bloom or skipped_heuristic
+
+    def learn(self, model_input: str, model_output: str):
+        """모델이 바꾸지 않은 문장을 정상 문장으로 등록 (검증을 통과한 출력만 전달해야 함)"""
+        if self.mode == "off":
+            return
+
+        input_sentences = self.split_sentences(model_input)
+        output_sentences = self.split_sentences(model_output)
+        if len(input_sentences) != len(output_sentences):
+            return
+
+        learned = 0
+        for before, after in zip(input_sentences, output_sentences):
+            if before == after and before not in self.known_clean:
+                self.known_clean.add(before)
+                learned += 1
+        if learned:
+            with self._lock:
+                self._learned += learned
+
+    def get_stats(self) -> Dict:
+        """사전 검사 건너뛰기 비율 통계 반환"""
+        with self._lock:
+            screened = self._screened
+            skipped = self._skipped_bloom + self._skipped_heuristic
+            stats = {
+                "mode": self.mode,
+                "screened_chunks": screened,
+                "skipped_chunks": skipped,
+                "skipped_bloom": self._skipped_bloom,
+                "skipped_heuristic": self._skipped_heuristic,
+                "skip_rate": round(skipped / screened, 4) if screened else 0.0,
+                "learned_sentences": self._learned,
+            }
+        stats["bloom_filter"] = self.known_clean.get_stats()
+        return stats
@@ -1,5 +1,10 @@
+import bisect
+import heapq
 import re
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Pattern, Tuple, Union
+
+# 트라이 노드에서 사전 항목 번호를 저장하는 키 (한 글자 키와 겹치지 않도록 빈 문자열 사용)
+_TRIE_VALUE = ""
 
 
 class CorrectionRules:
@@ -118,17 +123,129 @@ class CorrectionRules:
         (r'([0-9]+|한|두|세|네|다섯|여섯|일곱|여덟|아홉|열)주일전', r'\1 주일 전'),
     ]
     
+    # import 시점에 한 번 컴파일되는 매처
+    _CORRECTION_ENTRIES: List[Tuple[str, str]] = []
+    _CORRECTION_SCAN: Optional[Pattern] = None
+    _PREFIX_ENTRIES: Dict[str, List[int]] = {}
+    _ENTRIES_BY_CHAR: Dict[str, List[int]] = {}
+    _SPACING_RULES: List[Tuple[Pattern, str]] = []
+
+    @classmethod
+    def compile_rules(cls):
+        """교정 사전과 띄어쓰기 패턴을 미리 컴파일
+
+        결과는 사전 항목을 순서대로 str.replace하고 띄어쓰기 패턴을 순서대로 re.sub하는 것과 같습니다.
+        앞 항목의 교정 결과가 뒤 항목과 다시 맞으면 이어서 교정됩니다 (예: '가이가' → '가이' → '가').
+        사전은 트라이로 만든 정규식으로 한 번 스캔하여 텍스트에 들어 있는 항목만 찾고,
+        교정으로 새로 생길 수 있는 뒤 항목만 추가로 검사하므로 비용이 사전 크기에 비례하지 않습니다.
+        """
+        trie: Dict = {}
+        entries: List[Tuple[str, str]] = []
+        for wrong_form, correct_form in cls.COMPREHENSIVE_CORRECTIONS.items():
+            if not wrong_form:
+                continue
+            if not isinstance(correct_form, str):
+                correct_form = correct_form[0]
+            node = trie
+            for char in wrong_form:
+                node = node.setdefault(char, {})
+            node[_TRIE_VALUE] = len(entries)
+            entries.append((wrong_form, correct_form))
+        cls._CORRECTION_ENTRIES = entries
+
+        # 각 항목에 대해 그 항목의 접두사인 항목들 (스캔은 위치마다 가장 긴 항목만 찾으므로)
+        prefix_entries: Dict[str, List[int]] = {}
+        for wrong_form, _ in entries:
+            node, found = trie, []
+            for char in wrong_form:
+                node = node[char]
+                if _TRIE_VALUE in node:
+                    found.append(node[_TRIE_VALUE])
+            prefix_entries[wrong_form] = found
+        cls._PREFIX_ENTRIES = prefix_entries
+
+        entries_by_char: Dict[str, List[int]] = {}
+        for index, (wrong_form, _) in enumerate(entries):
+            for char in set(wrong_form):
+                entries_by_char.setdefault(char, []).append(index)
+        cls._ENTRIES_BY_CHAR = entries_by_char
+
+        if trie:
+            # 항목 첫 글자가 아닌 위치는 트라이를 시도하지 않고 바로 건너뜀
+            first_chars = "".join(re.escape(char) for char in sorted(trie))
+            cls._CORRECTION_SCAN = re.compile(
+                "(?=[" + first_chars + "])(?=(" + cls._trie_to_pattern(trie) + "))"
+            )
+        else:
+            cls._CORRECTION_SCAN = None
+
+        cls._SPACING_RULES = [
+            (re.compile(pattern), replacement) for pattern, replacement in cls.SPACING_PATTERNS
+        ]
+
+    @classmethod
+    def _trie_to_pattern(cls, node: Dict) -> str:
+        """트라이 노드를 정규식으로 변환 (더 긴 항목을 먼저 시도하므로 최장 일치가 됨)"""
+        branches = [
+            re.escape(char) + cls._trie_to_pattern(child)
+            for char, child in sorted(node.items())
+            if char != _TRIE_VALUE
+        ]
+        if not branches:
+            return ""
+
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if _TRIE_VALUE in node:
+            # 여기서 끝나는 항목이 있으면 뒤따르는 부분은 선택적으로 매치
+            return "(?:" + body + ")?"
+        return body
+
+    @classmethod
+    def _apply_dictionary(cls, text: str) -> str:
+        """사전 항목을 순서대로 적용 (텍스트에 있거나 앞 교정으로 생길 수 있는 항목만 검사)"""
+        if cls._CORRECTION_SCAN is None:
+            return text
+
+        pending: List[int] = []
+        for match in cls._CORRECTION_SCAN.finditer(text):
+            pending.extend(cls._PREFIX_ENTRIES[match.group(1)])
+        queued = set(pending)
+        pending = sorted(queued)
+
+        corrected = text
+        while pending:
+            index = heapq.heappop(pending)
+            wrong_form, correct_form = cls._CORRECTION_ENTRIES[index]
+            if wrong_form == correct_form or wrong_form not in corrected:
+                continue
+            corrected = corrected.replace(wrong_form, correct_form)
+
+            # 교정 결과와 글자를 공유하는 뒤 항목은 새로 나타났을 수 있음
+            # (교정 결과가 빈 문자열이면 앞뒤 글자가 이어지므로 모든 뒤 항목)
+            if correct_form:
+                created = set()
+                for char in set(correct_form):
+                    later = cls._ENTRIES_BY_CHAR.get(char, [])
+                    created.update(later[bisect.bisect_right(later, index):])
+            else:
+                created = range(index + 1, len(cls._CORRECTION_ENTRIES))
+            for later_index in created:
+                if later_index not in queued:
+                    queued.add(later_index)
+                    heapq.heappush(pending, later_index)
+        return corrected
+
     @classmethod
     def apply_comprehensive_corrections(cls, text: str) -> str:
         """포괄적인 사전 기반 교정"""
-        corrected = text
-        
         # 1. 먼저 사전 기반 교정 적용 (맞춤법 우선)
-        for wrong_form, correct_form in cls.COMPREHENSIVE_CORRECTIONS.items():
-            corrected = corrected.replace(wrong_form, correct_form)
+        corrected = cls._apply_dictionary(text)
         
         # 2. 그 다음 패턴 기반 띄어쓰기 적용
-        for pattern, replacement in cls.SPACING_PATTERNS:
-            corrected = re.sub(pattern, replacement, corrected)
+        for regex, replacement in cls._SPACING_RULES:
+            corrected = regex.sub(replacement, corrected)
         
-        return corrected
\ No newline at end of file
+        return corrected
+
+
+CorrectionRules.compile_rules()
@@ -0,0 +1,261 @@
+import re
+import time
+from typing import List, Optional, Sequence, Tuple
+
+Diff = Tuple[int, str]
+Region = Tuple[int, str, str]
+
+# TextProcessor.rejoin_chunks가 청크를 이어 붙인 뒤 적용하는 공백 정리
+_SPACES = re.compile(r"\s+")
+_SPACE_BEFORE_PUNCTUATION = re.compile(r"\s+([.!?,:;])")
+
+# 어절 단위로 나누고 뒤따르는 공백은 어절에 붙임 (공백만으로는 기준점이 되지 않도록)
+_TOKEN_PATTERN = re.compile(r"\s+|\S+\s*")
+
+
+class FastDiff:
+    """원문과 교정문처럼 대부분 같은 두 텍스트를 위한 diff (diff_main + diff_cleanupSemantic과 같은 결과)
+
+    diff_main은 비슷한 두 텍스트에서는 빠르지만, 많이 다른 텍스트에서는 Diff_Timeout(1초)까지
+    글자 단위 탐색을 계속합니다. 먼저 편집 수를 제한한 어절 단위 Myers diff(O(N·D))로
+    두 텍스트가 대부분 같은지 확인합니다.
+
+    1. 청크 목록이 주어지면 두 텍스트를 청크 위치로 맞춰 구간별로 어절 단위 비교를 합니다.
+       편집 수는 전체 구간을 합쳐 max_edit_tokens로 제한합니다.
+    2. 제한 안에 끝나면 두 텍스트가 대부분 같으므로 기존 경로와 똑같이 전체 텍스트를
+       diff_main으로 비교합니다 (결과가 기존 교정 목록과 같음).
+    3. 제한을 넘으면 어절 비교 결과를 이어 붙여 min_anchor_chars 이상 같은 구간만 기준점으로 삼고
+       (청크 경계는 기준점이 아님), 기준점 사이 구간을 diff_main으로 글자 단위 비교합니다.
+       글자 단위 비교 시간은 diff 호출 전체에서 max_refine_seconds로 제한합니다.
+    """
+
+    def __init__(
+        self,
+        dmp,
+        max_edit_tokens: int = 256,
+        min_anchor_chars: int = 128,
+        max_refine_seconds: float = 0.1,
+    ):
+        self.dmp = dmp
+        self.max_edit_tokens = max_edit_tokens
+        self.min_anchor_chars = min_anchor_chars
+        self.max_refine_seconds = max_refine_seconds
+
+    def diff(
+        self,
+        original: str,
+        corrected: str,
+        original_chunks: Optional[Sequence[str]] = None,
+        corrected_chunks: Optional[Sequence[str]] = None,
+    ) -> List[Diff]:
+        regions: List[Region] = []
+        budget = self.max_edit_tokens
+        exhausted = False
+        for original_part, corrected_part in self._segments(
+            original, corrected, original_chunks, corrected_chunks
+        ):
+            segment_regions, edits = self._diff_tokens(
+                original_part, corrected_part, -1 if exhausted else budget
+            )
+            regions.extend(segment_regions)
+            if edits is None:
+                exhausted = True
+            else:
+                budget -= edits
+
+        if not exhausted:
+            # 대부분 같은 두 텍스트: diff_main이 빠르게 끝나므로 기존 경로와 같은 방법으로 비교
+            diffs = self.dmp.diff_main(original, corrected)
+        else:
+            # 많이 다른 두 텍스트: 기준점 사이 구간만 제한된 시간 안에서 글자 단위로 비교
+            deadline = time.time() + self.max_refine_seconds
+            diffs = []
+            for op, original_text, corrected_text in self._anchor_spans(regions):
+                if op == self.dmp.DIFF_EQUAL:
+                    diffs.append((op, original_text))
+                else:
+                    diffs.extend(self.dmp.diff_main(original_text, corrected_text, False, deadline))
+            self.dmp.diff_cleanupMerge(diffs)
+
+        self.dmp.diff_cleanupSemantic(diffs)
+        return diffs
+
+    @classmethod
+    def _segments(cls, original, corrected, original_chunks, corrected_chunks) -> List[Tuple[str, str]]:
+        """청크 위치로 두 텍스트를 (청크 사이 공백, 청크, ...) 구간 쌍으로 나눔 (맞출 수 없으면 전체 한 쌍)"""
+        if not original_chunks or not corrected_chunks or len(original_chunks) != len(corrected_chunks):
+            return [(original, corrected)]
+
+        original_spans = cls._chunk_spans(original, original_chunks)
+        corrected_spans = cls._chunk_spans(corrected, corrected_chunks)
+        if original_spans is None or corrected_spans is None:
+            return [(original, corrected)]
+
+        segments = []
+        original_pos = corrected_pos = 0
+        for (original_start, original_end), (corrected_start, corrected_end) in zip(
+            original_spans, corrected_spans
+        ):
+            segments.append((original[original_pos:original_start], corrected[corrected_pos:corrected_start]))
+            segments.append((original[original_start:original_end], corrected[corrected_start:corrected_end]))
+            original_pos, corrected_pos = original_end, corrected_end
+        segments.append((original[original_pos:], corrected[corrected_pos:]))
+        return segments
+
+    @staticmethod
+    def _chunk_spans(text: str, chunks: Sequence[str]) -> Optional[List[Tuple[int, int]]]:
+        """각 청크(앞뒤 공백 제외)가 text에서 차례대로 나타나는 위치"""
+        spans = []
+        pos = 0
+        for chunk in chunks:
+            piece = chunk.strip()
+            if not piece:
+                return None
+            start = text.find(piece, pos)
+            if start < 0:
+                # 재조합된 교정문은 공백이 정리되어 있으므로 같은 방식으로 정리한 청크를 찾음
+                piece = _SPACE_BEFORE_PUNCTUATION.sub(r"\1", _SPACES.sub(" ", piece))
+                start = text.find(piece, pos)
+            if start < 0:
+                return None
+            pos = start + len(piece)
+            spans.append((start, pos))
+        return spans
+
+    def _anchor_spans(self, regions: List[Region]) -> List[Region]:
+        """min_anchor_chars 이상 같은 구간은 그대로 두고, 그 사이의 구간들을 하나의 바뀐 구간으로 합침"""
+        spans: List[Region] = []
+        pending_original: List[str] = []
+        pending_corrected: List[str] = []
+
+        def flush():
+            if pending_original or pending_corrected:
+                spans.append(
+                    (self.dmp.DIFF_DELETE, "".join(pending_original), "".join(pending_corrected))
+                )
+                pending_original.clear()
+                pending_corrected.clear()
+
+        equal: List[str] = []
+        for op, original_text, corrected_text in regions + [(self.dmp.DIFF_DELETE, "", "")]:
+            if op == self.dmp.DIFF_EQUAL:
+                # 청크 경계에서 나뉜 같은 구간은 이어서 하나로 봄
+                equal.append(original_text)
+                continue
+            text = "".join(equal)
+            equal = []
+            if len(text) >= self.min_anchor_chars:
+                flush()
+                spans.append((self.dmp.DIFF_EQUAL, text, text))
+            else:
+                pending_original.append(text)
+                pending_corrected.append(text)
+            pending_original.append(original_text)
+            pending_corrected.append(corrected_text)
+        flush()
+        return spans
+
+    def _diff_tokens(
+        self, original: str, corrected: str, max_edits: int
+    ) -> Tuple[List[Region], Optional[int]]:
+        """어절 단위 비교 결과를 구간 목록과 편집 수로 반환
+
+        구간은 (DIFF_EQUAL, 텍스트, 텍스트) 또는 (DIFF_DELETE, 삭제, 삽입)입니다.
+        편집 수가 max_edits를 넘으면 공통 접두/접미를 뺀 나머지를 하나의 바뀐 구간으로 하고
+        편집 수 대신 None을 반환합니다.
+        """
+        if original == corrected:
+            return ([(self.dmp.DIFF_EQUAL, original, original)] if original else []), 0
+
+        prefix_length = self.dmp.diff_commonPrefix(original, corrected)
+        prefix = original[:prefix_length]
+        original, corrected = original[prefix_length:], corrected[prefix_length:]
+        suffix_length = self.dmp.diff_commonSuffix(original, corrected)
+        suffix = original[len(original) - suffix_length:]
+        original = original[:len(original) - suffix_length]
+        corrected = corrected[:len(corrected) - suffix_length]
+
+        regions: List[Region] = [(self.dmp.DIFF_EQUAL, prefix, prefix)] if prefix else []
+        script = _myers(_TOKEN_PATTERN.findall(original), _TOKEN_PATTERN.findall(corrected), max_edits)
+        edits = None
+        if script is None:
+            regions.append((self.dmp.DIFF_DELETE, original, corrected))
+        else:
+            edits = 0
+            equal, deleted, inserted = [], [], []
+            for op, token in script:
+                if op == self.dmp.DIFF_EQUAL:
+                    if deleted or inserted:
+                        regions.append((self.dmp.DIFF_DELETE, "".join(deleted), "".join(inserted)))
+                        deleted, inserted = [], []
+                    equal.append(token)
+                    continue
+                edits += 1
+                if equal:
+                    text = "".join(equal)
+                    regions.append((self.dmp.DIFF_EQUAL, text, text))
+                    equal = []
+                (deleted if op == self.dmp.DIFF_DELETE else inserted).append(token)
+            if deleted or inserted:
+                regions.append((self.dmp.DIFF_DELETE, "".join(deleted), "".join(inserted)))
+            if equal:
+                text = "".join(equal)
+                regions.append((self.dmp.DIFF_EQUAL, text, text))
+        if suffix:
+            regions.append((self.dmp.DIFF_EQUAL, suffix, suffix))
+        return regions, edits
+
+
+def _myers(a: List[str], b: List[str], max_edits: int) -> Optional[List[Tuple[int, str]]]:
+    """두 토큰 목록의 최단 편집 스크립트 (Myers, O((N+M)·D))
+
+    (0, 토큰) 유지, (-1, 토큰) 삭제, (1, 토큰) 삽입 목록을 반환하며
+    편집 수 D가 max_edits를 넘으면 None을 반환합니다.
+    """
+    n, m = len(a), len(b)
+    max_d = min(max_edits, n + m)
+    offset = max_d + 1
+    v = [0] * (2 * offset + 1)
+    trace = []
+
+    for d in range(max_d + 1):
+        trace.append(v[:])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                return _backtrack(a, b, trace, offset)
+    return None
+
+
+def _backtrack(a: List[str], b: List[str], trace: List[List[int]], offset: int) -> List[Tuple[int, str]]:
+    x, y = len(a), len(b)
+    script = []
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[offset + prev_k]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            x -= 1
+            y -= 1
+            script.append((0, a[x]))
+        if d > 0:
+            if x == prev_x:
+                script.append((1, b[prev_y]))
+            else:
+                script.append((-1, a[prev_x]))
+        x, y = prev_x, prev_y
+    script.reverse()
+    return script
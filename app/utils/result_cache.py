@@ -0,0 +1,108 @@
+import hashlib
+import json
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class ResultCache:
+    """바이트 크기 제한과 TTL을 지원하는 스레드 안전 LRU 캐시"""
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl_seconds: float = 0,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        self.max_bytes = max(0, max_bytes)
+        self.ttl_seconds = ttl_seconds
+        self.sizeof = sizeof or self._default_sizeof
+
+        # key -> (value, size, expires_at)
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def make_key(text: str, *namespace: Any) -> str:
+        """정규화된 입력과 모델/생성 설정으로 콘텐츠 주소 키 생성"""
+        normalized = unicodedata.normalize("NFC", text)
+        digest = hashlib.sha256()
+        digest.update(json.dumps(namespace, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(normalized.encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _default_sizeof(value: Any) -> int:
+        if isinstance(value, str):
+            return len(value.encode("utf-8"))
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 값을 반환 (없거나 만료되었으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, size, expires_at = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._entries[key]
+                self._bytes -= size
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: str, value: Any):
+        """값을 저장하고 크기 한도를 넘으면 가장 오래 사용되지 않은 항목부터 제거"""
+        size = self.sizeof(value) + len(key)
+        if size > self.max_bytes:
+            # 단일 항목이 캐시 전체 크기보다 크면 저장하지 않음
+            return
+
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else 0
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict:
+        """적중/실패 및 용량 통계 반환"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
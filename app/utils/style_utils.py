@@ -1,6 +1,6 @@
 import re
 from enum import Enum
-from typing import Dict
+from typing import Dict, List, Optional, Pattern, Set, Tuple
 
 class StyleTone(Enum):
     """문체 톤 정의"""
@@ -182,49 +182,180 @@ class StyleTransformer:
         '쉬움': '간단함',
     }
 
+    # 정중한 톤과 업무용 톤에만 적용하는 표현 순화
+    REFINED_TONES = (StyleTone.POLITE, StyleTone.BUSINESS, StyleTone.FORMAL)
+    
+    # 문장 정리용 정규식
+    _MULTI_SPACE = re.compile(r'\s+')
+    PUNCTUATION = '.!?,:;'
+    _SPACE_BEFORE_PUNCT = re.compile(r'\s+([' + re.escape(PUNCTUATION) + r'])')
+    
+    # import 시점에 한 번 컴파일되는 톤별 규칙
+    _SEQUENTIAL_RULES: Dict[StyleTone, List[Tuple[Pattern, str]]] = {}
+    _TONE_REGEX: Dict[StyleTone, Pattern] = {}
+    _TONE_TABLES: Dict[StyleTone, Dict[str, str]] = {}
+    _ALL_TONES_REGEX: Optional[Pattern] = None
+    _ALL_TONES_TABLE: Dict[str, Tuple[str, ...]] = {}
+    _CLEAN_REPLACEMENTS: Set[str] = set()
+
+    @classmethod
+    def compile_rules(cls):
+        """톤별 규칙을 하나의 정규식과 단어 치환표로 컴파일
+        
+        모든 규칙은 단어 단위(불필요한 단어 제거는 단어 앞부분)로만 적용되므로,
+        한 단어의 변환 결과는 주변 문맥과 무관합니다. 따라서 각 규칙 단어에 규칙들을
+        순서대로 적용한 최종 결과를 미리 계산해 두고, 텍스트는 한 번만 스캔합니다.
+        모든 톤을 함께 변환할 때는 전체 규칙 단어를 한 번에 찾아 톤별 결과를 사용합니다.
+        """
+        removable = [
+            original for original, replacement in cls.CONJUNCTION_IMPROVEMENTS.items()
+            if not replacement
+        ]
+        
+        for tone in StyleTone:
+            rules = []
+            words = []
+            stages = [cls.STYLE_RULES.get(tone, {}), cls.CONJUNCTION_IMPROVEMENTS]
+            if tone in cls.REFINED_TONES:
+                stages.append(cls.REFINEMENT_RULES)
+            for stage in stages:
+                for original, replacement in stage.items():
+                    if replacement:
+                        # 단어 경계를 고려한 정확한 치환
+                        pattern = re.compile(r'\b' + re.escape(original) + r'\b')
+                        words.append(original)
+                    else:
+                        # 불필요한 단어 제거
+                        pattern = re.compile(r'\b' + re.escape(original) + r'\s*')
+                    rules.append((pattern, replacement))
+            cls._SEQUENTIAL_RULES[tone] = rules
+            
+            table = {word: cls._apply_rules_sequentially(word, tone) for word in words}
+            cls._TONE_TABLES[tone] = table
+            
+            regex = cls._compile_word_regex(table, removable)
+            if regex is not None:
+                cls._TONE_REGEX[tone] = regex
+        
+        # 모든 톤의 규칙 단어를 한 번에 찾고, 단어별로 톤 순서대로의 결과를 저장
+        all_words = set()
+        for table in cls._TONE_TABLES.values():
+            all_words.update(table)
+        cls._ALL_TONES_TABLE = {
+            word: tuple(
+                cls._TONE_TABLES[tone][word]
+                if word in cls._TONE_TABLES[tone]
+                else cls._apply_rules_sequentially(word, tone)
+                for tone in StyleTone
+            )
+            for word in all_words
+        }
+        cls._ALL_TONES_REGEX = cls._compile_word_regex(all_words, removable)
+        
+        # 앞뒤 공백이나 문장부호가 없어 치환 후 다시 정리하지 않아도 되는 결과
+        cls._CLEAN_REPLACEMENTS = {
+            replacement
+            for replacements in cls._ALL_TONES_TABLE.values()
+            for replacement in replacements
+            if replacement
+            and cls._cleanup(replacement) == replacement
+            and replacement[0] not in cls.PUNCTUATION
+        }
+
+    @staticmethod
+    def _compile_word_regex(words, removable: List[str]) -> Optional[Pattern]:
+        """규칙 단어(긴 단어 우선)와 제거 대상으로 시작하는 단어를 찾는 정규식 (뒤따르는 공백 포함)"""
+        alternatives = []
+        if words:
+            alternatives.append(
+                '(?:' + '|'.join(re.escape(word) for word in sorted(words, key=lambda word: (-len(word), word))) + r')\b'
+            )
+        if removable:
+            alternatives.append(
+                '(?:' + '|'.join(re.escape(word) for word in removable) + r')\w*'
+            )
+        if not alternatives:
+            return None
+        return re.compile(r'\b(' + '|'.join(alternatives) + r')(\s*)')
+
+    @classmethod
+    def _apply_rules_sequentially(cls, text: str, target_tone: StyleTone) -> str:
+        """규칙을 목록 순서대로 하나씩 적용 (치환표 생성 및 제거 대상 단어 처리용)"""
+        for pattern, replacement in cls._SEQUENTIAL_RULES[target_tone]:
+            text = pattern.sub(replacement, text)
+        return text
+
+    @classmethod
+    def _cleanup(cls, text: str) -> str:
+        """문장 정리 (중복 공백 제거, 문장부호 정리)"""
+        text = cls._MULTI_SPACE.sub(' ', text)  # 중복 공백 제거
+        text = cls._SPACE_BEFORE_PUNCT.sub(r'\1', text)  # 구두점 앞 공백 제거
+        return text.strip()
+
     @classmethod
     def transform_style(cls, text: str, target_tone: StyleTone) -> str:
         """지정된 톤으로 문체를 변환"""
-        transformed_text = text
+        table = cls._TONE_TABLES[target_tone]
         
-        # 1. 기본 문체 변환
-        if target_tone in cls.STYLE_RULES:
-            style_rules = cls.STYLE_RULES[target_tone]
-            for original, replacement in style_rules.items():
-                # 단어 경계를 고려한 정확한 치환
-                pattern = r'\b' + re.escape(original) + r'\b'
-                transformed_text = re.sub(pattern, replacement, transformed_text)
+        def replace(match: "re.Match") -> str:
+            word, spacing = match.group(1), match.group(2)
+            replacement = table.get(word)
+            if replacement is None:
+                # 제거 대상으로 시작하는 단어 (예: '막상')
+                replacement = cls._apply_rules_sequentially(word, target_tone)
+            # 단어 전체가 제거되면 뒤따르는 공백도 함께 제거
+            return replacement + spacing if replacement else ''
         
-        # 2. 연결어 개선 (모든 톤에 공통 적용)
-        for original, replacement in cls.CONJUNCTION_IMPROVEMENTS.items():
-            if replacement:  # 빈 문자열이 아닌 경우만
-                pattern = r'\b' + re.escape(original) + r'\b'
-                transformed_text = re.sub(pattern, replacement, transformed_text)
-            else:
-                # 불필요한 단어 제거
-                pattern = r'\b' + re.escape(original) + r'\s*'
-                transformed_text = re.sub(pattern, '', transformed_text)
-        
-        # 3. 표현 순화 (정중한 톤과 업무용 톤에만 적용)
-        if target_tone in [StyleTone.POLITE, StyleTone.BUSINESS, StyleTone.FORMAL]:
-            for original, replacement in cls.REFINEMENT_RULES.items():
-                pattern = r'\b' + re.escape(original) + r'\b'
-                transformed_text = re.sub(pattern, replacement, transformed_text)
+        transformed_text = text
+        if target_tone in cls._TONE_REGEX:
+            transformed_text = cls._TONE_REGEX[target_tone].sub(replace, text)
+        return cls._cleanup(transformed_text)
+
+    @classmethod
+    def transform_all_styles(cls, text: str) -> Dict[StyleTone, str]:
+        """한 번의 스캔으로 찾은 규칙 단어를 공유하여 모든 톤의 변환 결과를 생성"""
+        tones = list(StyleTone)
+        segments: List[List[str]] = [[] for _ in tones]
+        # 입력을 먼저 정리하면 이미 정리된 결과로 치환된 톤은 다시 정리할 필요가 없음
+        text = cls._cleanup(text)
+        needs_cleanup = [False] * len(tones)
         
-        # 4. 문장 정리 (중복 공백 제거, 문장부호 정리)
-        transformed_text = re.sub(r'\s+', ' ', transformed_text)  # 중복 공백 제거
-        transformed_text = re.sub(r'\s+([.!?,:;])', r'\1', transformed_text)  # 구두점 앞 공백 제거
-        transformed_text = transformed_text.strip()
+        position = 0
+        if cls._ALL_TONES_REGEX is not None:
+            for match in cls._ALL_TONES_REGEX.finditer(text):
+                word, spacing = match.group(1), match.group(2)
+                replacements = cls._ALL_TONES_TABLE.get(word)
+                if replacements is None:
+                    # 제거 대상으로 시작하는 단어 (예: '막상')
+                    replacements = [cls._apply_rules_sequentially(word, tone) for tone in tones]
+                
+                unchanged = text[position:match.start()]
+                for i, replacement in enumerate(replacements):
+                    parts = segments[i]
+                    parts.append(unchanged)
+                    if replacement:
+                        parts.append(replacement)
+                        parts.append(spacing)
+                        if replacement not in cls._CLEAN_REPLACEMENTS:
+                            needs_cleanup[i] = True
+                    else:
+                        # 단어 전체가 제거되면 뒤따르는 공백도 함께 제거
+                        needs_cleanup[i] = True
+                position = match.end()
         
-        return transformed_text
+        rest = text[position:]
+        results = {}
+        for i, tone in enumerate(tones):
+            transformed = ''.join(segments[i]) + rest
+            results[tone] = cls._cleanup(transformed) if needs_cleanup[i] else transformed
+        return results
 
     @classmethod
     def get_style_suggestions(cls, text: str) -> Dict[str, str]:
         """모든 문체 톤으로 변환한 결과를 반환"""
-        suggestions = {}
-        
-        for tone in StyleTone:
-            transformed = cls.transform_style(text, tone)
-            suggestions[tone.value] = transformed
-        
-        return suggestions
\ No newline at end of file
+        return {
+            tone.value: transformed
+            for tone, transformed in cls.transform_all_styles(text).items()
+        }
+
+StyleTransformer.compile_rules()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, List, Tuple
 from ..config import settings
 
 
@@ -10,9 +10,17 @@ class TextProcessor:
         """문맥을 보존하면서 텍스트를 스마트하게 분할합니다."""
         if len(text) <= settings.CHUNK_SIZE:
             return [text]
+
+        return [text[start:end] for _, start, end, _ in TextProcessor.iter_split_spans(text)]
+
+    @staticmethod
+    def iter_split_spans(text: str, start_pos: int = 0) -> Iterator[Tuple[int, int, int, int]]:
+        """분할 위치를 (탐색 시작, 청크 시작, 청크 끝, 다음 탐색 시작) 형태로 차례대로 반환
         
-        chunks = []
-        current_pos = 0
+        각 청크의 분할 결정은 탐색 시작 위치 이후의 텍스트에만 의존하므로,
+        이전에 반환된 탐색 시작 위치에서 다시 분할을 이어갈 수 있습니다.
+        """
+        current_pos = start_pos
         
         while current_pos < len(text):
             # 청크 크기만큼 자르기
@@ -66,14 +74,17 @@ class TextProcessor:
                     chunk = chunk[:best_cut]
                     end_pos = current_pos + best_cut
             
-            chunks.append(chunk.strip())
+            chunk_start = current_pos
             current_pos = end_pos
             
             # 다음 청크 시작점에서 공백 제거
             while current_pos < len(text) and text[current_pos] == ' ':
                 current_pos += 1
-        
-        return [chunk for chunk in chunks if chunk.strip()]
+            
+            stripped = chunk.strip()
+            if stripped:
+                start = chunk_start + len(chunk) - len(chunk.lstrip())
+                yield chunk_start, start, start + len(stripped), current_pos
 
     @staticmethod
     def rejoin_chunks(chunks: List[str]) -> str:
@@ -1,22 +1,114 @@
-import torch
-from typing import List, Dict
-from ..models.state_models import GraphState
+from typing import Callable, List, Dict, Optional, Set, Tuple, Union
+from langgraph.types import Send
+from ..models.state_models import ChunkBatchState, GraphState
 from ..utils.text_processor import TextProcessor
 from ..utils.korean_validator import KoreanValidator
 from ..utils.correction_rules import CorrectionRules
+from ..utils.result_cache import ResultCache
+from ..utils.clean_chunk_screener import CleanChunkScreener
+from ..utils.fast_diff import FastDiff
+from ..utils.metrics import CHUNK_BUCKETS, metrics_registry
+from ..services.batch_scheduler import MicroBatchScheduler
 from ..config import settings
-import traceback
+import threading
+import time
+
+NODE_WALL_SECONDS = metrics_registry.histogram(
+    "fixme_node_wall_seconds",
+    "워크플로우 노드(단계)별 실행 시간",
+    ["node"],
+)
+NODE_CPU_SECONDS = metrics_registry.histogram(
+    "fixme_node_cpu_seconds",
+    "워크플로우 노드(단계)를 실행한 스레드의 CPU 시간",
+    ["node"],
+)
+NODE_CHUNKS = metrics_registry.histogram(
+    "fixme_node_chunks",
+    "워크플로우 노드(단계) 실행당 처리한 청크 수",
+    ["node"],
+    buckets=CHUNK_BUCKETS,
+)
 
 
 class WorkflowNodes:
     """LangGraph 워크플로우 노드들을 관리하는 클래스"""
+
+    # kogrammar-base 생성 설정 (max_new_tokens는 입력 길이 기반으로 계산)
+    BASE_GENERATION_CONFIG = {
+        "num_beams": 3,
+        "early_stopping": True,
+        "do_sample": False,
+        "no_repeat_ngram_size": 2,
+        "repetition_penalty": 1.2,  # 반복 페널티 추가
+    }
+
+    # 적응형 디코딩에서 먼저 시도하는 greedy 생성 설정 (검증 실패 시 BASE_GENERATION_CONFIG로 재생성)
+    GREEDY_GENERATION_CONFIG = {
+        "num_beams": 1,
+        "do_sample": False,
+        "no_repeat_ngram_size": 2,
+        "repetition_penalty": 1.2,
+    }
+
+    # 디코딩 정책 이름
+    GREEDY = "greedy"
+    BEAM = "beam"
+
+    # et5-typos-corrector 생성 설정
+    REFINE_GENERATION_CONFIG = {
+        "max_new_tokens": 400,
+        "num_beams": 3,
+        "early_stopping": True,
+        "do_sample": False,
+        "temperature": 1.0,
+    }
     
-    def __init__(self, tokenizer_base, model_base, pipe_lm, device, dmp):
-        self.tokenizer_base = tokenizer_base
-        self.model_base = model_base
-        self.pipe_lm = pipe_lm
-        self.device = device
+    def __init__(self, base_backend, refine_backend, dmp):
+        # kogrammar-base / et5-typos-corrector 교정 백엔드 (app.backends.CorrectionBackend)
+        self.base_backend = base_backend
+        self.refine_backend = refine_backend
         self.dmp = dmp
+        # 'dmp'면 전체 텍스트를 diff_main으로 비교, 'fast'면 어절 단위 편집 수로 많이 다른 텍스트의 비교 시간을 제한
+        self.fast_diff = FastDiff(dmp) if settings.DIFF_ENGINE == "fast" else None
+        self.batch_scheduler = None
+        self.refine_scheduler = None
+        if settings.MICRO_BATCHING:
+            # 여러 요청의 청크를 모아 하나의 generate 호출로 처리
+            self.batch_scheduler = MicroBatchScheduler(
+                self._correct_batch,
+                max_batch_size=settings.GENERATION_BATCH_SIZE,
+                max_wait_ms=settings.BATCH_MAX_WAIT_MS,
+            )
+            self.refine_scheduler = MicroBatchScheduler(
+                self._refine_batch,
+                max_batch_size=settings.GENERATION_BATCH_SIZE,
+                max_wait_ms=settings.BATCH_MAX_WAIT_MS,
+            )
+        self._decoding_lock = threading.Lock()
+        self._decoding_stats = {
+            policy: {"batches": 0, "chunks": 0, "total_ms": 0.0, "max_batch_ms": 0.0}
+            for policy in (self.GREEDY, self.BEAM)
+        }
+        self._escalations = 0
+        self._node_lock = threading.Lock()
+        self._node_stats: Dict[str, Dict] = {}
+        self.clean_screener = None
+        if settings.SKIP_MODEL_MODE != "off":
+            # 깨끗한 청크는 모델을 거치지 않고 사전 교정 결과를 그대로 사용
+            self.clean_screener = CleanChunkScreener(
+                settings.SKIP_MODEL_MODE,
+                capacity=settings.CLEAN_FILTER_CAPACITY,
+                error_rate=settings.CLEAN_FILTER_ERROR_RATE,
+                seed_file=settings.CLEAN_SENTENCES_FILE,
+            )
+        self.chunk_cache = None
+        if settings.CHUNK_CACHE_ENABLED:
+            # 사전 교정 후 청크 텍스트 -> 검증된 모델 출력
+            self.chunk_cache = ResultCache(
+                settings.CHUNK_CACHE_MAX_BYTES,
+                ttl_seconds=settings.CHUNK_CACHE_TTL_SECONDS,
+            )
 
     def smart_text_splitting(self, state: GraphState) -> GraphState:
         """0단계: 텍스트를 문맥을 보존하며 스마트하게 분할"""
@@ -41,122 +133,395 @@ class WorkflowNodes:
             "processed_chunks": [],
         }
 
-    def initial_correction(self, state: GraphState) -> GraphState:
-        """1단계: kogrammar-base 모델을 사용한 기본 교정"""
-        print("Running initial correction...")
+    def route_chunk_batches(self, state: GraphState) -> Union[str, List[Send]]:
+        """청크 배치마다 교정 분기를 만들어 병렬로 실행 (오류가 있거나 모델이 없으면 바로 병합 단계로)"""
         text_chunks = state.get("text_chunks", [])
-        
-        if not text_chunks:
-            # 분할되지 않은 경우 원본 텍스트 사용
-            original_text = state["original_text"]
-            text_chunks = TextProcessor.smart_split_text(original_text)
+        if state.get("error") or not text_chunks or self.base_backend is None:
+            return "merge_chunks"
+
+        # 스케줄러가 있으면 청크별 분기를 다른 분기/요청과 함께 배치로 묶어 줌
+        size = 1 if self.batch_scheduler else max(1, settings.GENERATION_BATCH_SIZE)
+        return [
+            Send("correct_chunk_batch", {"start": start, "chunks": text_chunks[start:start + size]})
+            for start in range(0, len(text_chunks), size)
+        ]
+
+    def correct_chunk_batch(self, state: ChunkBatchState) -> Dict:
+        """1~2단계: 청크 배치에 기본 교정 후 곧바로 LLM 교정 (다른 배치의 기본 교정과 동시에 진행)"""
+        start = state["start"]
+        chunks = state["chunks"]
+        timer = self._start_timer()
+        initial_chunks = self.correct_chunks(chunks)
+        timings = {
+            f"initial_correction[{start}]": self._elapsed_ms("initial_correction", timer, len(chunks))
+        }
+
+        corrected_chunks = initial_chunks
+        if self.refine_backend is not None:
+            timer = self._start_timer()
+            corrected_chunks = self.refine_chunks(initial_chunks)
+            timings[f"refine_correction[{start}]"] = self._elapsed_ms(
+                "refine_correction", timer, len(chunks)
+            )
+
+        return {
+            "initial_results": {start + i: chunk for i, chunk in enumerate(initial_chunks)},
+            "chunk_results": {start + i: chunk for i, chunk in enumerate(corrected_chunks)},
+            "timings": timings,
+        }
 
-        if not self.model_base:
+    def merge_chunks(self, state: GraphState) -> Dict:
+        """청크별 교정 결과를 원래 순서대로 재조합"""
+        print("Merging corrected chunks...")
+        text_chunks = state.get("text_chunks", [])
+        if state.get("error"):
+            return {}
+
+        if self.base_backend is None:
             return {
-                **state,
                 "processed_chunks": text_chunks,
                 "corrected_text": " ".join(text_chunks),
                 "error": "Base model not loaded.",
             }
 
-        processed_chunks = []
-        for chunk in text_chunks:
-            # 1-1. 사전 기반 교정
-            text_after_dict = CorrectionRules.apply_comprehensive_corrections(chunk)
+        chunk_results = state.get("chunk_results", {})
+        processed_chunks = [chunk_results[i] for i in range(len(text_chunks))]
+
+        # 청크들을 자연스럽게 재조합
+        return {
+            "processed_chunks": processed_chunks,
+            "corrected_text": TextProcessor.rejoin_chunks(processed_chunks),
+        }
+
+    def correct_chunks(self, text_chunks: List[str]) -> List[str]:
+        """청크 목록에 사전 교정과 kogrammar-base 모델 교정을 적용"""
+        # 1-1. 사전 기반 교정
+        texts_after_dict = [
+            CorrectionRules.apply_comprehensive_corrections(chunk)
+            for chunk in text_chunks
+        ]
+
+        # 짧거나 사전 교정할 곳이 없던(깨끗한) 청크는 greedy 디코딩을 먼저 시도
+        greedy_first = {
+            text_after_dict
+            for chunk, text_after_dict in zip(text_chunks, texts_after_dict)
+            if len(text_after_dict) <= settings.ADAPTIVE_GREEDY_MAX_CHARS or chunk == text_after_dict
+        }
+
+        # 1-2. 사전 검사에서 깨끗하다고 판단한 청크는 모델 호출 생략
+        corrected_chunks = list(texts_after_dict)
+        model_indices = [
+            i
+            for i, (chunk, text_after_dict) in enumerate(zip(text_chunks, texts_after_dict))
+            if self.clean_screener is None
+            or not self.clean_screener.should_skip(chunk, text_after_dict)
+        ]
+
+        # 1-3. 모델 기반 교정 (캐시에 없는 청크만 배치로 묶어 generate 호출)
+        model_outputs = self._correct_with_cache(
+            [texts_after_dict[i] for i in model_indices], greedy_first
+        )
+        for i, corrected_chunk in zip(model_indices, model_outputs):
+            corrected_chunks[i] = corrected_chunk
+        return corrected_chunks
+
+    def _use_adaptive_decoding(self) -> bool:
+        return (
+            settings.DECODING_POLICY == "adaptive"
+            and self.base_backend.capabilities.beam_search
+        )
+
+    def _chunk_cache_key(self, text: str, policy: str) -> str:
+        return ResultCache.make_key(
+            text,
+            settings.MODEL_NAME,
+            settings.INFERENCE_BACKEND,
+            settings.QUANTIZATION,
+            settings.DECODING_POLICY,
+            policy,
+            settings.MAX_NEW_TOKENS_RATIO,
+            settings.MAX_NEW_TOKENS_MARGIN,
+            self.BASE_GENERATION_CONFIG,
+            self.GREEDY_GENERATION_CONFIG,
+        )
+
+    def _correct_with_cache(
+        self, texts_after_dict: List[str], greedy_first: Optional[Set[str]] = None
+    ) -> List[str]:
+        """청크 캐시를 조회하고, 처음 보는 청크만 모델로 교정하여 순서대로 재조합"""
+        results: Dict[str, str] = {}
+        to_generate: List[str] = []
+        greedy_first = greedy_first if self._use_adaptive_decoding() and greedy_first else set()
+        # 결정적이지 않은 백엔드의 출력은 캐시하지 않음
+        chunk_cache = self.chunk_cache if self.base_backend.capabilities.deterministic else None
+
+        def cache_key(text: str) -> str:
+            return self._chunk_cache_key(text, self.GREEDY if text in greedy_first else self.BEAM)
+
+        # 같은 요청 안의 중복 청크는 한 번만 처리
+        for text in dict.fromkeys(texts_after_dict):
+            if chunk_cache is not None:
+                cached = chunk_cache.get(cache_key(text))
+                if cached is not None:
+                    results[text] = cached
+                    continue
+            to_generate.append(text)
 
-            # 1-2. 모델 기반 교정
+        for text_after_dict, corrected_chunk in zip(
+            to_generate, self._generate_adaptive(to_generate, greedy_first)
+        ):
+            if corrected_chunk is None:
+                # 모델 처리 실패시 전처리된 텍스트 사용 (캐시에는 저장하지 않음)
+                results[text_after_dict] = text_after_dict
+                continue
+            # 출력 검증: 한국어 텍스트 범위 및 길이 체크
+            if not KoreanValidator.is_valid_korean_output(corrected_chunk, text_after_dict):
+                print(f"Invalid model output detected, using preprocessed text")
+                corrected_chunk = text_after_dict
+            elif self.clean_screener is not None:
+                # 모델이 바꾸지 않은 문장은 이후 사전 검사에서 건너뜀
+                self.clean_screener.learn(text_after_dict, corrected_chunk)
+            results[text_after_dict] = corrected_chunk
+            if chunk_cache is not None:
+                chunk_cache.put(cache_key(text_after_dict), corrected_chunk)
+
+        return [results[text] for text in texts_after_dict]
+
+    def _generate_adaptive(self, texts: List[str], greedy_first: Set[str]) -> List[Optional[str]]:
+        """greedy 대상 청크를 먼저 greedy로 생성하고, 검증에 실패한 청크만 beam search로 재생성"""
+        outputs: List[Optional[str]] = [None] * len(texts)
+        greedy_indices = [i for i, text in enumerate(texts) if text in greedy_first]
+        for i, output in zip(
+            greedy_indices, self._generate_chunks([texts[i] for i in greedy_indices], self.GREEDY)
+        ):
+            if output is not None and KoreanValidator.is_valid_korean_output(output, texts[i]):
+                outputs[i] = output
+
+        beam_indices = [i for i, output in enumerate(outputs) if output is None]
+        escalated = len(greedy_indices) - (len(texts) - len(beam_indices))
+        if escalated:
+            with self._decoding_lock:
+                self._escalations += escalated
+        for i, output in zip(
+            beam_indices, self._generate_chunks([texts[i] for i in beam_indices], self.BEAM)
+        ):
+            outputs[i] = output
+        return outputs
+
+    def _generate_chunks(self, texts: List[str], policy: str = BEAM) -> List[Optional[str]]:
+        """청크별 kogrammar-base 모델 출력을 반환 (실패한 청크는 None)"""
+        return self._run_batched(texts, self.batch_scheduler, self._correct_batch, {"policy": policy})
+
+    def _run_batched(self, texts, scheduler, batch_fn, params: Dict) -> List[Optional[str]]:
+        """스케줄러가 있으면 다른 요청과 함께, 없으면 배치 크기 단위로 batch_fn 실행 (실패한 청크는 None)"""
+        if not texts:
+            return []
+
+        if scheduler:
+            # 스케줄러가 다른 요청의 청크와 함께 배치를 구성 (같은 파라미터끼리만 묶음)
+            outputs = []
+            for future in scheduler.submit(texts, params):
+                try:
+                    outputs.append(future.result())
+                except Exception as e:
+                    print(f"Error processing chunk: {e}")
+                    outputs.append(None)
+            return outputs
+
+        outputs = []
+        batch_size = max(1, settings.GENERATION_BATCH_SIZE)
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
             try:
-                # 입력 텍스트에 적절한 프롬프트 추가 (kogrammar-base 모델용)
-                model_input = text_after_dict
-                
-                inputs = self.tokenizer_base.encode(
-                    model_input, 
-                    return_tensors="pt",
-                    max_length=300,
-                    truncation=True
-                ).to(self.device)
-                
-                with torch.no_grad():
-                    outputs = self.model_base.generate(
-                        inputs,
-                        max_new_tokens=len(model_input) + 50,  # 입력 길이 기반으로 제한
-                        num_beams=3,
-                        early_stopping=True,
-                        do_sample=False,
-                        pad_token_id=self.tokenizer_base.pad_token_id,
-                        eos_token_id=self.tokenizer_base.eos_token_id,
-                        no_repeat_ngram_size=2,
-                        repetition_penalty=1.2,  # 반복 페널티 추가
-                    )
-                
-                corrected_chunk = self.tokenizer_base.decode(
-                    outputs[0], skip_special_tokens=True
-                ).strip()
-                
-                # 출력 검증: 한국어 텍스트 범위 및 길이 체크
-                if not KoreanValidator.is_valid_korean_output(corrected_chunk, text_after_dict):
-                    print(f"Invalid model output detected, using preprocessed text")
-                    corrected_chunk = text_after_dict
-                
-                processed_chunks.append(corrected_chunk)
-                
+                outputs.extend(batch_fn(batch, **params))
             except Exception as e:
-                print(f"Error processing chunk: {e}")
-                # 모델 처리 실패시 전처리된 텍스트 사용
-                processed_chunks.append(text_after_dict)
+                print(f"Error processing chunk batch: {e}")
+                outputs.extend([None] * len(batch))
+        return outputs
 
-        # 청크들을 자연스럽게 재조합
-        corrected_text = TextProcessor.rejoin_chunks(processed_chunks)
+    def _correct_batch(self, texts: List[str], policy: str = BEAM) -> List[str]:
+        """kogrammar-base 백엔드로 여러 청크를 한 번에 교정 (배치 미지원 백엔드는 청크별 호출)"""
+        started = time.perf_counter()
+        if not self.base_backend.capabilities.batching:
+            outputs = [
+                output for text in texts for output in self._correct_batch_call([text], policy)
+            ]
+        else:
+            outputs = self._correct_batch_call(texts, policy)
+        self._record_decoding(policy, len(texts), (time.perf_counter() - started) * 1000.0)
+        return outputs
+
+    def _correct_batch_call(self, texts: List[str], policy: str) -> List[str]:
+        return self.base_backend.correct(texts, **self._generation_options(texts, policy))
+
+    def _generation_options(self, texts: List[str], policy: str) -> Dict:
+        """디코딩 정책별 생성 설정"""
+        if settings.DECODING_POLICY != "adaptive":
+            # 고정 정책: beam search, 문자 수 기반 생성 길이
+            return {
+                "max_input_length": 300,
+                "max_new_tokens": max(len(text) for text in texts) + 50,
+                **self.BASE_GENERATION_CONFIG,
+            }
+
+        config = self.GREEDY_GENERATION_CONFIG if policy == self.GREEDY else self.BASE_GENERATION_CONFIG
         return {
-            **state, 
-            "processed_chunks": processed_chunks,
-            "corrected_text": corrected_text
+            "max_input_length": 300,
+            # 생성 길이는 토크나이즈된 입력 길이 기준으로 백엔드에서 계산
+            "max_new_tokens_ratio": settings.MAX_NEW_TOKENS_RATIO,
+            "max_new_tokens_margin": settings.MAX_NEW_TOKENS_MARGIN,
+            **config,
         }
 
-    def refine_correction(self, state: GraphState) -> GraphState:
-        """2단계: LLM을 사용한 상세 교정"""
-        print("Running refinement with LLM...")
-        text_to_refine = state["corrected_text"]
-
-        # LLM 모델이 로드되지 않았거나 문제가 있으면 스킵
-        if not self.pipe_lm:
-            print("LLM not available, skipping refinement")
-            return {**state}
-
-        try:
-            # 텍스트가 너무 길면 청크별로 처리
-            if len(text_to_refine) > 300:
-                print("Text too long for LLM, using previous result")
-                return {**state}
-            
-            sequences = self.pipe_lm(
-                text_to_refine,
-                max_new_tokens=400,
-                num_beams=3,
-                early_stopping=True,
-                do_sample=False,
-                temperature=1.0,
-                pad_token_id=self.pipe_lm.tokenizer.pad_token_id,
+    def _record_decoding(self, policy: str, chunks: int, elapsed_ms: float):
+        with self._decoding_lock:
+            stats = self._decoding_stats[policy]
+            stats["batches"] += 1
+            stats["chunks"] += chunks
+            stats["total_ms"] += elapsed_ms
+            stats["max_batch_ms"] = max(stats["max_batch_ms"], elapsed_ms)
+
+    def get_prescreen_stats(self) -> Dict:
+        """깨끗한 청크 사전 검사 통계 반환"""
+        if self.clean_screener is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.clean_screener.get_stats()}
+
+    def get_decoding_stats(self) -> Dict:
+        """디코딩 정책별 배치 수, 청크 수, 지연 시간과 beam search 재생성 통계 반환"""
+        with self._decoding_lock:
+            policies = {}
+            for policy, stats in self._decoding_stats.items():
+                batches, chunks = stats["batches"], stats["chunks"]
+                policies[policy] = {
+                    "batches": batches,
+                    "chunks": chunks,
+                    "avg_batch_ms": round(stats["total_ms"] / batches, 2) if batches else 0.0,
+                    "avg_chunk_ms": round(stats["total_ms"] / chunks, 2) if chunks else 0.0,
+                    "max_batch_ms": round(stats["max_batch_ms"], 2),
+                }
+            escalations = self._escalations
+
+        greedy_chunks = policies[self.GREEDY]["chunks"]
+        return {
+            "policy": settings.DECODING_POLICY,
+            **policies,
+            "escalations": escalations,
+            "escalation_rate": round(escalations / greedy_chunks, 4) if greedy_chunks else 0.0,
+        }
+
+    def timed(self, name: str, node: Callable[[Dict], Dict]) -> Callable[[Dict], Dict]:
+        """노드 실행 시간을 상태의 timings와 노드별 통계에 기록하도록 감싸기"""
+
+        def run(state: Dict) -> Dict:
+            timer = self._start_timer()
+            update = node(state)
+            # 병렬 분기 노드는 배치 번호를 붙여 서로 덮어쓰지 않도록 함
+            label = f"{name}[{state['start']}]" if "start" in state else name
+            chunks = len(state["chunks"]) if "chunks" in state else None
+            timings = {**update.get("timings", {}), label: self._elapsed_ms(name, timer, chunks)}
+            return {**update, "timings": timings}
+
+        return run
+
+    @staticmethod
+    def _start_timer() -> Tuple[float, float]:
+        """경과 시간과 현재 스레드의 CPU 시간 측정 시작점"""
+        return time.perf_counter(), time.thread_time()
+
+    def _elapsed_ms(self, name: str, timer: Tuple[float, float], chunks: Optional[int] = None) -> float:
+        """timer 이후 경과 시간(ms)과 CPU 시간을 노드별 통계와 메트릭에 기록하고 경과 시간 반환"""
+        started, cpu_started = timer
+        elapsed = time.perf_counter() - started
+        cpu = time.thread_time() - cpu_started
+        elapsed_ms = round(elapsed * 1000.0, 2)
+
+        NODE_WALL_SECONDS.observe(elapsed, node=name)
+        NODE_CPU_SECONDS.observe(cpu, node=name)
+        if chunks is not None:
+            NODE_CHUNKS.observe(chunks, node=name)
+        with self._node_lock:
+            stats = self._node_stats.setdefault(
+                name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "cpu_ms": 0.0}
             )
-            refined_text = sequences[0]["generated_text"].strip()
-            
+            stats["count"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            stats["cpu_ms"] += cpu * 1000.0
+        return elapsed_ms
+
+    def get_node_stats(self) -> Dict:
+        """워크플로우 노드별 실행 횟수, 평균/최대 실행 시간(ms)과 평균 CPU 시간(ms) 반환"""
+        with self._node_lock:
+            return {
+                name: {
+                    "count": stats["count"],
+                    "avg_ms": round(stats["total_ms"] / stats["count"], 2),
+                    "max_ms": stats["max_ms"],
+                    "avg_cpu_ms": round(stats["cpu_ms"] / stats["count"], 2),
+                }
+                for name, stats in self._node_stats.items()
+            }
+
+    def correct_and_refine_chunks(self, text_chunks: List[str]) -> List[str]:
+        """청크 목록에 사전 교정, kogrammar-base 교정, LLM 교정을 차례로 적용"""
+        corrected_chunks = self.correct_chunks(text_chunks)
+        if self.refine_backend is None:
+            return corrected_chunks
+        return self.refine_chunks(corrected_chunks)
+
+    def _refine_cache_key(self, text: str) -> str:
+        return ResultCache.make_key(
+            text,
+            "refine",
+            settings.INFERENCE_BACKEND,
+            settings.QUANTIZATION,
+            self.REFINE_GENERATION_CONFIG,
+        )
+
+    def refine_chunks(self, chunks: List[str]) -> List[str]:
+        """et5-typos-corrector 모델로 청크들을 배치 교정 (실패하거나 너무 짧아진 청크는 입력 그대로 사용)"""
+        chunk_cache = self.chunk_cache if self.refine_backend.capabilities.deterministic else None
+        results: Dict[str, str] = {}
+        to_refine: List[str] = []
+        for chunk in dict.fromkeys(chunks):
+            if chunk_cache is not None:
+                cached = chunk_cache.get(self._refine_cache_key(chunk))
+                if cached is not None:
+                    results[chunk] = cached
+                    continue
+            to_refine.append(chunk)
+
+        outputs = self._run_batched(to_refine, self.refine_scheduler, self._refine_batch, {})
+        for chunk, refined in zip(to_refine, outputs):
+            if refined is None:
+                results[chunk] = chunk
+                continue
             # 결과가 너무 다르면 이전 결과 사용
-            if len(refined_text) < len(text_to_refine) * 0.7:
+            if len(refined) < len(chunk) * 0.7:
                 print("LLM output too short, keeping previous result")
-                refined_text = text_to_refine
+                refined = chunk
+            results[chunk] = refined
+            if chunk_cache is not None:
+                chunk_cache.put(self._refine_cache_key(chunk), refined)
 
-        except Exception as e:
-            print(f"LLM refinement error: {e}")
-            traceback.print_exc()
-            refined_text = text_to_refine
+        return [results[chunk] for chunk in chunks]
 
-        return {**state, "corrected_text": refined_text}
+    def _refine_batch(self, texts: List[str]) -> List[str]:
+        """et5-typos-corrector 백엔드로 여러 청크를 한 번에 교정 (배치 미지원 백엔드는 청크별 호출)"""
+        # text2text-generation 파이프라인과 같이 입력을 자르지 않고 공백 정리 없이 디코딩
+        options = {"clean_up_tokenization_spaces": False, **self.REFINE_GENERATION_CONFIG}
+        if not self.refine_backend.capabilities.batching:
+            return [self.refine_backend.correct([text], **options)[0] for text in texts]
+        return self.refine_backend.correct(texts, **options)
 
-    def generate_suggestions(self, state: GraphState) -> GraphState:
-        """3단계: 더 나은 문장 표현 제안"""
+    def generate_suggestions(self, state: GraphState) -> Dict:
+        """3단계: 더 나은 문장 표현 제안 (generate_diff와 병렬 실행되므로 바뀐 키만 반환)"""
         print("Generating style suggestions...")
-        corrected_text = state["corrected_text"]
-        
+        return {"suggestions": self.build_suggestions(state["corrected_text"])}
+
+    def build_suggestions(self, corrected_text: str) -> List[Dict[str, str]]:
+        """교정된 텍스트에 대한 문장 개선 제안 목록 생성"""
         # 기본 문장 개선 규칙
         suggestions = []
         
@@ -205,16 +570,33 @@ class WorkflowNodes:
                     "reason": "긴 문장을 여러 개의 짧은 문장으로 나누면 가독성이 향상됩니다."
                 })
         
-        return {**state, "suggestions": suggestions}
+        return suggestions
 
-    def generate_diff(self, state: GraphState) -> GraphState:
-        """최종 교정본과 원본을 비교하여 교정 목록 생성"""
+    def generate_diff(self, state: GraphState) -> Dict:
+        """최종 교정본과 원본을 비교하여 교정 목록 생성 (generate_suggestions와 병렬 실행)"""
         print("Generating diff...")
-        original = state["original_text"]
-        corrected = state["corrected_text"]
+        return {
+            "corrections": self.diff_corrections(
+                state["original_text"],
+                state["corrected_text"],
+                state.get("text_chunks"),
+                state.get("processed_chunks"),
+            )
+        }
 
-        diffs = self.dmp.diff_main(original, corrected)
-        self.dmp.diff_cleanupSemantic(diffs)
+    def diff_corrections(
+        self,
+        original: str,
+        corrected: str,
+        original_chunks: Optional[List[str]] = None,
+        corrected_chunks: Optional[List[str]] = None,
+    ) -> List[Dict[str, str]]:
+        """원문과 교정문을 비교하여 교정 목록 생성 (청크 목록이 있으면 청크별로 맞춰 비교)"""
+        if self.fast_diff is not None:
+            diffs = self.fast_diff.diff(original, corrected, original_chunks, corrected_chunks)
+        else:
+            diffs = self.dmp.diff_main(original, corrected)
+            self.dmp.diff_cleanupSemantic(diffs)
 
         corrections = []
         original_word = ""
@@ -259,4 +641,4 @@ class WorkflowNodes:
                     }
                 )
 
-        return {**state, "corrections": corrections}
\ No newline at end of file
+        return corrections
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+HTTP 부하 테스트
+서버를 띄우지 않고 같은 프로세스의 FastAPI 앱(httpx ASGITransport)에 요청을 보내
+/api/v1/spellcheck, /api/v1/pipeline/run, /api/v1/comprehensive/comprehensive의
+처리량(RPS), 꼬리 지연 시간, 추론 슬롯 대기 시간, 오류율, 이벤트 루프 지연을 측정합니다.
+모델 대신 결정적인 스텁 백엔드(INFERENCE_BACKEND=stub)를 사용합니다.
+
+사용법:
+    python benchmarks/load_test.py --concurrency 16 --requests 400 --output load_results.json
+    python benchmarks/load_test.py --rate 50 --duration 20  # 고정 도착률(open loop)
+    MICRO_BATCHING=false python benchmarks/load_test.py  # 설정을 바꿔 비교
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+# 프로젝트 루트와 tests 디렉토리를 sys.path에 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+from app.config import settings
+from pipeline_benchmark import git_revision, percentile
+from test_model_corrections import TEST_CASES
+
+ENDPOINTS = {
+    "spellcheck": "/api/v1/spellcheck",
+    "pipeline": "/api/v1/pipeline/run",
+    "comprehensive": "/api/v1/comprehensive/comprehensive",
+}
+
+
+def build_texts(count: int) -> list:
+    """서로 다른 요청 텍스트 count개 (같은 텍스트가 반복되면 결과 캐시에 적중)"""
+    sentences = [
+        sentence.strip() + "."
+        for _, text in TEST_CASES
+        for sentence in text.split(".")
+        if sentence.strip()
+    ]
+    texts = []
+    for i in range(count):
+        start = (i * 3) % len(sentences)
+        picked = [sentences[(start + k) % len(sentences)] for k in range(2 + i % 4)]
+        texts.append(f"{i + 1}번째 요청입니다. " + " ".join(picked))
+    return texts
+
+
+def request_plan(args, texts: list) -> list:
+    """(엔드포인트 이름, JSON 본문) 목록을 엔드포인트와 텍스트를 번갈아 가며 생성"""
+    plan = []
+    for i in range(args.requests):
+        endpoint = args.endpoints[i % len(args.endpoints)]
+        body = {"text": texts[i % len(texts)]}
+        if endpoint == "comprehensive" and args.style:
+            body["target_style"] = args.style
+        plan.append((endpoint, body))
+    return plan
+
+
+async def send(client, endpoint: str, body: dict, headers: dict, scheduled_at: float) -> dict:
+    """요청 하나를 보내고 결과 기록 (지연 시간은 예정 시각부터 측정)"""
+    try:
+        response = await client.post(ENDPOINTS[endpoint], json=body, headers=headers)
+        status, error = response.status_code, None
+        if status >= 400:
+            error = f"HTTP {status}"
+    except Exception as e:
+        status, error = None, type(e).__name__
+    return {
+        "endpoint": endpoint,
+        "status": status,
+        "error": error,
+        "latency_ms": (time.perf_counter() - scheduled_at) * 1000.0,
+    }
+
+
+async def closed_loop(client, plan: list, headers: dict, concurrency: int, deadline: float) -> list:
+    """동시 사용자 concurrency명이 응답을 받자마자 다음 요청을 보냄"""
+    results = []
+    queue = iter(plan)
+
+    async def user():
+        for endpoint, body in queue:
+            if time.perf_counter() > deadline:
+                return
+            results.append(await send(client, endpoint, body, headers, time.perf_counter()))
+
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    return results
+
+
+async def open_loop(client, plan: list, headers: dict, rate: float, deadline: float) -> list:
+    """응답과 관계없이 초당 rate개의 요청을 보냄 (지연 시간은 예정 시각 기준이라 밀린 시간도 포함)"""
+    started = time.perf_counter()
+    tasks = []
+    for i, (endpoint, body) in enumerate(plan):
+        scheduled_at = started + i / rate
+        if scheduled_at > deadline:
+            break
+        await asyncio.sleep(max(0.0, scheduled_at - time.perf_counter()))
+        tasks.append(asyncio.create_task(send(client, endpoint, body, headers, scheduled_at)))
+    return list(await asyncio.gather(*tasks))
+
+
+async def monitor_event_loop(lags: list, stop: asyncio.Event, interval: float = 0.01):
+    """interval마다 깨어나 예정보다 늦어진 시간(ms)을 기록 (이벤트 루프가 막히면 커짐)"""
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, (time.perf_counter() - expected) * 1000.0))
+
+
+def latency_summary(samples: list) -> dict:
+    if not samples:
+        return {}
+    return {
+        "p50_ms": round(percentile(samples, 50), 2),
+        "p90_ms": round(percentile(samples, 90), 2),
+        "p99_ms": round(percentile(samples, 99), 2),
+        "p999_ms": round(percentile(samples, 99.9), 2),
+        "max_ms": round(max(samples), 2),
+        "mean_ms": round(statistics.fmean(samples), 2),
+    }
+
+
+def summarize(results: list, elapsed: float) -> dict:
+    """엔드포인트별/전체 처리량, 지연 시간, 오류율"""
+    groups = {"all": results}
+    for result in results:
+        groups.setdefault(result["endpoint"], []).append(result)
+
+    summary = {}
+    for name, rows in groups.items():
+        errors = [row for row in rows if row["error"]]
+        summary[name] = {
+            "requests": len(rows),
+            "errors": len(errors),
+            "error_rate": round(len(errors) / len(rows), 4) if rows else 0.0,
+            "error_types": dict(Counter(row["error"] for row in errors)),
+            "rps": round(len(rows) / elapsed, 2) if elapsed else None,
+            # 지연 시간은 성공한 요청만 집계
+            **latency_summary([row["latency_ms"] for row in rows if not row["error"]]),
+        }
+    return summary
+
+
+async def wait_until_ready(client, timeout: float):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if (await client.get("/ready")).status_code == 200:
+            return
+        await asyncio.sleep(0.05)
+    raise RuntimeError("앱이 준비되지 않았습니다.")
+
+
+async def run(args) -> dict:
+    import httpx
+
+    from app.main import app
+    from app.services.inference_executor import inference_executor
+
+    # 백엔드는 모델 로드 시점(lifespan)에 생성되므로 그 전에 스텁으로 설정
+    settings.INFERENCE_BACKEND = "stub"
+    settings.STUB_LATENCY_MS = args.stub_latency_ms
+    settings.STUB_PER_CHUNK_LATENCY_MS = args.stub_per_chunk_latency_ms
+
+    texts = build_texts(args.distinct_texts)
+    plan = request_plan(args, texts)
+    headers = {"Cache-Control": "no-cache"} if args.no_cache else {}
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://loadtest", timeout=args.timeout
+        ) as client:
+            await wait_until_ready(client, args.timeout)
+            for endpoint in args.endpoints:
+                # 워밍업 (정규식 컴파일, 그래프 첫 실행 등)
+                await send(client, endpoint, {"text": texts[0]}, {"Cache-Control": "no-cache"}, time.perf_counter())
+
+            executor_before = inference_executor.get_stats()
+            lags = []
+            stop = asyncio.Event()
+            monitor = asyncio.create_task(monitor_event_loop(lags, stop))
+
+            started = time.perf_counter()
+            deadline = started + args.duration if args.duration else float("inf")
+            if args.rate:
+                results = await open_loop(client, plan, headers, args.rate, deadline)
+            else:
+                results = await closed_loop(client, plan, headers, args.concurrency, deadline)
+            elapsed = time.perf_counter() - started
+
+            stop.set()
+            await monitor
+            executor_after = inference_executor.get_stats()
+            service_stats = (await client.get("/api/v1/stats")).json()
+
+    started_requests = executor_after["completed"] - executor_before["completed"]
+    total_wait_ms = executor_after["total_wait_ms"] - executor_before["total_wait_ms"]
+    return {
+        "meta": {
+            "git_revision": git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "mode": f"open loop {args.rate} rps" if args.rate else f"closed loop x{args.concurrency}",
+            "endpoints": args.endpoints,
+            "distinct_texts": args.distinct_texts,
+            "result_cache": not args.no_cache,
+            "stub_latency_ms": args.stub_latency_ms,
+            "stub_per_chunk_latency_ms": args.stub_per_chunk_latency_ms,
+            "settings": {
+                "MICRO_BATCHING": settings.MICRO_BATCHING,
+                "GENERATION_BATCH_SIZE": settings.GENERATION_BATCH_SIZE,
+                "BATCH_MAX_WAIT_MS": settings.BATCH_MAX_WAIT_MS,
+                "RESULT_CACHE_ENABLED": settings.RESULT_CACHE_ENABLED,
+                "CHUNK_CACHE_ENABLED": settings.CHUNK_CACHE_ENABLED,
+                "SKIP_MODEL_MODE": settings.SKIP_MODEL_MODE,
+            },
+            "inference_slots": executor_after["slots"],
+            "elapsed_seconds": round(elapsed, 3),
+        },
+        "summary": summarize(results, elapsed),
+        "queue_delay": {
+            # 추론 슬롯을 얻을 때까지 기다린 시간 (측정 구간만)
+            "avg_ms": round(total_wait_ms / started_requests, 2) if started_requests else 0.0,
+            "max_ms": executor_after["max_wait_ms"],
+        },
+        "event_loop_lag": latency_summary(lags),
+        "service_stats": {
+            key: service_stats.get(key)
+            for key in ("batching", "result_cache", "chunk_cache", "prescreen")
+        },
+    }
+
+
+def print_report(report: dict):
+    print(f"\n=== {report['meta']['mode']}, {report['meta']['elapsed_seconds']}초 ===")
+    for name, row in report["summary"].items():
+        print(
+            f"{name:>14}: {row['requests']}건, {row['rps']} rps, 오류율 {row['error_rate']:.2%}, "
+            f"p50 {row.get('p50_ms')}ms, p99 {row.get('p99_ms')}ms, 최대 {row.get('max_ms')}ms"
+        )
+    queue = report["queue_delay"]
+    lag = report["event_loop_lag"]
+    print(f"추론 슬롯 대기: 평균 {queue['avg_ms']}ms, 최대 {queue['max_ms']}ms")
+    print(f"이벤트 루프 지연: p99 {lag.get('p99_ms')}ms, 최대 {lag.get('max_ms')}ms")
+    batching = report["service_stats"]["batching"] or {}
+    cache = report["service_stats"]["result_cache"] or {}
+    print(f"평균 배치 크기: {batching.get('avg_batch_size')}, 결과 캐시 적중률: {cache.get('hit_rate')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스텁 모델을 사용하는 프로세스 내 HTTP 부하 테스트")
+    parser.add_argument("--endpoints", nargs="+", choices=list(ENDPOINTS), default=list(ENDPOINTS))
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 사용자 수 (closed loop)")
+    parser.add_argument("--rate", type=float, help="초당 요청 수 (지정하면 open loop)")
+    parser.add_argument("--requests", type=int, default=300, help="보낼 최대 요청 수")
+    parser.add_argument("--duration", type=float, help="최대 실행 시간(초)")
+    parser.add_argument("--distinct-texts", type=int, default=30, help="서로 다른 요청 텍스트 수")
+    parser.add_argument("--no-cache", action="store_true", help="Cache-Control: no-cache로 결과 캐시 우회")
+    parser.add_argument("--style", help="종합 교정 요청의 target_style")
+    parser.add_argument("--stub-latency-ms", type=float, default=20.0, help="스텁 모델 호출당 지연 시간")
+    parser.add_argument(
+        "--stub-per-chunk-latency-ms", type=float, default=2.0, help="스텁 모델 청크당 지연 시간"
+    )
+    parser.add_argument("--timeout", type=float, default=60.0, help="요청 타임아웃(초)")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+    if args.duration is not None and args.rate:
+        # 고정 도착률로 duration 동안 보낼 만큼 요청 수를 늘림
+        args.requests = max(args.requests, int(args.rate * args.duration))
+
+    # 서버 로그(print)가 결과 출력과 섞이지 않도록 실행 중에는 버림
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        report = asyncio.run(run(args))
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과가 {args.output}에 저장되었습니다.")
+
+
+if __name__ == "__main__":
+    main()
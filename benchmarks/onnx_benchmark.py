@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+ONNX Runtime 백엔드 비교 벤치마크
+tests/test_model_corrections.py의 케이스를 청크로 나누어 PyTorch 백엔드와
+ONNX Runtime 백엔드(CPU)의 생성 지연 시간과 출력 일치도를 모델별로 비교합니다.
+서버나 서비스 없이 백엔드만 직접 로드하여 측정합니다.
+
+사용법:
+    python benchmarks/onnx_benchmark.py --repeats 3 --output onnx_results.json
+    python benchmarks/onnx_benchmark.py --num-beams 1  # greedy 디코딩 비교
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+# 프로젝트 루트와 tests 디렉토리를 sys.path에 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+from app.backends import OnnxSeq2SeqBackend, TorchSeq2SeqBackend
+from app.config import settings
+from app.services.advanced_spellcheck_service import AdvancedSpellCheckService
+from app.utils.correction_rules import CorrectionRules
+from app.utils.text_processor import TextProcessor
+from app.workflow.nodes import WorkflowNodes
+from test_model_corrections import TEST_CASES
+
+
+def build_workloads() -> dict:
+    """워크플로우와 같은 입력을 모델별로 구성 (기본 모델: 사전 교정된 청크 배치, LLM: 청크 배치)"""
+    chunks = []
+    for _, text in TEST_CASES:
+        chunks.extend(TextProcessor.smart_split_text(text))
+    base_inputs = [CorrectionRules.apply_comprehensive_corrections(chunk) for chunk in chunks]
+    batch_size = max(1, settings.GENERATION_BATCH_SIZE)
+    return {
+        role: [inputs[i:i + batch_size] for i in range(0, len(inputs), batch_size)]
+        for role, inputs in (("base", base_inputs), ("refine", chunks))
+    }
+
+
+def generation_options(role: str, batch: list, num_beams=None) -> dict:
+    """WorkflowNodes가 각 모델을 호출할 때와 같은 생성 옵션"""
+    if role == "base":
+        options = {
+            "max_input_length": 300,
+            "max_new_tokens": max(len(text) for text in batch) + 50,
+            **WorkflowNodes.BASE_GENERATION_CONFIG,
+        }
+    else:
+        options = {"clean_up_tokenization_spaces": False, **WorkflowNodes.REFINE_GENERATION_CONFIG}
+    if num_beams is not None:
+        options["num_beams"] = num_beams
+    return options
+
+
+def load_backend(backend_name: str, model_name: str):
+    if backend_name == "onnx":
+        return OnnxSeq2SeqBackend.from_pretrained(model_name, settings.ONNX_MODEL_DIR)
+    return TorchSeq2SeqBackend.from_pretrained(model_name, "cpu")
+
+
+def run_backend(backend_name: str, models: dict, workloads: dict, repeats: int, num_beams=None) -> dict:
+    """백엔드로 모델별 워크로드를 생성하고 배치별 지연 시간과 출력을 기록"""
+    result = {"backend": backend_name, "models": {}}
+    for role, model_name in models.items():
+        started = time.perf_counter()
+        backend = load_backend(backend_name, model_name)
+        load_seconds = time.perf_counter() - started
+
+        batches = []
+        for batch in workloads[role]:
+            options = generation_options(role, batch, num_beams)
+            backend.correct(batch, **options)  # 워밍업
+
+            latencies = []
+            outputs = None
+            for _ in range(repeats):
+                started = time.perf_counter()
+                outputs = backend.correct(batch, **options)
+                latencies.append((time.perf_counter() - started) * 1000.0)
+            batches.append({
+                "size": len(batch),
+                "chars": sum(len(text) for text in batch),
+                "latency_ms": round(statistics.median(latencies), 1),
+                "outputs": outputs,
+            })
+
+        total_ms = sum(batch["latency_ms"] for batch in batches)
+        result["models"][role] = {
+            "model_name": model_name,
+            "load_seconds": round(load_seconds, 2),
+            "total_latency_ms": round(total_ms, 1),
+            "batches": batches,
+        }
+        print(f"[{backend_name}] {model_name}: 로드 {load_seconds:.2f}s, 배치 {len(batches)}개 합계 {total_ms:.1f}ms")
+    return result
+
+
+def compare(baseline: dict, candidate: dict) -> dict:
+    """PyTorch 대비 모델별 속도 향상과 출력 일치율"""
+    rows = {}
+    for role, base_model in baseline["models"].items():
+        model = candidate["models"][role]
+        pairs = [
+            (base_output, output)
+            for base_batch, batch in zip(base_model["batches"], model["batches"])
+            for base_output, output in zip(base_batch["outputs"], batch["outputs"])
+        ]
+        rows[role] = {
+            "speedup": round(base_model["total_latency_ms"] / model["total_latency_ms"], 2)
+            if model["total_latency_ms"]
+            else None,
+            "exact_match_rate": round(sum(a == b for a, b in pairs) / len(pairs), 4) if pairs else None,
+        }
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PyTorch vs ONNX Runtime 생성 지연 시간/일치도 비교")
+    parser.add_argument("--repeats", type=int, default=3, help="배치별 반복 측정 횟수")
+    parser.add_argument("--num-beams", type=int, help="생성 설정의 num_beams 대체 (1이면 greedy)")
+    parser.add_argument("--base-model", default=settings.MODEL_NAME, help="기본 교정 모델")
+    parser.add_argument("--lm-model", default=AdvancedSpellCheckService.LM_MODEL_NAME, help="LLM 교정 모델")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    models = {"base": args.base_model, "refine": args.lm_model}
+    workloads = build_workloads()
+    runs = [
+        run_backend(backend_name, models, workloads, args.repeats, args.num_beams)
+        for backend_name in ("torch", "onnx")
+    ]
+    report = {"num_beams": args.num_beams, "runs": runs, "comparison": compare(runs[0], runs[1])}
+
+    print("\n=== ONNX Runtime vs PyTorch (CPU) ===")
+    for role, row in report["comparison"].items():
+        print(f"{models[role]}: {row['speedup']}x, 출력 일치율 {row['exact_match_rate']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과가 {args.output}에 저장되었습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+교정 파이프라인 오프라인 벤치마크
+모델 대신 스텁 백엔드(INFERENCE_BACKEND=stub)를 사용하여 서버와 모델 다운로드 없이
+텍스트 분할, 사전 교정, 문체 변환, 출력 검증, diff 생성, 전체 correct_text 경로를
+고정된 한국어 코퍼스의 여러 길이(50, 300, 2000, 20000자)에서 측정합니다.
+결과는 커밋 간 비교할 수 있도록 JSON으로 저장합니다.
+
+사용법:
+    python benchmarks/pipeline_benchmark.py --output pipeline_results.json
+    python benchmarks/pipeline_benchmark.py --compare pipeline_results.json  # 이전 결과와 비교
+"""
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+# 프로젝트 루트와 tests 디렉토리를 sys.path에 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+from app.config import settings
+from app.services.advanced_spellcheck_service import AdvancedSpellCheckService
+from app.utils.correction_rules import CorrectionRules
+from app.utils.korean_validator import KoreanValidator
+from app.utils.style_utils import StyleTransformer
+from app.utils.text_processor import TextProcessor
+from test_model_corrections import TEST_CASES
+
+DEFAULT_SIZES = [50, 300, 2000, 20000]
+PATHS = [
+    "text_processor",
+    "correction_rules",
+    "style_transformer",
+    "korean_validator",
+    "generate_diff",
+    "correct_text",
+]
+
+
+def build_corpus(size: int) -> str:
+    """테스트 케이스 문장을 순서대로 이어 붙여 size자 텍스트 생성 (항상 같은 텍스트)"""
+    seeds = [text for _, text in TEST_CASES]
+    parts, length, i = [], 0, 0
+    while length < size:
+        parts.append(seeds[i % len(seeds)])
+        length += len(parts[-1]) + 1
+        i += 1
+    return " ".join(parts)[:size].rstrip()
+
+
+def create_service(stub_latency_ms: float, stub_per_chunk_latency_ms: float) -> AdvancedSpellCheckService:
+    """스텁 백엔드로 모델을 로드한 서비스 생성 (결과가 반복 측정 사이에 달라지지 않도록 캐시/사전 검사는 끔)
+
+    단일 스레드로 측정하므로 마이크로 배칭도 꺼서 배치 대기 시간이 단계별 시간에 섞이지 않도록 합니다.
+    """
+    settings.INFERENCE_BACKEND = "stub"
+    settings.MICRO_BATCHING = False
+    settings.STUB_LATENCY_MS = stub_latency_ms
+    settings.STUB_PER_CHUNK_LATENCY_MS = stub_per_chunk_latency_ms
+    settings.SKIP_MODEL_MODE = "off"
+    settings.CHUNK_CACHE_ENABLED = False
+    settings.RESULT_CACHE_ENABLED = False
+
+    service = AdvancedSpellCheckService()
+    if not service.ensure_models_loaded():
+        raise RuntimeError("스텁 백엔드 로드 실패")
+    return service
+
+
+def path_functions(service: AdvancedSpellCheckService, text: str) -> dict:
+    """경로 이름 -> 인자 없이 호출할 함수"""
+    corrected = CorrectionRules.apply_comprehensive_corrections(text)
+    nodes = service.nodes
+    return {
+        "text_processor": lambda: TextProcessor.rejoin_chunks(TextProcessor.smart_split_text(text)),
+        "correction_rules": lambda: CorrectionRules.apply_comprehensive_corrections(text),
+        "style_transformer": lambda: StyleTransformer.transform_all_styles(text),
+        "korean_validator": lambda: KoreanValidator.is_valid_korean_output(corrected, text),
+        "generate_diff": lambda: nodes.generate_diff({"original_text": text, "corrected_text": corrected}),
+        "correct_text": lambda: service.correct_text(text, use_cache=False),
+    }
+
+
+def percentile(samples: list, q: float) -> float:
+    """nearest-rank 백분위수"""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def calibrate(fn, min_sample_ms: float) -> int:
+    """한 샘플이 min_sample_ms 이상 걸리도록 샘플당 반복 횟수 결정 (timeit autorange와 같은 방식)"""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if (time.perf_counter() - started) * 1000.0 >= min_sample_ms or number >= 1_000_000:
+            return number
+        number *= 2
+
+
+def measure(fn, repeats: int, warmup: int, min_sample_ms: float) -> dict:
+    """호출당 지연 시간 분포와 최대 메모리 사용량 측정 (메모리는 별도 실행에서 tracemalloc으로 측정)
+
+    매우 짧은 경로는 타이머 해상도에 묻히지 않도록 샘플마다 number번 호출한 평균을 사용합니다.
+    """
+    for _ in range(warmup):
+        fn()
+    number = calibrate(fn, min_sample_ms)
+
+    latencies = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        latencies.append((time.perf_counter() - started) * 1000.0 / number)
+
+    # tracemalloc은 실행을 느리게 하므로 지연 시간 측정과 분리
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    mean_ms = statistics.fmean(latencies)
+    return {
+        "repeats": repeats,
+        "calls_per_sample": number,
+        "p50_ms": round(percentile(latencies, 50), 6),
+        "p99_ms": round(percentile(latencies, 99), 6),
+        "mean_ms": round(mean_ms, 6),
+        "min_ms": round(min(latencies), 6),
+        "ops_per_sec": round(1000.0 / mean_ms, 2) if mean_ms else None,
+        "peak_kib": round(peak / 1024.0, 1),
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run(args) -> dict:
+    # 20000자 입력도 전체 파이프라인을 통과하도록 최대 길이를 늘림
+    settings.MAX_LENGTH = max(settings.MAX_LENGTH, max(args.sizes))
+    service = create_service(args.stub_latency_ms, args.stub_per_chunk_latency_ms)
+
+    results = []
+    for size in args.sizes:
+        text = build_corpus(size)
+        chunks = len(TextProcessor.smart_split_text(text))
+        functions = path_functions(service, text)
+        for path in args.paths:
+            row = {"path": path, "size": size, "chars": len(text), "chunks": chunks}
+            # 노드의 진행 로그(print)가 결과 출력과 섞이지 않고 터미널 속도에 영향받지 않도록 버림
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                row.update(measure(functions[path], args.repeats, args.warmup, args.min_sample_ms))
+            row["chars_per_sec"] = round(len(text) * 1000.0 / row["mean_ms"]) if row["mean_ms"] else None
+            results.append(row)
+            print(
+                f"{path:>18} {size:>6}자: p50 {row['p50_ms']:.3f}ms, p99 {row['p99_ms']:.3f}ms, "
+                f"{row['chars_per_sec']}자/초, 최대 메모리 {row['peak_kib']}KiB"
+            )
+
+    return {
+        "meta": {
+            "git_revision": git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": args.repeats,
+            "warmup": args.warmup,
+            "min_sample_ms": args.min_sample_ms,
+            "stub_latency_ms": args.stub_latency_ms,
+            "stub_per_chunk_latency_ms": args.stub_per_chunk_latency_ms,
+            "settings": {
+                "CHUNK_SIZE": settings.CHUNK_SIZE,
+                "GENERATION_BATCH_SIZE": settings.GENERATION_BATCH_SIZE,
+                "MICRO_BATCHING": settings.MICRO_BATCHING,
+                "BATCH_MAX_WAIT_MS": settings.BATCH_MAX_WAIT_MS,
+                "DECODING_POLICY": settings.DECODING_POLICY,
+            },
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """같은 경로/길이끼리 p50/p99 비율 계산 (ratio > 1 + threshold이면 회귀)"""
+    baseline_rows = {(row["path"], row["size"]): row for row in baseline["results"]}
+    rows = []
+    for row in current["results"]:
+        base = baseline_rows.get((row["path"], row["size"]))
+        if base is None:
+            continue
+        p50_ratio = row["p50_ms"] / base["p50_ms"] if base["p50_ms"] else None
+        p99_ratio = row["p99_ms"] / base["p99_ms"] if base["p99_ms"] else None
+        rows.append({
+            "path": row["path"],
+            "size": row["size"],
+            "p50_ratio": round(p50_ratio, 3) if p50_ratio else None,
+            "p99_ratio": round(p99_ratio, 3) if p99_ratio else None,
+            "peak_kib_delta": round(row["peak_kib"] - base["peak_kib"], 1),
+            "regression": bool(p50_ratio and p50_ratio > 1 + threshold),
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="교정 파이프라인 오프라인 벤치마크 (스텁 모델)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="입력 텍스트 길이(자)")
+    parser.add_argument("--paths", nargs="+", choices=PATHS, default=PATHS, help="측정할 경로")
+    parser.add_argument("--repeats", type=int, default=30, help="경로/길이별 측정 횟수")
+    parser.add_argument("--warmup", type=int, default=3, help="측정 전 워밍업 횟수")
+    parser.add_argument(
+        "--min-sample-ms", type=float, default=1.0, help="짧은 경로는 샘플 하나가 이 시간 이상이 되도록 반복 호출"
+    )
+    parser.add_argument("--stub-latency-ms", type=float, default=0.0, help="스텁 모델 호출당 지연 시간")
+    parser.add_argument(
+        "--stub-per-chunk-latency-ms", type=float, default=0.0, help="스텁 모델 청크당 지연 시간"
+    )
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일 경로")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="p50이 이 비율 이상 느려지면 회귀로 표시 (기본 20%%)"
+    )
+    args = parser.parse_args()
+
+    report = run(args)
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        report["comparison"] = {
+            "baseline_revision": baseline.get("meta", {}).get("git_revision", ""),
+            "rows": compare(baseline, report, args.threshold),
+        }
+        print(f"\n=== {report['comparison']['baseline_revision'] or args.compare} 대비 ===")
+        for row in report["comparison"]["rows"]:
+            mark = " <- 회귀" if row["regression"] else ""
+            print(
+                f"{row['path']:>18} {row['size']:>6}자: p50 {row['p50_ratio']}x, "
+                f"p99 {row['p99_ratio']}x, 메모리 {row['peak_kib_delta']:+}KiB{mark}"
+            )
+        regressions = [row for row in report["comparison"]["rows"] if row["regression"]]
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과가 {args.output}에 저장되었습니다.")
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
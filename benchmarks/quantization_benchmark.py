@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+int8 동적 양자화 비교 벤치마크
+tests/test_model_corrections.py의 케이스로 기본 경로(QUANTIZATION=none)와
+QUANTIZATION=int8 경로의 교정 결과 일치도와 지연 시간을 비교합니다.
+
+사용법:
+    python benchmarks/quantization_benchmark.py --repeats 3 --output quantization_results.json
+"""
+
+import argparse
+import difflib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+
+# 프로젝트 루트와 tests 디렉토리를 sys.path에 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+from app.config import settings
+from app.services.advanced_spellcheck_service import AdvancedSpellCheckService
+from test_model_corrections import EXPECTED_CORRECTIONS, TEST_CASES
+
+
+def _state_dict_bytes(model) -> int:
+    import torch
+
+    buffer = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.tell()
+
+
+def _expected_hits(original: str, corrected: str):
+    checked = [(wrong, correct) for wrong, correct in EXPECTED_CORRECTIONS if wrong in original]
+    hits = sum(1 for wrong, correct in checked if wrong not in corrected and correct in corrected)
+    return hits, len(checked)
+
+
+def run_mode(quantization: str, repeats: int) -> dict:
+    """지정한 양자화 설정으로 모델을 로드하고 테스트 케이스를 교정"""
+    settings.QUANTIZATION = quantization
+    service = AdvancedSpellCheckService()
+    # 캐시 없이 모델 추론 시간만 측정
+    service.nodes.chunk_cache = None
+
+    started = time.perf_counter()
+    if not service.ensure_models_loaded():
+        return {"quantization": quantization, "error": "모델 로드 실패"}
+    load_seconds = time.perf_counter() - started
+
+    cases = []
+    for test_name, original_text in TEST_CASES:
+        service.correct_text(original_text, use_cache=False)  # 워밍업
+
+        latencies = []
+        result = None
+        for _ in range(repeats):
+            started = time.perf_counter()
+            result = service.correct_text(original_text, use_cache=False)
+            latencies.append((time.perf_counter() - started) * 1000.0)
+
+        corrected_text = result.get("corrected_text", "")
+        hits, total = _expected_hits(original_text, corrected_text)
+        cases.append({
+            "test_name": test_name,
+            "length": len(original_text),
+            "latency_ms": round(statistics.median(latencies), 1),
+            "latency_min_ms": round(min(latencies), 1),
+            "expected_hits": hits,
+            "expected_total": total,
+            "corrections_count": len(result.get("corrections", [])),
+            "corrected_text": corrected_text,
+        })
+        print(f"[{quantization}] {test_name}: {cases[-1]['latency_ms']}ms, 핵심 교정 {hits}/{total}")
+
+    return {
+        "quantization": quantization,
+        "device": service.get_device_info(),
+        "load_seconds": round(load_seconds, 2),
+        "model_bytes": {
+            settings.MODEL_NAME: _state_dict_bytes(service.base_backend.model),
+            service.LM_MODEL_NAME: _state_dict_bytes(service.refine_backend.model),
+        },
+        "cases": cases,
+    }
+
+
+def compare(baseline: dict, candidate: dict) -> list:
+    """기준 결과 대비 지연 시간 비율과 교정문 일치도 계산"""
+    rows = []
+    for base_case, case in zip(baseline["cases"], candidate["cases"]):
+        rows.append({
+            "test_name": case["test_name"],
+            "speedup": round(base_case["latency_ms"] / case["latency_ms"], 2)
+            if case["latency_ms"]
+            else None,
+            "exact_match": base_case["corrected_text"] == case["corrected_text"],
+            "similarity": round(
+                difflib.SequenceMatcher(
+                    None, base_case["corrected_text"], case["corrected_text"]
+                ).ratio(),
+                4,
+            ),
+            "expected_hits": f"{case['expected_hits']}/{case['expected_total']}"
+            f" (기준 {base_case['expected_hits']}/{base_case['expected_total']})",
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="int8 동적 양자화 정확도/지연 시간 비교")
+    parser.add_argument("--repeats", type=int, default=3, help="케이스별 반복 측정 횟수")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    runs = [run_mode(mode, args.repeats) for mode in ("none", "int8")]
+    report = {"runs": runs}
+
+    if all("error" not in run for run in runs):
+        report["comparison"] = compare(runs[0], runs[1])
+        print("\n=== int8 vs 기본 경로 ===")
+        for row in report["comparison"]:
+            print(
+                f"{row['test_name']}: {row['speedup']}x, 일치 {row['exact_match']}, "
+                f"유사도 {row['similarity']}, 핵심 교정 {row['expected_hits']}"
+            )
+        for name, size in runs[1]["model_bytes"].items():
+            base_size = runs[0]["model_bytes"][name]
+            print(f"{name}: {base_size / 1e6:.1f}MB -> {size / 1e6:.1f}MB")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과가 {args.output}에 저장되었습니다.")
+
+
+if __name__ == "__main__":
+    main()
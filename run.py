@@ -3,11 +3,22 @@ from app.main import app
 from app.config import settings
 
 if __name__ == "__main__":
-   
+    workers = settings.WORKERS
+    if workers > 1 and settings.RELOAD:
+        print("RELOAD=true does not support multiple workers, starting a single worker")
+        workers = 1
+
+    if workers > 1 and settings.SHARED_WEIGHTS and settings.INFERENCE_BACKEND == "torch":
+        # 워커들이 같은 가중치 파일을 mmap으로 공유하도록 시작 전에 한 번만 내보냄
+        from app.services.advanced_spellcheck_service import advanced_spellcheck_service
+
+        advanced_spellcheck_service.prepare_shared_weights()
+
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=True,
+        reload=settings.RELOAD,
+        workers=workers,
         log_level="info"
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,57 @@
+"""
+공용 테스트 픽스처
+모델 다운로드 없이 스텁 백엔드로 교정 서비스와 워크플로우 노드를 만들고,
+테스트 중 바꾼 settings 값은 monkeypatch로 테스트가 끝나면 되돌립니다.
+"""
+
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+
+from app.config import settings
+from app.services.advanced_spellcheck_service import AdvancedSpellCheckService
+from app.utils import diff_match_patch as dmp_module
+from app.workflow.nodes import WorkflowNodes
+
+
+def _apply_settings(monkeypatch, overrides):
+    """요청 간 배치와 청크 캐시는 끄고 overrides(설정 이름=값)를 적용"""
+    values = {"MICRO_BATCHING": False, "CHUNK_CACHE_ENABLED": False, **overrides}
+    for name, value in values.items():
+        monkeypatch.setattr(settings, name, value)
+
+
+@pytest.fixture
+def stub_service(monkeypatch):
+    """스텁 백엔드로 모델을 로드한 AdvancedSpellCheckService를 만드는 함수
+
+    사용 예: service = stub_service(GENERATION_BATCH_SIZE=2)
+    """
+
+    def make(**overrides) -> AdvancedSpellCheckService:
+        _apply_settings(
+            monkeypatch, {"INFERENCE_BACKEND": "stub", "SKIP_MODEL_MODE": "off", **overrides}
+        )
+        service = AdvancedSpellCheckService()
+        assert service.ensure_models_loaded()
+        return service
+
+    return make
+
+
+@pytest.fixture
+def workflow_nodes(monkeypatch):
+    """주어진 백엔드로 WorkflowNodes를 만드는 함수
+
+    사용 예: nodes = workflow_nodes(backend, DECODING_POLICY="adaptive")
+    """
+
+    def make(base_backend=None, refine_backend=None, **overrides) -> WorkflowNodes:
+        _apply_settings(monkeypatch, overrides)
+        return WorkflowNodes(base_backend, refine_backend, dmp_module.diff_match_patch())
+
+    return make
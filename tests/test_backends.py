@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+교정 백엔드 테스트
+모델을 다운로드하지 않는 스텁 백엔드로 교정 파이프라인 전체가 동작하는지 확인합니다.
+"""
+
+import sys
+import os
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.backends import (
+    BackendCapabilities,
+    CorrectionBackend,
+    Seq2SeqBackend,
+    StubCorrectionBackend,
+)
+from app.config import settings
+from app.services.advanced_spellcheck_service import AdvancedSpellCheckService
+from app.utils import diff_match_patch as dmp_module
+from app.utils.correction_rules import CorrectionRules
+from app.workflow.nodes import WorkflowNodes
+
+
+class SingleChunkBackend(StubCorrectionBackend):
+    """배치를 지원하지 않는 백엔드"""
+
+    capabilities = BackendCapabilities(batching=False, requires_model_files=False)
+
+    def correct(self, chunks, **options):
+        assert len(chunks) == 1
+        return super().correct(chunks, **options)
+
+
+def test_backends_implement_protocol():
+    """백엔드 구현이 CorrectionBackend 인터페이스를 만족하는지 테스트"""
+    print("=== 인터페이스 테스트 ===")
+    for backend in [StubCorrectionBackend(), Seq2SeqBackend(None, None)]:
+        print(f"{backend.name}: {backend.capabilities}")
+        assert isinstance(backend, CorrectionBackend)
+
+
+def test_stub_backend_is_deterministic():
+    """스텁 백엔드가 지연 시간을 흉내내고 같은 입력에 같은 출력을 반환하는지 테스트"""
+    print("=== 스텁 백엔드 테스트 ===")
+    backend = StubCorrectionBackend(latency_ms=20, transform=str.upper)
+
+    started = time.perf_counter()
+    outputs = backend.correct(["abc", "def"], num_beams=3)
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+    print(f"출력: {outputs}, {elapsed_ms:.1f}ms")
+    assert outputs == ["ABC", "DEF"] == backend.correct(["abc", "def"])
+    assert elapsed_ms >= 20
+    assert (backend.calls, backend.chunks) == (2, 4)
+
+
+def test_non_batching_backend_called_per_chunk():
+    """배치를 지원하지 않는 백엔드는 청크별로 호출되는지 테스트"""
+    print("=== 배치 미지원 백엔드 테스트 ===")
+    backend = SingleChunkBackend()
+    nodes = WorkflowNodes(backend, None, dmp_module.diff_match_patch())
+    nodes.batch_scheduler = None
+
+    chunks = ["첫 번째 문장입니다.", "두 번째 문장입니다.", "세 번째 문장입니다."]
+    assert nodes.correct_chunks(chunks) == chunks
+    assert backend.calls == 3
+
+
+def test_pipeline_runs_with_stub_backend():
+    """INFERENCE_BACKEND=stub이면 모델 없이 전체 교정 파이프라인이 실행되는지 테스트"""
+    print("=== 스텁 백엔드 파이프라인 테스트 ===")
+    original_backend = settings.INFERENCE_BACKEND
+    settings.INFERENCE_BACKEND = "stub"
+    try:
+        service = AdvancedSpellCheckService()
+        text = "안뇽하세요. 오늘은 날씨가 좋내요."
+        result = service.correct_text(text, use_cache=False)
+    finally:
+        settings.INFERENCE_BACKEND = original_backend
+
+    print(f"교정 결과: {result['corrected_text']}")
+    assert service.is_model_loaded()
+    assert service.get_device_info() == "cpu"
+    # 스텁 모델은 입력을 그대로 반환하므로 사전 교정 결과만 반영됨
+    assert result["corrected_text"] == CorrectionRules.apply_comprehensive_corrections(text)
+    assert service.nodes.base_backend.chunks > 0
+    assert service.nodes.refine_backend.calls == 1
+
+
+def test_long_text_refined_per_chunk():
+    """300자를 넘는 텍스트도 청크별로 배치 LLM 교정이 적용되는지 테스트"""
+    print("=== 청크별 LLM 교정 테스트 ===")
+    original_backend = settings.INFERENCE_BACKEND
+    settings.INFERENCE_BACKEND = "stub"
+    try:
+        service = AdvancedSpellCheckService()
+        service.ensure_models_loaded()
+        refine_backend = service.nodes.refine_backend
+        refine_backend.transform = lambda chunk: chunk.replace("문장", "글")
+
+        text = "이 문장은 긴 문서의 일부입니다. " * 40
+        result = service.correct_text(text, use_cache=False)
+        events = list(service.stream_correction(text))
+    finally:
+        settings.INFERENCE_BACKEND = original_backend
+
+    total_chunks = events[0]["data"]["total"]
+    print(f"청크 수: {total_chunks}, LLM 호출: {refine_backend.calls}회")
+    assert len(text) > 300 and total_chunks > 1
+    assert "문장" not in result["corrected_text"]
+    assert events[-1]["data"]["corrected_text"] == result["corrected_text"]
+    assert all("문장" not in e["data"]["corrected"] for e in events if e["event"] == "chunk")
+
+
+if __name__ == "__main__":
+    print("교정 백엔드 테스트")
+    print("=" * 50)
+
+    test_backends_implement_protocol()
+    print()
+
+    test_stub_backend_is_deterministic()
+    print()
+
+    test_non_batching_backend_called_per_chunk()
+    print()
+
+    test_pipeline_runs_with_stub_backend()
+    print()
+
+    test_long_text_refined_per_chunk()
+
+    print("\n테스트 완료!")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+일괄 교정 테스트
+여러 텍스트의 청크가 공유 모델 배치로 교정되고, 실패한 항목이 나머지 항목에 영향을 주지 않는지 확인합니다.
+"""
+
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.config import settings
+from app.utils.correction_rules import CorrectionRules
+
+TEXTS = [
+    "안뇽하세요. 오늘은 날씨가 좋내요.",
+    "회의는 오후 3시에 시작합니다.",
+    "맞춤밥 검사 시스템을 임력해보세요. " * 12,
+]
+
+
+@pytest.fixture
+def service(stub_service):
+    service = stub_service()
+    service.nodes.refine_backend.transform = lambda chunk: chunk.replace("시스템", "도구")
+    return service
+
+
+def test_batch_matches_single_requests(service):
+    """일괄 교정 결과가 텍스트별 correct_text 결과와 같고 모델 호출은 공유되는지 테스트"""
+    print("=== 공유 배치 교정 테스트 ===")
+    base_backend = service.nodes.base_backend
+
+    batch = service.correct_batch(TEXTS, use_cache=False)
+    batch_calls = base_backend.calls
+    print(f"일괄 교정 모델 호출: {batch_calls}회")
+
+    for text, result in zip(TEXTS, batch["results"]):
+        expected = service.correct_text(text, use_cache=False)
+        assert result == expected
+    single_calls = base_backend.calls - batch_calls
+    print(f"텍스트별 교정 모델 호출: {single_calls}회")
+    assert batch_calls < single_calls
+    assert "도구" in batch["results"][2]["corrected_text"]
+
+
+def test_item_errors_do_not_fail_batch(service):
+    """빈 텍스트와 최대 길이 초과 항목은 항목별 오류로 반환하고 나머지는 교정"""
+    print("=== 항목별 오류 테스트 ===")
+    texts = [TEXTS[0], "   ", "가" * (settings.MAX_LENGTH + 1), TEXTS[1]]
+
+    results = service.correct_batch(texts)["results"]
+    for result in results:
+        print(result.get("error") or result["corrected_text"])
+    assert "error" in results[1] and "error" in results[2]
+    # 스텁 모델은 입력을 그대로 반환하므로 사전 교정 결과만 반영됨
+    assert results[0]["corrected_text"] == CorrectionRules.apply_comprehensive_corrections(TEXTS[0])
+    assert results[3]["corrected_text"] == TEXTS[1]
+
+    # 결과 캐시를 correct_text와 공유
+    assert service.get_cache_stats()["entries"] == 2
+    assert service.correct_text(TEXTS[1]) == results[3]
+    assert service.get_cache_stats()["hits"] == 1
+
+
+def test_batch_endpoint(service, monkeypatch):
+    """/api/v1/spellcheck/batch가 id와 순서를 유지하고 항목별 오류를 반환하는지 테스트"""
+    print("=== 일괄 교정 API 테스트 ===")
+    monkeypatch.setattr(main, "spellcheck_service", service)
+    client = TestClient(main.app)
+    response = client.post(
+        "/api/v1/spellcheck/batch",
+        json={"items": [{"id": "a", "text": TEXTS[0]}, {"text": ""}, {"id": "c", "text": TEXTS[1]}]},
+    )
+    too_many = client.post(
+        "/api/v1/spellcheck/batch",
+        json={"items": [{"text": "가"}] * (settings.BATCH_MAX_ITEMS + 1)},
+    )
+
+    body = response.json()
+    print(body)
+    assert response.status_code == 200
+    assert (body["succeeded"], body["failed"]) == (2, 1)
+    assert [result["id"] for result in body["results"]] == ["a", None, "c"]
+    assert [result["index"] for result in body["results"]] == [0, 1, 2]
+    assert body["results"][0]["corrections"]
+    assert body["results"][1]["error"] and body["results"][1]["corrected_text"] is None
+    assert too_many.status_code == 400
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+마이크로 배칭 스케줄러 테스트
+여러 스레드에서 동시에 들어온 청크가 하나의 배치로 묶이는지 확인합니다.
+"""
+
+import sys
+import os
+import threading
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.services.batch_scheduler import MicroBatchScheduler
+
+
+def test_cross_request_batching():
+    """동시 요청 청크 병합 테스트"""
+    print("=== 요청 간 배치 병합 테스트 ===")
+
+    batch_sizes = []
+
+    def batch_fn(texts):
+        batch_sizes.append(len(texts))
+        time.sleep(0.05)
+        return [text.upper() for text in texts]
+
+    scheduler = MicroBatchScheduler(batch_fn, max_batch_size=8, max_wait_ms=50)
+    results = {}
+
+    def worker(i):
+        futures = scheduler.submit([f"req{i}-a", f"req{i}-b"])
+        results[i] = [future.result() for future in futures]
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(f"배치 크기: {batch_sizes}")
+    for i in range(4):
+        assert results[i] == [f"REQ{i}-A", f"REQ{i}-B"]
+    assert sum(batch_sizes) == 8
+    assert len(batch_sizes) < 4
+    print("PASS 요청별 결과가 올바르게 반환되었습니다")
+
+
+def test_batch_error_propagation():
+    """배치 실패 시 예외 전달 테스트"""
+    print("=== 배치 실패 전달 테스트 ===")
+
+    def batch_fn(texts):
+        raise RuntimeError("model failure")
+
+    scheduler = MicroBatchScheduler(batch_fn, max_batch_size=4, max_wait_ms=1)
+    futures = scheduler.submit(["가", "나"])
+
+    for future in futures:
+        try:
+            future.result()
+            assert False, "예외가 전달되지 않았습니다"
+        except RuntimeError as e:
+            assert str(e) == "model failure"
+    print("PASS 실패가 각 청크로 전달되었습니다")
+
+
+def test_params_are_not_mixed():
+    """다른 생성 파라미터는 같은 배치에 섞이지 않는지 테스트"""
+    print("=== 파라미터별 배치 분리 테스트 ===")
+
+    seen = []
+
+    def batch_fn(texts, num_beams=1):
+        seen.append((num_beams, list(texts)))
+        return texts
+
+    scheduler = MicroBatchScheduler(batch_fn, max_batch_size=8, max_wait_ms=20)
+    greedy = scheduler.submit(["a", "b"], {"num_beams": 1})
+    beam = scheduler.submit(["c"], {"num_beams": 3})
+    assert [f.result() for f in greedy] == ["a", "b"]
+    assert [f.result() for f in beam] == ["c"]
+
+    for num_beams, texts in seen:
+        expected = ["c"] if num_beams == 3 else ["a", "b"]
+        assert texts == expected
+    print(f"PASS 배치 구성: {seen}")
+
+
+def test_idle_request_is_not_delayed():
+    """다른 요청이 없으면 최대 대기 시간을 기다리지 않고 바로 실행하는지 테스트"""
+    print("=== 단독 요청 즉시 실행 테스트 ===")
+
+    scheduler = MicroBatchScheduler(lambda texts: texts, max_batch_size=8, max_wait_ms=500)
+    for _ in range(3):
+        started = time.perf_counter()
+        futures = scheduler.submit(["가", "나"])
+        assert [future.result() for future in futures] == ["가", "나"]
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"단독 요청 지연: {elapsed_ms:.1f}ms")
+        assert elapsed_ms < 100
+    print("PASS 단독 요청이 대기 없이 실행되었습니다")
+
+
+if __name__ == "__main__":
+    print("마이크로 배칭 스케줄러 테스트")
+    print("=" * 50)
+    test_cross_request_batching()
+    test_batch_error_propagation()
+    test_params_are_not_mixed()
+    test_idle_request_is_not_delayed()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+배치 생성 테스트
+길이가 다른 청크를 GENERATION_BATCH_SIZE 단위로 묶어 생성하고,
+패딩된 배치 출력이 입력 순서대로 각 청크에 돌아가는지 확인합니다.
+"""
+
+import sys
+import os
+import math
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+import torch
+
+from app.backends import Seq2SeqBackend, StubCorrectionBackend
+from app.utils.correction_rules import CorrectionRules
+
+CHUNKS = [
+    "짧은 문장입니다.",
+    "안뇽하세요 이 문장은 조금 더 길게 이어지는 두 번째 청크입니다.",
+    "세 번째.",
+    "네 번째 청크는 여러 어절로 이루어진 가장 긴 문장으로 배치 안에서 패딩 기준이 됩니다.",
+    "다섯 번째 청크입니다.",
+    "여섯 번째 청크는 중간 길이입니다.",
+    "일곱 번째.",
+]
+BATCH_SIZE = 3
+
+
+class RecordingBackend(StubCorrectionBackend):
+    """배치별 입력을 기록하고 청크마다 다른 출력을 반환"""
+
+    def __init__(self):
+        super().__init__(transform=lambda chunk: chunk.replace("입니다", "이에요"))
+        self.batches = []
+
+    def correct(self, chunks, **options):
+        self.batches.append(list(chunks))
+        return super().correct(chunks, **options)
+
+
+class WordTokenizer:
+    """어절마다 id를 붙이고 가장 긴 입력에 맞춰 오른쪽을 패딩하는 토크나이저"""
+
+    pad_token_id = 0
+    eos_token_id = 1
+
+    def __init__(self):
+        self.vocab = {}
+
+    def __call__(self, texts, **options):
+        rows = [[self.vocab.setdefault(word, len(self.vocab) + 2) for word in text.split()] for text in texts]
+        width = max(len(row) for row in rows)
+        input_ids = torch.tensor([row + [self.pad_token_id] * (width - len(row)) for row in rows])
+        return {"input_ids": input_ids, "attention_mask": (input_ids != self.pad_token_id).long()}
+
+    def batch_decode(self, outputs, **options):
+        words = {token_id: word for word, token_id in self.vocab.items()}
+        return [" ".join(words[int(token_id)] for token_id in row if int(token_id) in words) for row in outputs]
+
+
+class EchoModel:
+    """패딩된 입력을 그대로 출력하고 배치 모양을 기록"""
+
+    def __init__(self):
+        self.shapes = []
+
+    def generate(self, input_ids=None, attention_mask=None, **options):
+        self.shapes.append(tuple(input_ids.shape))
+        return input_ids
+
+
+def test_batches_split_back_in_order(workflow_nodes):
+    """배치 크기 단위로 묶어 생성하고 각 출력이 자기 청크에 돌아가는지 테스트"""
+    print("=== 배치 생성 순서 테스트 ===")
+    backend = RecordingBackend()
+    nodes = workflow_nodes(backend, GENERATION_BATCH_SIZE=BATCH_SIZE, DECODING_POLICY="beam")
+
+    outputs = nodes.correct_chunks(CHUNKS)
+    texts_after_dict = [CorrectionRules.apply_comprehensive_corrections(chunk) for chunk in CHUNKS]
+    print(f"배치 크기: {[len(batch) for batch in backend.batches]}")
+
+    assert len(backend.batches) == math.ceil(len(CHUNKS) / BATCH_SIZE)
+    assert [len(batch) for batch in backend.batches] == [3, 3, 1]
+    # 배치는 입력 순서대로 연속된 청크로 구성
+    assert [text for batch in backend.batches for text in batch] == texts_after_dict
+    assert outputs == [text.replace("입니다", "이에요") for text in texts_after_dict]
+
+
+def test_padded_batch_outputs_keep_input_order(workflow_nodes):
+    """패딩된 배치의 출력 행이 입력 순서대로 디코딩되어 각 청크에 돌아가는지 테스트"""
+    print("=== 패딩 배치 출력 순서 테스트 ===")
+    tokenizer = WordTokenizer()
+    model = EchoModel()
+    nodes = workflow_nodes(
+        Seq2SeqBackend(model, tokenizer), GENERATION_BATCH_SIZE=BATCH_SIZE, DECODING_POLICY="beam"
+    )
+
+    outputs = nodes.correct_chunks(CHUNKS)
+    texts_after_dict = [CorrectionRules.apply_comprehensive_corrections(chunk) for chunk in CHUNKS]
+    print(f"배치 모양: {model.shapes}")
+
+    # 배치마다 가장 긴 청크의 어절 수로 패딩
+    expected_shapes = [
+        (len(batch), max(len(text.split()) for text in batch))
+        for batch in (texts_after_dict[start:start + BATCH_SIZE] for start in range(0, len(CHUNKS), BATCH_SIZE))
+    ]
+    assert model.shapes == expected_shapes
+    assert outputs == texts_after_dict
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+청크 캐시 테스트
+문서의 한 청크만 고쳐 다시 보내면 바뀐 청크만 모델로 교정하고,
+결과는 캐시 없이 교정한 것과 같은지 확인합니다.
+"""
+
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+
+from app.utils.text_processor import TextProcessor
+
+SENTENCES = [
+    f"{i}번째 문단은 여러 문장으로 이루어진 긴 문서의 일부이며 맞춤밥 검사를 기다립니다. " * 3
+    for i in range(6)
+]
+TEXT = "\n\n".join(SENTENCES)
+EDITED_TEXT = TEXT.replace("3번째 문단은", "3번째 문단은 새로 고친", 1)
+
+
+def _record_inputs(backend):
+    """백엔드에 들어간 청크를 호출 순서대로 기록"""
+    received = []
+    correct = backend.correct
+
+    def recording_correct(chunks, **options):
+        received.extend(chunks)
+        return correct(chunks, **options)
+
+    backend.correct = recording_correct
+    return received
+
+
+def _with_refine_transform(service):
+    service.nodes.refine_backend.transform = lambda chunk: chunk.replace("문서", "글")
+    return service
+
+
+def test_only_changed_chunk_is_generated(stub_service):
+    """한 청크만 바꿔 다시 보내면 기본/LLM 백엔드 모두 바뀐 청크만 처리하는지 테스트"""
+    print("=== 청크 캐시 재사용 테스트 ===")
+    service = _with_refine_transform(stub_service(CHUNK_CACHE_ENABLED=True))
+    chunks = TextProcessor.smart_split_text(TEXT)
+    edited_chunks = TextProcessor.smart_split_text(EDITED_TEXT)
+    changed = [edited for chunk, edited in zip(chunks, edited_chunks) if chunk != edited]
+    print(f"청크 {len(chunks)}개, 바뀐 청크 {len(changed)}개")
+    assert len(chunks) == len(edited_chunks) > 2
+    assert len(changed) == 1
+
+    first = service.correct_text(TEXT, use_cache=False)
+    assert "error" not in first
+
+    base_inputs = _record_inputs(service.nodes.base_backend)
+    refine_inputs = _record_inputs(service.nodes.refine_backend)
+    result = service.correct_text(EDITED_TEXT, use_cache=False)
+    print(f"기본 교정 입력 {len(base_inputs)}개, LLM 교정 입력 {len(refine_inputs)}개")
+
+    assert len(base_inputs) == 1 and "새로 고친" in base_inputs[0]
+    assert len(refine_inputs) == 1 and "새로 고친" in refine_inputs[0]
+
+    # 캐시 없이 교정한 결과와 같음
+    uncached = _with_refine_transform(stub_service()).correct_text(EDITED_TEXT, use_cache=False)
+    assert result["corrected_text"] == uncached["corrected_text"]
+    assert result["corrections"] == uncached["corrections"]
+    assert "글" in result["corrected_text"]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
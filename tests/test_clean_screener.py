@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+깨끗한 청크 사전 검사 테스트
+모델이 고치지 않은 문장을 기억했다가 같은 문장으로만 이루어진 청크는 모델 호출을 생략하는지 확인합니다.
+"""
+
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.backends import StubCorrectionBackend
+from app.utils import diff_match_patch as dmp_module
+from app.utils.bloom_filter import BloomFilter
+from app.utils.clean_chunk_screener import CleanChunkScreener
+from app.workflow.nodes import WorkflowNodes
+
+
+def test_bloom_filter_error_rate():
+    """추가한 항목은 항상 포함되고 거짓 양성률이 설정값 근처인지 테스트"""
+    print("=== Bloom 필터 테스트 ===")
+    bloom = BloomFilter(capacity=5000, error_rate=0.01)
+    for i in range(5000):
+        bloom.add(f"문장 {i}")
+
+    assert all(f"문장 {i}" in bloom for i in range(5000))
+    false_positives = sum(f"다른 문장 {i}" in bloom for i in range(20000))
+    rate = false_positives / 20000
+    print(f"거짓 양성률: {rate:.4f}, {bloom.get_stats()}")
+    assert rate < 0.02
+
+
+def test_learned_sentences_are_skipped():
+    """모델이 바꾸지 않은 문장만 학습하고, 모든 문장이 학습된 청크만 건너뜀"""
+    print("=== 문장 학습 테스트 ===")
+    screener = CleanChunkScreener("bloom")
+    screener.learn(
+        "회의는 오후 3시에 시작합니다. 자료를 미리 확인해 주세요.",
+        "회의는 오후 3시에 시작합니다. 자료를 미리 확인해 주세요!",
+    )
+
+    assert screener.should_skip("회의는 오후 3시에 시작합니다.", "회의는 오후 3시에 시작합니다.")
+    assert not screener.should_skip(
+        "회의는 오후 3시에 시작합니다. 자료를 미리 확인해 주세요.",
+        "회의는 오후 3시에 시작합니다. 자료를 미리 확인해 주세요.",
+    )
+    stats = screener.get_stats()
+    print(f"통계: {stats}")
+    assert stats["learned_sentences"] == 1
+    assert stats["skip_rate"] == 0.5
+
+
+def test_heuristic_mode():
+    """heuristic 모드는 규칙 적용이나 의심 패턴이 없는 청크를 건너뜀"""
+    print("=== 휴리스틱 검사 테스트 ===")
+    screener = CleanChunkScreener("heuristic")
+
+    clean = "보고서는 금요일까지 제출해 주시기 바랍니다."
+    assert CleanChunkScreener.suspicion_score(clean, clean) == 0
+    assert screener.should_skip(clean, clean)
+
+    test_cases = [
+        ("안뇽하세요", "안녕하세요"),  # 사전 규칙 적용됨
+        ("아버지가방에들어가신다고합니다", "아버지가방에들어가신다고합니다"),  # 띄어쓰기 없음
+        ("ㅋㅋ 알겠어요", "ㅋㅋ 알겠어요"),  # 자모
+        ("확인했습니다 .", "확인했습니다 ."),  # 문장부호 앞 공백
+    ]
+    for chunk, text_after_dict in test_cases:
+        score = CleanChunkScreener.suspicion_score(chunk, text_after_dict)
+        print(f"{chunk} -> 점수 {score}")
+        assert score > 0
+        assert not screener.should_skip(chunk, text_after_dict)
+
+
+def test_nodes_skip_model_for_known_clean_chunks():
+    """이미 깨끗하다고 확인된 문장은 다시 교정할 때 모델을 호출하지 않음"""
+    print("=== 워크플로우 모델 생략 테스트 ===")
+    backend = StubCorrectionBackend()
+    nodes = WorkflowNodes(backend, None, dmp_module.diff_match_patch())
+    nodes.batch_scheduler = None
+    nodes.chunk_cache = None
+    nodes.clean_screener = CleanChunkScreener("bloom")
+
+    first = ["일정이 변경되었습니다. 확인 부탁드립니다.", "감사합니다."]
+    assert nodes.correct_chunks(first) == first
+    assert backend.chunks == 2
+
+    # 학습된 문장만으로 구성된 새 청크
+    second = ["확인 부탁드립니다. 감사합니다.", "새로운 문장입니다."]
+    assert nodes.correct_chunks(second) == second
+    assert backend.chunks == 3
+
+    stats = nodes.get_prescreen_stats()
+    print(f"통계: {stats}")
+    assert stats["enabled"] and stats["skipped_chunks"] == 1
+
+
+if __name__ == "__main__":
+    print("깨끗한 청크 사전 검사 테스트")
+    print("=" * 50)
+
+    test_bloom_filter_error_rate()
+    print()
+
+    test_learned_sentences_are_skipped()
+    print()
+
+    test_heuristic_mode()
+    print()
+
+    test_nodes_skip_model_for_known_clean_chunks()
+
+    print("\n테스트 완료!")
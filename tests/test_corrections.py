@@ -6,6 +6,8 @@
 
 import sys
 import os
+import random
+import re
 
 # 프로젝트 루트를 sys.path에 추가
 sys.path.insert(0, os.path.dirname(__file__))
@@ -38,6 +40,56 @@ def test_correction_rules():
         print()
 
 
+def test_compiled_rule_precedence():
+    """컴파일된 교정 규칙이 사전 순서대로 적용되는지 테스트 (앞 교정 결과에 뒤 항목이 이어서 적용됨)"""
+    print("=== 규칙 우선순위 테스트 ===")
+    
+    test_cases = [
+        ("잘 됬습니다", "잘 됐습니다"),
+        ("체크해주세요 그리고 체크", "확인해주세요 그리고 확인"),
+        ("안뇽 안뇽하세요", "안녕 안녕하세요"),
+        # '이가' → '이' 교정으로 생긴 '가이'에 뒤 항목 '가이' → '가'가 이어서 적용됨
+        ("가이가", "가"),
+        # 사전 교정 결과('한시간' → '한 시간')에 띄어쓰기 패턴이 이어서 적용됨
+        ("한시간 이나", "한 시간이나"),
+        ("3시간이나 기다렸고 오늘 많이와서 좋다", "3 시간이나 기다렸고 오늘 많이 와서 좋다"),
+        ("세주일전 회사 에서", "세 주일 전 회사에서"),
+    ]
+    
+    for i, (input_text, expected) in enumerate(test_cases, 1):
+        result = CorrectionRules.apply_comprehensive_corrections(input_text)
+        status = "PASS" if result == expected else "FAIL"
+        print(f"테스트 {i}: {status} {input_text} -> {result}")
+        assert result == expected
+
+
+def _apply_rules_in_order(text):
+    """컴파일 전의 교정 방식: 사전 항목과 띄어쓰기 패턴을 하나씩 순서대로 적용"""
+    for wrong_form, correct_form in CorrectionRules.COMPREHENSIVE_CORRECTIONS.items():
+        text = text.replace(wrong_form, correct_form)
+    for pattern, replacement in CorrectionRules.SPACING_PATTERNS:
+        text = re.sub(pattern, replacement, text)
+    return text
+
+
+def test_compiled_rules_match_sequential_rules():
+    """무작위로 조합한 입력에서 컴파일된 규칙이 순서대로 적용한 결과와 같은지 테스트"""
+    print("=== 순차 적용 결과 비교 테스트 ===")
+    
+    rng = random.Random(0)
+    pieces = list(CorrectionRules.COMPREHENSIVE_CORRECTIONS) + [
+        "한", "3", "시간", "이나", "달동안", "주일전", "회사", " 에서", "많이", "와서", " ",
+    ]
+    chars = sorted(set("".join(pieces)))
+    for _ in range(5000):
+        text = "".join(
+            rng.choice(pieces) if rng.random() < 0.6 else rng.choice(chars)
+            for _ in range(rng.randint(1, 12))
+        )
+        assert CorrectionRules.apply_comprehensive_corrections(text) == _apply_rules_in_order(text), text
+    print("PASS 5000개 입력 일치")
+
+
 def test_text_splitting():
     """텍스트 분할 테스트"""
     print("=== 텍스트 분할 테스트 ===")
@@ -133,6 +185,12 @@ if __name__ == "__main__":
     test_correction_rules()
     print()
     
+    test_compiled_rule_precedence()
+    print()
+    
+    test_compiled_rules_match_sequential_rules()
+    print()
+    
     test_text_splitting()
     print()
     
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+적응형 디코딩 정책 테스트
+greedy 디코딩을 먼저 시도하고 검증에 실패한 청크만 beam search로 재생성하는지 확인합니다.
+"""
+
+import sys
+import os
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+import torch
+
+from app.backends import BackendCapabilities, Seq2SeqBackend, StubCorrectionBackend
+from app.workflow.nodes import WorkflowNodes
+
+SHORT_CHUNK = "오늘은 날씨가 좋습니다."
+FAILING_CHUNK = "그리디 출력이 깨지는 문장입니다."
+LONG_CHUNK = "안뇽하세요 " + "긴 문장이 이어집니다. " * 15
+
+
+class RecordingBackend(StubCorrectionBackend):
+    """호출별 num_beams를 기록하고, greedy일 때 FAILING_CHUNK에 깨진 출력을 반환"""
+
+    capabilities = BackendCapabilities(requires_model_files=False)
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def correct(self, chunks, **options):
+        self.requests.append((options["num_beams"], list(chunks)))
+        greedy = options["num_beams"] == 1
+        return [
+            "@@@" if greedy and chunk == FAILING_CHUNK else chunk
+            for chunk in super().correct(chunks, **options)
+        ]
+
+
+def test_greedy_first_and_escalation(workflow_nodes):
+    """짧은 청크는 greedy, 실패한 청크는 beam으로 재생성, 긴 청크는 바로 beam"""
+    print("=== 적응형 디코딩 테스트 ===")
+    backend = RecordingBackend()
+    nodes = workflow_nodes(backend, DECODING_POLICY="adaptive")
+
+    outputs = nodes.correct_chunks([SHORT_CHUNK, FAILING_CHUNK, LONG_CHUNK])
+    for num_beams, chunks in backend.requests:
+        print(f"num_beams={num_beams}: {len(chunks)}개 청크")
+
+    assert backend.requests[0] == (1, [SHORT_CHUNK, FAILING_CHUNK])
+    beam_chunks = backend.requests[1][1]
+    assert backend.requests[1][0] == WorkflowNodes.BASE_GENERATION_CONFIG["num_beams"]
+    assert FAILING_CHUNK in beam_chunks and SHORT_CHUNK not in beam_chunks
+    assert len(beam_chunks) == 2  # 실패한 greedy 청크 + 사전 교정된 긴 청크
+    assert outputs[:2] == [SHORT_CHUNK, FAILING_CHUNK]
+
+    stats = nodes.get_decoding_stats()
+    print(f"통계: {stats}")
+    assert stats["greedy"]["chunks"] == 2
+    assert stats["beam"]["chunks"] == 2
+    assert stats["escalations"] == 1
+    assert stats["escalation_rate"] == 0.5
+
+
+def test_beam_policy_uses_beam_only(workflow_nodes):
+    """DECODING_POLICY=beam(기본값)이면 모든 청크를 beam search로 생성"""
+    print("=== beam 정책 테스트 ===")
+    backend = RecordingBackend()
+    nodes = workflow_nodes(backend, DECODING_POLICY="beam")
+    nodes.correct_chunks([SHORT_CHUNK, FAILING_CHUNK])
+
+    assert [num_beams for num_beams, _ in backend.requests] == [3]
+    stats = nodes.get_decoding_stats()
+    assert stats["policy"] == "beam"
+    assert stats["escalations"] == 0
+
+
+class FakeTokenizer:
+    pad_token_id = 0
+    eos_token_id = 1
+
+    def __call__(self, texts, **options):
+        lengths = [len(text.split()) for text in texts]
+        width = max(lengths)
+        mask = torch.tensor([[1] * n + [0] * (width - n) for n in lengths])
+        return {"input_ids": mask * 5, "attention_mask": mask}
+
+    def batch_decode(self, outputs, **options):
+        return ["출력" for _ in outputs]
+
+
+class FakeModel:
+    def __init__(self):
+        self.max_new_tokens = None
+
+    def generate(self, input_ids=None, attention_mask=None, **options):
+        self.max_new_tokens = options["max_new_tokens"]
+        return input_ids
+
+
+def test_max_new_tokens_from_token_length():
+    """생성 길이가 문자 수가 아니라 토큰 수 기준으로 계산되는지 테스트"""
+    print("=== 토큰 기반 생성 길이 테스트 ===")
+    model = FakeModel()
+    backend = Seq2SeqBackend(model, FakeTokenizer())
+
+    backend.correct(["토큰 네 개 입력", "두 개"], max_new_tokens_ratio=1.5, max_new_tokens_margin=4)
+    print(f"max_new_tokens: {model.max_new_tokens}")
+    assert model.max_new_tokens == 4 * 1.5 + 4
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
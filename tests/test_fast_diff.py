@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+빠른 diff 테스트
+청크/어절 단위 diff(DIFF_ENGINE=fast)가 청크로 나눠 교정한 문서에서도 기존 diff_match_patch 경로와
+같은 교정 목록을 만들고, 전혀 다른 긴 텍스트에서도 Diff_Timeout까지 가지 않고 끝나는지 확인합니다.
+"""
+
+import sys
+import os
+import random
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+
+from app.utils.correction_rules import CorrectionRules
+from app.utils.fast_diff import FastDiff, _myers
+from app.utils.text_processor import TextProcessor
+from test_model_corrections import TEST_CASES
+
+# 무작위 오타에 쓰는 글자 (공백과 문장 부호 포함)
+PERTURB_CHARS = "가나다라마바사아자차카타파하녕뇽요세 .,"
+# 청크 앞뒤에 모델이 덧붙이는 어절 (청크 경계에 걸친 편집)
+SEAM_WORDS = ["임력하면, ", "사용자가 ", "고치는 ", "또한, ", "예를 들어 "]
+
+
+def test_matches_diff_match_patch(workflow_nodes):
+    """사전 교정 결과에 대해 기존 diff_main + diff_cleanupSemantic과 같은 교정 목록인지 테스트"""
+    print("=== 기존 diff와 결과 비교 테스트 ===")
+    fast, dmp = workflow_nodes(DIFF_ENGINE="fast"), workflow_nodes(DIFF_ENGINE="dmp")
+    for name, text in TEST_CASES:
+        corrected = CorrectionRules.apply_comprehensive_corrections(text)
+        expected = dmp.diff_corrections(text, corrected)
+        assert fast.diff_corrections(text, corrected) == expected, name
+    print(f"{len(TEST_CASES)}개 케이스 일치")
+
+    # 어절 정렬과 글자 정렬이 다른 경우 (반복되는 어절, 어절 끝 공백 변경)
+    original = "거기애 안뇽하세요 를 안녕하세요 로 재대로"
+    corrected = "거기에 안녕하세요 를녕안녕하세요 로 제대로"
+    assert fast.diff_corrections(original, corrected) == dmp.diff_corrections(original, corrected)
+
+
+def _perturb(rng, text, edits):
+    """text의 임의 위치에 글자 치환/삽입/삭제를 edits번 적용"""
+    chars = list(text)
+    for _ in range(edits):
+        i = rng.randrange(len(chars) + 1)
+        op = rng.random()
+        if op < 0.4 and i < len(chars):
+            chars[i] = rng.choice(PERTURB_CHARS)
+        elif op < 0.7:
+            chars.insert(i, rng.choice(PERTURB_CHARS))
+        elif i < len(chars):
+            del chars[i]
+    return "".join(chars)
+
+
+def test_matches_diff_match_patch_randomized(workflow_nodes):
+    """오타를 무작위로 넣은 원문/교정문에서도 기존 diff와 같은 교정 목록인지 테스트"""
+    print("=== 무작위 입력 diff 비교 테스트 ===")
+    fast, dmp = workflow_nodes(DIFF_ENGINE="fast"), workflow_nodes(DIFF_ENGINE="dmp")
+    rng = random.Random(0)
+    cases = 600
+    for case in range(cases):
+        _, text = rng.choice(TEST_CASES)
+        edits = rng.choice((3, 10, 30))
+        original = _perturb(rng, text, rng.randint(1, edits))
+        corrected = CorrectionRules.apply_comprehensive_corrections(original)
+        corrected = _perturb(rng, corrected, rng.randint(1, edits))
+        expected = dmp.diff_corrections(original, corrected)
+        assert fast.diff_corrections(original, corrected) == expected, (case, original, corrected)
+    print(f"{cases}개 무작위 케이스 일치")
+
+
+def _edit_chunk(rng, chunk):
+    """사전 교정 뒤 오타를 넣고, 청크 앞뒤에 어절을 붙이거나 첫 어절을 지움"""
+    corrected = _perturb(rng, CorrectionRules.apply_comprehensive_corrections(chunk), rng.randint(0, 4))
+    roll = rng.random()
+    if roll < 0.25:
+        corrected = rng.choice(SEAM_WORDS) + corrected
+    elif roll < 0.5:
+        corrected = corrected + " " + rng.choice(SEAM_WORDS)
+    elif roll < 0.6 and " " in corrected:
+        corrected = corrected.split(" ", 1)[1]
+    return corrected
+
+
+def test_chunked_matches_diff_match_patch_randomized(workflow_nodes):
+    """generate_diff처럼 청크별로 교정해 재조합한 문서에서 기존 diff와 같은 교정 목록인지 테스트"""
+    print("=== 청크 단위 무작위 diff 비교 테스트 ===")
+    fast, dmp = workflow_nodes(DIFF_ENGINE="fast"), workflow_nodes(DIFF_ENGINE="dmp")
+    rng = random.Random(1)
+    cases = 400
+    for case in range(cases):
+        texts = [text for _, text in rng.sample(TEST_CASES, rng.randint(1, len(TEST_CASES)))]
+        original = _perturb(rng, " ".join(texts), rng.randint(0, 10))
+        chunks = TextProcessor.smart_split_text(original)
+        corrected_chunks = [_edit_chunk(rng, chunk) for chunk in chunks]
+        corrected = TextProcessor.rejoin_chunks(corrected_chunks)
+        expected = dmp.diff_corrections(original, corrected)
+        assert fast.diff_corrections(original, corrected, chunks, corrected_chunks) == expected, (
+            case, original, corrected
+        )
+    print(f"{cases}개 무작위 문서 일치")
+
+
+def test_edit_budget_fallback_refines(workflow_nodes):
+    """어절 편집 수 제한을 넘어도 구간 전체를 한 번에 교체하지 않고 글자 단위로 비교하는지 테스트"""
+    print("=== 편집 수 제한 초과 테스트 ===")
+    fast, dmp = workflow_nodes(DIFF_ENGINE="fast"), workflow_nodes(DIFF_ENGINE="dmp")
+    fast.fast_diff.max_edit_tokens = 2
+    for name, text in TEST_CASES:
+        chunks = TextProcessor.smart_split_text(text)
+        corrected_chunks = [CorrectionRules.apply_comprehensive_corrections(chunk) for chunk in chunks]
+        corrected = TextProcessor.rejoin_chunks(corrected_chunks)
+        corrections = fast.diff_corrections(text, corrected, chunks, corrected_chunks)
+        print(f"{name}: 교정 {len(corrections)}개")
+        assert len(corrections) > 2
+        assert corrections == dmp.diff_corrections(text, corrected), name
+
+
+def test_chunk_alignment(workflow_nodes):
+    """청크 목록을 주면 청크 위치로 구간을 나누고, 결과는 전체 비교와 같은지 테스트"""
+    print("=== 청크 단위 비교 테스트 ===")
+    fast, dmp = workflow_nodes(DIFF_ENGINE="fast"), workflow_nodes(DIFF_ENGINE="dmp")
+    text = " ".join(text for _, text in TEST_CASES)
+    chunks = TextProcessor.smart_split_text(text)
+    corrected_chunks = [CorrectionRules.apply_comprehensive_corrections(chunk) for chunk in chunks]
+    corrected = TextProcessor.rejoin_chunks(corrected_chunks)
+    print(f"{len(text)}자, {len(chunks)}개 청크")
+    assert len(chunks) > 1
+
+    # 재조합할 때 공백이 정리되어도 청크 위치를 찾아야 함
+    segments = FastDiff._segments(text, corrected, chunks, corrected_chunks)
+    assert len(segments) == 2 * len(chunks) + 1
+    assert "".join(original for original, _ in segments) == text
+    assert "".join(corrected_part for _, corrected_part in segments) == corrected
+
+    expected = dmp.diff_corrections(text, corrected)
+    assert fast.diff_corrections(text, corrected, chunks, corrected_chunks) == expected
+    assert fast.diff_corrections(text, corrected) == expected
+
+
+def test_pathological_input_is_bounded(workflow_nodes):
+    """전혀 다른 긴 텍스트는 편집 수 제한을 넘으면 한 번의 교체로 처리하는지 테스트"""
+    print("=== 최악 입력 테스트 ===")
+    rng = random.Random(0)
+    original = "".join(rng.choice("가나다라마바사 ") for _ in range(5000))
+    corrected = "".join(rng.choice("가나다라마바사 ") for _ in range(5000))
+    fast = workflow_nodes(DIFF_ENGINE="fast")
+
+    started = time.perf_counter()
+    corrections = fast.diff_corrections(original, corrected)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"{elapsed_ms:.1f}ms, 교정 {len(corrections)}개")
+    # 글자 단위 비교는 max_refine_seconds까지만 진행
+    assert elapsed_ms < fast.dmp.Diff_Timeout * 1000 / 2
+    assert len(corrections) == 1
+
+    assert _myers(list("abc"), list("xyz"), max_edits=4) is None
+    assert _myers(list("abcd"), list("abxd"), max_edits=4) == [
+        (0, "a"), (0, "b"), (-1, "c"), (1, "x"), (0, "d")
+    ]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
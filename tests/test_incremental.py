@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+증분 교정 테스트
+편집 델타를 적용한 결과가 전체 재교정 결과와 같고, 영향받은 청크만 다시 교정하는지 확인합니다.
+"""
+
+import sys
+import os
+import random
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.backends import StubCorrectionBackend
+from app.services.incremental_service import IncrementalCorrectionService
+from app.utils import diff_match_patch as dmp_module
+from app.workflow.nodes import WorkflowNodes
+
+
+class FakeSpellcheckService:
+    def __init__(self):
+        self.dmp = dmp_module.diff_match_patch()
+        # 모델 출력이 입력과 같은 스텁 백엔드 (사전 교정만 적용됨)
+        self.nodes = WorkflowNodes(StubCorrectionBackend(), None, self.dmp)
+
+    def ensure_models_loaded(self):
+        return True
+
+
+BASE_TEXT = (
+    "여기애 한국어 맞춤밥 검사 시스템을 임력해보세요. 이 도구는 사용자가 임력한 텍스트에서 "
+    "오타와 맞춤법 오류를 찾아서 교정해줍니다. 또한 뛰어쓰기 규칙도 적용하여 더 자연스러운 "
+    "문장으로 만들어줍니다. 거기애 있는 기능들은 AI 모델과 규칙 기반 시스템을 결합하여 "
+    "구현되었습니다. 사용자는 최대 이천자까지의 긴 텍스트도 교정할 수 있으며, 시스템이 "
+    "자동으로 문맥을 보존하면서 적절한 크기로 분할하여 처리합니다. 안뇽하세요 라고 인사하면 "
+    "안녕하세요 로 교정됩니다. 재대로 된서 좋은 결과를 얻을 수 있을 것입니다. "
+) * 3
+
+
+def _new_service():
+    service = IncrementalCorrectionService()
+    service.spellcheck_service = FakeSpellcheckService()
+    return service
+
+
+def test_incremental_matches_full_recorrection():
+    """증분 결과와 전체 재교정 결과 비교 테스트"""
+    print("=== 증분 교정 일치 테스트 ===")
+    random.seed(7)
+    service = _new_service()
+    dmp = service.spellcheck_service.dmp
+
+    opened = service.open_session(BASE_TEXT)
+    session_id = opened["session_id"]
+    text = BASE_TEXT
+
+    for step in range(30):
+        pos = random.randint(0, len(text))
+        removed = random.randint(0, 5)
+        inserted = random.choice(["", "임력", " ", "거기애 ", "다. ", "안뇽"])
+        new_text = text[:pos] + inserted + text[pos + removed:]
+        delta = dmp.diff_toDelta(dmp.diff_main(text, new_text))
+
+        result = service.apply_edit(session_id, delta=delta, base_version=step + 1)
+        assert "error" not in result, result
+
+        full = _new_service().open_session(new_text)
+        assert result["corrected_text"] == full["corrected_text"]
+        assert result["region"]["chunk_count"] == full["region"]["chunk_count"]
+        text = new_text
+
+    print("PASS 30회 편집 모두 전체 재교정과 같은 결과")
+
+
+def test_only_affected_chunks_are_recorrected():
+    """영향받은 청크만 재교정되는지 테스트"""
+    print("=== 영향 구간 재교정 테스트 ===")
+    service = _new_service()
+    dmp = service.spellcheck_service.dmp
+    nodes = service.spellcheck_service.nodes
+    nodes.chunk_cache = None  # 캐시 없이도 재교정 범위가 제한되는지 확인
+    nodes.clean_screener = None
+
+    opened = service.open_session(BASE_TEXT)
+    total_chunks = opened["region"]["chunk_count"]
+    nodes.base_backend.chunks = 0
+
+    new_text = BASE_TEXT.replace("구현되었습니다", "구현됬습니다", 1)
+    delta = dmp.diff_toDelta(dmp.diff_main(BASE_TEXT, new_text))
+    result = service.apply_edit(opened["session_id"], delta=delta)
+
+    region = result["region"]
+    print(f"전체 청크: {total_chunks}, 재교정 청크: {region['chunk_start']}~{region['chunk_end']}")
+    assert total_chunks > 2
+    assert nodes.base_backend.chunks == region["chunk_end"] - region["chunk_start"] < total_chunks
+    assert any(c["original"] == "됬" and c["corrected"] == "됐" for c in result["corrections"])
+    print("PASS 편집된 구간만 다시 교정되었습니다")
+
+
+def test_invalid_delta_and_version():
+    """잘못된 델타 및 버전 충돌 테스트"""
+    print("=== 델타 오류 테스트 ===")
+    service = _new_service()
+    opened = service.open_session(BASE_TEXT)
+
+    result = service.apply_edit(opened["session_id"], delta="=1")
+    assert result["status_code"] == 409
+
+    result = service.apply_edit(opened["session_id"], delta=f"={len(BASE_TEXT)}", base_version=99)
+    assert result["status_code"] == 409
+
+    result = service.apply_edit("unknown", delta="=1")
+    assert result["status_code"] == 404
+    print("PASS 오류가 올바르게 반환되었습니다")
+
+
+if __name__ == "__main__":
+    print("증분 교정 테스트")
+    print("=" * 50)
+    test_incremental_matches_full_recorrection()
+    test_only_affected_chunks_are_recorrected()
+    test_invalid_delta_and_version()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+추론 실행기 테스트
+동기 추론이 이벤트 루프를 막지 않고, 대기 요청이 순서대로 처리되는지 확인합니다.
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.services.inference_executor import InferenceExecutor
+
+
+def test_event_loop_stays_responsive():
+    """느린 추론 중에도 이벤트 루프가 응답하는지 테스트"""
+    print("=== 이벤트 루프 응답성 테스트 ===")
+
+    async def scenario():
+        executor = InferenceExecutor(slots=1)
+        slow = asyncio.ensure_future(executor.run(time.sleep, 0.3))
+
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        loop_delay = time.perf_counter() - started
+
+        await slow
+        executor.shutdown()
+        return loop_delay
+
+    loop_delay = asyncio.run(scenario())
+    print(f"루프 지연: {loop_delay * 1000:.1f}ms")
+    assert loop_delay < 0.2
+    print("PASS 추론 중에도 이벤트 루프가 응답합니다")
+
+
+def test_fair_queueing_and_queue_depth():
+    """슬롯 대기 순서 및 대기열 깊이 노출 테스트"""
+    print("=== 공정 대기열 테스트 ===")
+
+    order = []
+
+    def job(i):
+        time.sleep(0.02)
+        order.append(i)
+        return i
+
+    async def scenario():
+        executor = InferenceExecutor(slots=1)
+        tasks = []
+        for i in range(5):
+            tasks.append(asyncio.ensure_future(executor.run(job, i)))
+            await asyncio.sleep(0)
+
+        await asyncio.sleep(0.005)
+        depth = executor.get_stats()["queue_depth"]
+        results = await asyncio.gather(*tasks)
+        stats = executor.get_stats()
+        executor.shutdown()
+        return depth, results, stats
+
+    depth, results, stats = asyncio.run(scenario())
+    print(f"대기열 깊이: {depth}, 처리 순서: {order}, 통계: {stats}")
+    assert depth == 4
+    assert results == list(range(5))
+    assert order == list(range(5))
+    assert stats["queue_depth"] == 0 and stats["completed"] == 5
+    print("PASS 요청이 도착 순서대로 처리되었습니다")
+
+
+def test_cancelled_request_keeps_slot():
+    """기다리던 요청이 취소되어도 스레드의 추론이 끝날 때까지 슬롯을 반환하지 않는지 테스트"""
+    print("=== 취소된 요청 슬롯 유지 테스트 ===")
+
+    lock = threading.Lock()
+    running = [0]
+    max_running = [0]
+
+    def job(seconds):
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        time.sleep(seconds)
+        with lock:
+            running[0] -= 1
+
+    async def scenario():
+        executor = InferenceExecutor(slots=1)
+        slow = asyncio.ensure_future(executor.run(job, 0.2))
+        await asyncio.sleep(0.05)
+        # 클라이언트 연결 종료처럼 기다리던 코루틴만 취소
+        slow.cancel()
+        await asyncio.sleep(0.01)
+        cancelled_stats = executor.get_stats()
+        await executor.run(job, 0.01)
+        stats = executor.get_stats()
+        executor.shutdown()
+        return cancelled_stats, stats
+
+    cancelled_stats, stats = asyncio.run(scenario())
+    print(f"최대 동시 실행: {max_running[0]}, 취소 직후: {cancelled_stats}, 통계: {stats}")
+    assert cancelled_stats["running"] == 1
+    assert max_running[0] == 1
+    assert stats["running"] == 0 and stats["completed"] == 2
+    print("PASS 취소된 요청의 추론이 끝난 뒤에 다음 요청이 실행되었습니다")
+
+
+if __name__ == "__main__":
+    print("추론 실행기 테스트")
+    print("=" * 50)
+    test_event_loop_stays_responsive()
+    test_fair_queueing_and_queue_depth()
+    test_cancelled_request_keeps_slot()
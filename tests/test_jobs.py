@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+문서 작업 테스트
+큰 문서가 작업자 풀에서 청크 배치 단위로 교정되고, 디스크에 저장된 부분 결과로
+서버 재시작 후에도 남은 청크부터 이어서 처리되는지 확인합니다.
+"""
+
+import sys
+import os
+import asyncio
+import json
+import math
+import tempfile
+import threading
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.config import settings
+from app.services.inference_executor import InferenceExecutor
+from app.services.job_service import DocumentJobService
+from app.utils.text_processor import TextProcessor
+
+# MAX_LENGTH(2000자)보다 긴 문서
+DOCUMENT = "".join(
+    f"{i}번째 문단입니다. 안뇽하세요. 맞춤밥 검사 시스템을 임력해보세요. 회의는 오후 3시에 시작합니다. "
+    for i in range(60)
+)
+
+
+@pytest.fixture
+def spellcheck_service(stub_service):
+    """교정한 청크를 seen_chunks에 기록하고, gate가 주어지면 열릴 때까지 교정을 멈추는 서비스를 만드는 함수"""
+
+    def make(seen_chunks=None, gate=None):
+        service = stub_service()
+
+        def transform(chunk):
+            if gate is not None:
+                gate.wait()
+            if seen_chunks is not None:
+                seen_chunks.append(chunk)
+            return chunk.replace("시스템", "도구")
+
+        service.nodes.base_backend.transform = transform
+        return service
+
+    return make
+
+
+@pytest.fixture
+def job_service(monkeypatch):
+    """job_dir을 JOB_DIR로 쓰고 4개 청크씩 처리하는 문서 작업 서비스를 만드는 함수"""
+    monkeypatch.setattr(settings, "JOB_BATCH_CHUNKS", 4)
+
+    def make(job_dir, spellcheck_service):
+        monkeypatch.setattr(settings, "JOB_DIR", job_dir)
+        service = DocumentJobService()
+        service.spellcheck_service = spellcheck_service
+        return service
+
+    return make
+
+
+def _wait_finished(service, job_id, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = service.get_status(job_id)
+        if job["status"] in service.FINISHED:
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"작업이 {timeout}초 안에 끝나지 않았습니다: {service.get_status(job_id)}")
+
+
+def _expected_text(spellcheck_service):
+    chunks = TextProcessor.smart_split_text(DOCUMENT)
+    return TextProcessor.rejoin_chunks(spellcheck_service.nodes.correct_and_refine_chunks(chunks))
+
+
+def test_job_completes(spellcheck_service, job_service):
+    """작업이 모든 청크를 교정하고 결과를 디스크에 저장하는지 테스트"""
+    print("=== 문서 작업 완료 테스트 ===")
+    corrector = spellcheck_service()
+    with tempfile.TemporaryDirectory() as job_dir:
+        service = job_service(job_dir, corrector)
+        job = service.submit(DOCUMENT)
+        job = _wait_finished(service, job["job_id"])
+        print(job)
+        assert job["status"] == "completed"
+        assert job["done_chunks"] == job["total_chunks"] > 4
+
+        result = service.get_result(job["job_id"])
+        assert result["corrected_text"] == _expected_text(corrector)
+        assert "도구" in result["corrected_text"]
+        assert result["corrections"]
+        chunks, offset = service.read_chunks(job["job_id"])
+        assert [chunk["index"] for chunk in chunks] == list(range(job["total_chunks"]))
+        # 다음 호출은 그 뒤에 추가된 부분만 읽음
+        assert service.read_chunks(job["job_id"], offset) == ([], offset)
+        for name in ("text.txt", "meta.json", "chunks.jsonl", "result.json"):
+            assert os.path.exists(os.path.join(job_dir, job["job_id"], name))
+
+        too_long = service.submit("가" * (settings.JOB_MAX_LENGTH + 1))
+        assert too_long["status_code"] == 413
+        service.shutdown()
+
+
+def test_resume_after_restart(spellcheck_service, job_service):
+    """재시작 후 저장된 배치는 건너뛰고 중간에 끊긴 배치부터 이어서 처리하는지 테스트"""
+    print("=== 재시작 후 이어서 처리 테스트 ===")
+    chunks = TextProcessor.smart_split_text(DOCUMENT)
+    with tempfile.TemporaryDirectory() as job_dir:
+        # 첫 배치까지 저장하고 두 번째 배치를 쓰는 도중 멈춘 작업을 디스크에 재현
+        crashed = job_service(job_dir, spellcheck_service())
+        first_batch = crashed.spellcheck_service.nodes.correct_and_refine_chunks(chunks[:4])
+        job_id = "crashed"
+        os.makedirs(os.path.join(job_dir, job_id))
+        with open(os.path.join(job_dir, job_id, "text.txt"), "w", encoding="utf-8") as f:
+            f.write(DOCUMENT)
+        crashed._write_meta({
+            "job_id": job_id, "status": "running", "length": len(DOCUMENT),
+            "total_chunks": len(chunks), "done_chunks": 4,
+            "created_at": time.time(), "updated_at": time.time(), "error": None,
+        })
+        crashed._append_batch(job_id, 0, first_batch, [[] for _ in first_batch])
+        with open(os.path.join(job_dir, job_id, "chunks.jsonl"), "a", encoding="utf-8") as f:
+            f.write('{"start": 4, "corrected": ["잘린')
+        crashed.shutdown()
+
+        seen_chunks = []
+        corrector = spellcheck_service(seen_chunks)
+        restarted = job_service(job_dir, corrector)
+        assert restarted.resume() == 1
+        job = _wait_finished(restarted, job_id)
+        print(f"{job['status']}: 재시작 후 교정한 청크 {len(seen_chunks)}/{len(chunks)}개")
+        assert job["status"] == "completed"
+        assert len(seen_chunks) == len(chunks) - 4
+
+        result = restarted.get_result(job_id)
+        assert result["corrected_text"] == _expected_text(corrector)
+        with open(os.path.join(job_dir, job_id, "chunks.jsonl"), encoding="utf-8") as f:
+            starts = [json.loads(line)["start"] for line in f]
+        assert starts == list(range(0, len(chunks), 4))
+
+        # 완료된 작업도 다시 불러와 결과를 조회할 수 있음
+        reloaded = job_service(job_dir, corrector)
+        assert reloaded.resume() == 0
+        assert reloaded.get_result(job_id) == result
+        restarted.shutdown()
+        reloaded.shutdown()
+
+
+def test_batches_use_inference_slots(spellcheck_service, job_service):
+    """작업 배치가 대화형 요청과 같은 추론 슬롯을 배치마다 얻어 실행되는지 테스트"""
+    print("=== 추론 슬롯 공유 테스트 ===")
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
+    executor = InferenceExecutor(slots=1)
+    executor.attach_loop(loop)
+    gate = threading.Event()
+    try:
+        with tempfile.TemporaryDirectory() as job_dir:
+            service = job_service(job_dir, spellcheck_service(gate=gate))
+            service.inference_executor = executor
+            job_id = service.submit(DOCUMENT)["job_id"]
+
+            # 작업 배치가 슬롯을 잡고 있는 동안 대화형 요청은 슬롯을 기다림
+            deadline = time.monotonic() + 5
+            while executor.get_stats()["running"] == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            request = asyncio.run_coroutine_threadsafe(executor.run(lambda: "대화형"), loop)
+            time.sleep(0.05)
+            assert executor.get_stats()["queue_depth"] == 1
+            gate.set()
+            assert request.result(timeout=5) == "대화형"
+
+            job = _wait_finished(service, job_id)
+            stats = executor.get_stats()
+            print(f"{job['status']}: 추론 실행기 통계 {stats}")
+            assert job["status"] == "completed"
+            assert stats["completed"] == math.ceil(job["total_chunks"] / 4) + 1
+            service.shutdown()
+    finally:
+        gate.set()
+        executor.shutdown()
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join()
+        loop.close()
+
+
+def test_workers_share_job_dir(spellcheck_service, job_service):
+    """같은 JOB_DIR을 쓰는 두 워커 중 한 워커만 작업을 처리하고 다른 워커는 디스크에서 상태를 조회"""
+    print("=== 워커 간 작업 공유 테스트 ===")
+    with tempfile.TemporaryDirectory() as job_dir:
+        seen_chunks = []
+        gate = threading.Event()
+        owner = job_service(job_dir, spellcheck_service(seen_chunks, gate=gate))
+        other = job_service(job_dir, spellcheck_service(seen_chunks))
+        job_id = owner.submit(DOCUMENT)["job_id"]
+        try:
+            # 처리 중인 작업을 다른 워커가 재시작 시 불러와도 잠금 때문에 처리하지 않음
+            assert other.resume() == 1
+            deadline = time.monotonic() + 5
+            while job_id in other._jobs and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert job_id not in other._jobs
+            assert other.get_status(job_id)["status"] in ("queued", "running")
+        finally:
+            gate.set()
+
+        job = _wait_finished(other, job_id)
+        print(f"{job['status']}: 교정한 청크 {len(seen_chunks)}/{job['total_chunks']}개")
+        assert job["status"] == "completed"
+        assert len(seen_chunks) == job["total_chunks"]
+        assert other.get_result(job_id) == owner.get_result(job_id)
+
+        assert other.cancel(job_id)
+        assert owner.get_status(job_id) is None
+        assert other.get_status("..") is None
+        owner.shutdown()
+        other.shutdown()
+
+
+def test_job_endpoints(spellcheck_service, job_service, monkeypatch):
+    """/api/v1/jobs 등록, 진행률 스트리밍, 결과 조회, 취소 API 테스트"""
+    print("=== 문서 작업 API 테스트 ===")
+    gate = threading.Event()
+    with tempfile.TemporaryDirectory() as job_dir:
+        service = job_service(job_dir, spellcheck_service(gate=gate))
+        monkeypatch.setattr(main, "document_job_service", service)
+        try:
+            client = TestClient(main.app)
+            submitted = client.post("/api/v1/jobs", json={"text": DOCUMENT})
+            assert submitted.status_code == 202
+            job_id = submitted.json()["job_id"]
+
+            # 완료 전에는 결과를 조회할 수 없음
+            assert client.get(f"/api/v1/jobs/{job_id}/result").status_code == 409
+            gate.set()
+
+            events = []
+            with client.stream("GET", f"/api/v1/jobs/{job_id}/events") as response:
+                for line in response.iter_lines():
+                    if line.startswith("event: "):
+                        events.append(line[len("event: "):])
+            print(events)
+            assert events[-1] == "completed"
+
+            status = client.get(f"/api/v1/jobs/{job_id}").json()
+            assert status["progress"] == 1.0
+            result = client.get(f"/api/v1/jobs/{job_id}/result")
+            assert result.status_code == 200
+            assert "도구" in result.json()["corrected_text"]
+
+            assert client.delete(f"/api/v1/jobs/{job_id}").status_code == 200
+            assert client.get(f"/api/v1/jobs/{job_id}").status_code == 404
+            assert not os.path.exists(os.path.join(job_dir, job_id))
+            assert client.post("/api/v1/jobs", json={"text": " "}).status_code == 400
+        finally:
+            gate.set()
+            service.shutdown()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
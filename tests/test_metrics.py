@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+실행 시간 계측 테스트
+노드/백엔드 단계별 실행 시간, 토큰 수, 청크 수가 Prometheus 히스토그램으로 노출되고
+요청 시 stage_texts로 단계별 교정문과 실행 시간이 반환되는지 확인합니다.
+"""
+
+import sys
+import os
+from types import SimpleNamespace
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+import torch
+from fastapi.testclient import TestClient
+
+from app.backends import Seq2SeqBackend
+from app.config import settings
+from app.main import app
+from app.services.advanced_spellcheck_service import AdvancedSpellCheckService
+from app.utils.metrics import MetricsRegistry, metrics_registry
+
+
+class WordTokenizer:
+    """단어 하나를 토큰 하나로 보는 토크나이저"""
+
+    pad_token_id = 0
+    eos_token_id = 1
+
+    def __call__(self, texts, **options):
+        lengths = [len(text.split()) for text in texts]
+        width = max(lengths)
+        mask = torch.tensor([[1] * n + [0] * (width - n) for n in lengths])
+        return {"input_ids": mask * 5, "attention_mask": mask}
+
+    def batch_decode(self, outputs, **options):
+        return ["출력" for _ in outputs]
+
+
+class EchoModel:
+    def generate(self, input_ids=None, attention_mask=None, **options):
+        return input_ids
+
+
+class EncoderDecoderEchoModel:
+    """BART처럼 출력 맨 앞에 디코더 시작 토큰(eos)을 붙이는 인코더-디코더 모델"""
+
+    config = SimpleNamespace(is_encoder_decoder=True, decoder_start_token_id=1)
+
+    def generate(self, input_ids=None, attention_mask=None, **options):
+        start = torch.full((input_ids.shape[0], 1), self.config.decoder_start_token_id)
+        return torch.cat([start, input_ids], dim=1)
+
+
+def test_histogram_exposition():
+    """히스토그램이 누적 버킷, 합계, 개수를 Prometheus 텍스트 형식으로 출력하는지 테스트"""
+    print("=== Prometheus 텍스트 형식 테스트 ===")
+    registry = MetricsRegistry()
+    histogram = registry.histogram("test_seconds", "테스트", ["node"], buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, node='a"b')
+
+    text = registry.render()
+    print(text)
+    assert '# TYPE test_seconds histogram' in text
+    assert 'test_seconds_bucket{node="a\\"b",le="0.1"} 2' in text
+    assert 'test_seconds_bucket{node="a\\"b",le="1"} 3' in text
+    assert 'test_seconds_bucket{node="a\\"b",le="+Inf"} 4' in text
+    assert 'test_seconds_sum{node="a\\"b"} 3.65' in text
+    assert 'test_seconds_count{node="a\\"b"} 4' in text
+    # 같은 이름은 같은 메트릭을 반환
+    assert registry.histogram("test_seconds", "테스트", ["node"]) is histogram
+
+
+def test_backend_records_stage_metrics():
+    """seq2seq 백엔드가 tokenize/generate/decode 시간과 토큰 수를 기록하는지 테스트"""
+    print("=== 백엔드 단계별 계측 테스트 ===")
+    backend = Seq2SeqBackend(EchoModel(), WordTokenizer(), model_name="test/echo")
+    backend.correct(["토큰 네 개 입력", "두 개"], max_new_tokens=8)
+
+    labels = 'backend="base",model="test/echo"'
+    text = metrics_registry.render()
+    for stage in ("tokenize", "generate", "decode"):
+        assert f'fixme_backend_stage_seconds_count{{{labels},stage="{stage}"}} 1' in text
+    assert f'fixme_backend_batch_tokens_sum{{{labels},direction="in"}} 6' in text
+    assert f'fixme_backend_batch_tokens_sum{{{labels},direction="out"}} 6' in text
+    assert f'fixme_backend_batch_chunks_sum{{{labels}}} 2' in text
+
+    # 디코더 시작 토큰은 생성된 토큰 수에 포함하지 않음
+    backend = Seq2SeqBackend(EncoderDecoderEchoModel(), WordTokenizer(), model_name="test/bart")
+    backend.correct(["토큰 네 개 입력", "두 개"], max_new_tokens=8)
+    labels = 'backend="base",model="test/bart"'
+    text = metrics_registry.render()
+    assert f'fixme_backend_batch_tokens_sum{{{labels},direction="out"}} 6' in text
+
+
+def test_stage_texts_and_metrics_endpoint():
+    """include_stages 요청 시 단계별 교정문과 실행 시간을 반환하고 /metrics에 노드 메트릭이 노출되는지 테스트"""
+    print("=== 단계별 교정문 / 메트릭 엔드포인트 테스트 ===")
+    original_backend = settings.INFERENCE_BACKEND
+    settings.INFERENCE_BACKEND = "stub"
+    try:
+        service = AdvancedSpellCheckService()
+        service.ensure_models_loaded()
+    finally:
+        settings.INFERENCE_BACKEND = original_backend
+    service.nodes.refine_backend.transform = lambda chunk: chunk.replace("문장", "글")
+
+    text = "이 문장은 긴 문서의 일부입니다. " * 20
+    result = service.correct_text(text, include_stages=True)
+    stages = result["stage_texts"]
+    print(f"단계: {list(stages)}, 실행 시간: {stages['timings']}")
+    assert "문장" in stages["initial_correction"]
+    assert stages["refine_correction"] == result["corrected_text"]
+    assert "문장" not in result["corrected_text"]
+    assert "initial_correction[0]" in stages["timings"] and "generate_diff" in stages["timings"]
+    assert "stage_texts" not in service.correct_text(text)
+
+    response = TestClient(app).get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    for node in ("smart_text_splitting", "correct_chunk_batch", "initial_correction", "generate_diff"):
+        assert f'fixme_node_wall_seconds_count{{node="{node}"}}' in response.text
+        assert f'fixme_node_cpu_seconds_count{{node="{node}"}}' in response.text
+    assert 'fixme_node_chunks_bucket{node="refine_correction",le="1"}' in response.text
+
+
+if __name__ == "__main__":
+    print("실행 시간 계측 테스트")
+    print("=" * 50)
+
+    test_histogram_exposition()
+    print()
+
+    test_backend_records_stage_metrics()
+    print()
+
+    test_stage_texts_and_metrics_endpoint()
+
+    print("\n테스트 완료!")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+모델 지연 로딩 테스트
+모델이 import 시점이 아니라 처음 필요할 때 한 번만 로드되는지 확인합니다.
+"""
+
+import sys
+import os
+import threading
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.services.advanced_spellcheck_service import AdvancedSpellCheckService
+
+
+def _service_with_fake_loaders(fail_lm=False):
+    service = AdvancedSpellCheckService()
+    calls = {"base": 0, "lm": 0}
+
+    def load_base():
+        calls["base"] += 1
+        time.sleep(0.1)
+        service.base_backend = object()
+
+    def load_lm():
+        calls["lm"] += 1
+        if fail_lm:
+            raise RuntimeError("모델 파일 없음")
+        service.refine_backend = object()
+
+    base_name, lm_name = list(service._model_loaders)
+    service._model_loaders = {base_name: load_base, lm_name: load_lm}
+    return service, calls
+
+
+def test_models_not_loaded_at_construction():
+    """서비스 생성 시점에는 모델을 로드하지 않음"""
+    print("=== 생성 시점 테스트 ===")
+    service, calls = _service_with_fake_loaders()
+
+    statuses = [model["status"] for model in service.get_model_status().values()]
+    print(f"모델 상태: {statuses}")
+    assert statuses == [AdvancedSpellCheckService.MODEL_NOT_LOADED] * 2
+    assert not service.is_model_loaded()
+    assert calls == {"base": 0, "lm": 0}
+
+
+def test_concurrent_requests_load_once():
+    """동시에 들어온 요청들이 모델 로딩을 한 번만 수행하고 완료를 함께 기다림"""
+    print("=== 동시 로딩 테스트 ===")
+    service, calls = _service_with_fake_loaders()
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(service.ensure_models_loaded()))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(f"로딩 호출 횟수: {calls}, 결과: {results}")
+    assert results == [True] * 4
+    assert calls == {"base": 1, "lm": 1}
+    assert service.is_model_loaded()
+    assert all(model["load_seconds"] is not None for model in service.get_model_status().values())
+
+
+def test_failed_model_is_reported():
+    """로드에 실패한 모델은 다시 시도하지 않고 실패 상태로 보고"""
+    print("=== 로딩 실패 테스트 ===")
+    service, calls = _service_with_fake_loaders(fail_lm=True)
+
+    assert not service.ensure_models_loaded()
+    assert not service.ensure_models_loaded()
+    assert calls == {"base": 1, "lm": 1}
+    assert service.has_model_failure()
+    assert not service.is_ready()
+
+    result = service.correct_text("안녕하세요")
+    print(f"교정 결과: {result}")
+    assert "error" in result
+
+
+if __name__ == "__main__":
+    test_models_not_loaded_at_construction()
+    print()
+    test_concurrent_requests_load_once()
+    print()
+    test_failed_model_is_reported()
+    print("\n테스트 완료!")
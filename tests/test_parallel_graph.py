@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+병렬 워크플로우 테스트
+청크 배치별 교정 분기가 병렬로 실행되어 앞 배치의 LLM 교정이 뒤 배치의 기본 교정과 겹치는지,
+노드별 실행 시간이 기록되는지 확인합니다.
+"""
+
+import sys
+import os
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+
+from app.utils.text_processor import TextProcessor
+
+LATENCY_MS = 50
+LONG_TEXT = "".join(
+    f"{i}번째 문장은 긴 문서의 일부입니다. 이 문서는 여러 청크로 나뉩니다. " for i in range(30)
+)[:1900]
+
+
+@pytest.fixture
+def service(stub_service):
+    service = stub_service(GENERATION_BATCH_SIZE=2, MICRO_BATCHING=True)
+    service.nodes.base_backend.latency_ms = LATENCY_MS
+    service.nodes.refine_backend.latency_ms = LATENCY_MS
+    service.nodes.refine_backend.transform = lambda chunk: chunk.replace("문장", "글")
+    return service
+
+
+def test_refinement_overlaps_initial_correction(service):
+    """배치별 분기가 겹쳐 실행되어 단계별 순차 실행보다 빨리 끝나는지 테스트"""
+    print("=== 배치 파이프라인 병렬 실행 테스트 ===")
+    chunks = TextProcessor.smart_split_text(LONG_TEXT)
+
+    # 기본 교정을 모두 끝낸 뒤 LLM 교정을 시작하는 순차 실행
+    started = time.perf_counter()
+    expected = TextProcessor.rejoin_chunks(service.nodes.correct_and_refine_chunks(chunks))
+    sequential_ms = (time.perf_counter() - started) * 1000.0
+
+    started = time.perf_counter()
+    result = service.correct_text(LONG_TEXT, use_cache=False)
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+    print(f"청크 {len(chunks)}개, 병렬 {elapsed_ms:.0f}ms, 순차 {sequential_ms:.0f}ms")
+    assert len(chunks) > 2
+    assert elapsed_ms < sequential_ms
+
+    assert result["corrected_text"] == expected
+    assert "문장" not in result["corrected_text"]
+    assert result["corrections"]
+
+
+def test_node_timings_are_recorded(service):
+    """노드별 실행 시간이 상태와 통계에 기록되는지 테스트"""
+    print("=== 노드 실행 시간 테스트 ===")
+    result_state = service.workflow.invoke({
+        "original_text": LONG_TEXT,
+        "corrected_text": "",
+        "corrections": [],
+        "error": "",
+        "text_chunks": [],
+        "processed_chunks": [],
+        "suggestions": [],
+        "chunk_results": {},
+        "timings": {},
+    })
+
+    timings = result_state["timings"]
+    print(f"노드 실행 시간: {timings}")
+    for name in ("smart_text_splitting", "merge_chunks", "generate_suggestions", "generate_diff"):
+        assert name in timings
+    assert "initial_correction[0]" in timings and "refine_correction[0]" in timings
+    assert timings["initial_correction[0]"] >= LATENCY_MS
+
+    stats = service.get_node_stats()
+    print(f"노드 통계: {stats}")
+    assert stats["correct_chunk_batch"]["count"] == len(result_state["text_chunks"])
+    assert stats["generate_diff"]["count"] == 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
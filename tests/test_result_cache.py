@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+교정 결과 캐시 테스트
+LRU 제거, 바이트 크기 제한, TTL 만료, 적중률 통계를 확인합니다.
+"""
+
+import sys
+import os
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.utils.result_cache import ResultCache
+
+
+def test_key_normalization():
+    """정규화된 입력과 설정으로 키가 생성되는지 테스트"""
+    print("=== 캐시 키 테스트 ===")
+    import unicodedata
+
+    text = "안녕하세요"
+    nfd = unicodedata.normalize("NFD", text)
+    assert ResultCache.make_key(text, "model") == ResultCache.make_key(nfd, "model")
+    assert ResultCache.make_key(text, "model") != ResultCache.make_key(text, "other")
+    assert ResultCache.make_key(text, {"num_beams": 3}) != ResultCache.make_key(text, {"num_beams": 1})
+    print("PASS NFC 정규화 및 설정별 키 분리")
+
+
+def test_lru_byte_limit():
+    """바이트 크기 한도 초과 시 LRU 제거 테스트"""
+    print("=== LRU 바이트 한도 테스트 ===")
+    cache = ResultCache(max_bytes=40, sizeof=lambda value: 10)
+
+    for key in ["a", "b", "c"]:
+        cache.put(key, key)
+    cache.get("a")  # a를 최근 사용으로 갱신
+    cache.put("d", "d")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+    stats = cache.get_stats()
+    print(f"통계: {stats}")
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= 40
+
+    small = ResultCache(max_bytes=10)
+    small.put("huge", "x" * 100)
+    assert small.get("huge") is None
+    print("PASS 가장 오래 사용되지 않은 항목이 제거되었습니다")
+
+
+def test_ttl_and_counters():
+    """TTL 만료 및 적중/실패 카운터 테스트"""
+    print("=== TTL 테스트 ===")
+    cache = ResultCache(max_bytes=1024, ttl_seconds=0.05)
+    cache.put("k", {"corrected_text": "안녕하세요"})
+
+    assert cache.get("k") == {"corrected_text": "안녕하세요"}
+    time.sleep(0.1)
+    assert cache.get("k") is None
+
+    stats = cache.get_stats()
+    print(f"통계: {stats}")
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["expirations"] == 1 and stats["entries"] == 0
+    print("PASS 만료된 항목은 반환되지 않습니다")
+
+
+if __name__ == "__main__":
+    print("교정 결과 캐시 테스트")
+    print("=" * 50)
+    test_key_normalization()
+    test_lru_byte_limit()
+    test_ttl_and_counters()
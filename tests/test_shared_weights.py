@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+공유 가중치 로드 테스트
+모델 다운로드 없이 작은 BART 모델을 만들어, mmap으로 공유해 로드한 백엔드가
+일반 로드와 같은 가중치/교정 결과를 내고 가중치가 복사 없이 파일 매핑에 놓이는지 확인합니다.
+"""
+
+import sys
+import os
+import tempfile
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+import torch
+from tokenizers import Regex, Tokenizer, decoders, models, pre_tokenizers, processors
+from transformers import BartConfig, BartForConditionalGeneration, PreTrainedTokenizerFast
+
+from app.backends import TorchSeq2SeqBackend
+from app.backends.torch_backend import shared_weights_dir
+from app.config import settings
+from app.services.advanced_spellcheck_service import AdvancedSpellCheckService
+
+TEXTS = ["안녕하세요. 오늘 날씨가 좋네요.", "맞춤법 검사기입니다!"]
+
+
+def _save_tiny_model(model_dir):
+    """글자 단위 토크나이저와 작은 BART 모델을 model_dir에 저장"""
+    vocab = {"<pad>": 0, "</s>": 1, "<s>": 2, "<unk>": 3}
+    for char in sorted(set("".join(TEXTS))):
+        vocab.setdefault(char, len(vocab))
+    tokenizer = Tokenizer(models.WordLevel(vocab, unk_token="<unk>"))
+    tokenizer.pre_tokenizer = pre_tokenizers.Split(Regex("."), behavior="isolated")
+    tokenizer.decoder = decoders.Fuse()
+    tokenizer.post_processor = processors.TemplateProcessing(
+        single="$A </s>", special_tokens=[("</s>", 1)]
+    )
+    PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer, pad_token="<pad>", eos_token="</s>", bos_token="<s>", unk_token="<unk>"
+    ).save_pretrained(model_dir)
+
+    torch.manual_seed(0)
+    config = BartConfig(
+        vocab_size=len(vocab), d_model=32, encoder_layers=2, decoder_layers=2,
+        encoder_attention_heads=2, decoder_attention_heads=2, encoder_ffn_dim=64, decoder_ffn_dim=64,
+        pad_token_id=0, eos_token_id=1, bos_token_id=2, decoder_start_token_id=1, forced_eos_token_id=1,
+    )
+    BartForConditionalGeneration(config).save_pretrained(model_dir)
+
+
+def test_shared_weights_match_private_load():
+    """공유 가중치 백엔드가 일반 로드와 같은 가중치와 생성 결과를 내는지 테스트"""
+    print("=== 공유 가중치 로드 테스트 ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        model_dir = os.path.join(tmp, "tiny-bart")
+        weights_dir = os.path.join(tmp, "shared")
+        _save_tiny_model(model_dir)
+
+        private = TorchSeq2SeqBackend.from_pretrained(model_dir, "cpu")
+        shared = TorchSeq2SeqBackend.from_pretrained(model_dir, "cpu", weights_dir=weights_dir)
+
+        private_state = private.model.state_dict()
+        shared_state = shared.model.state_dict()
+        assert private_state.keys() == shared_state.keys()
+        assert all(torch.equal(private_state[name], shared_state[name]) for name in private_state)
+        # 공유 임베딩(tie_weights)이 유지되어야 함
+        assert shared.model.lm_head.weight.data_ptr() == shared.model.get_input_embeddings().weight.data_ptr()
+
+        options = {"num_beams": 2, "max_new_tokens": 20}
+        private_result = private.correct(TEXTS, **options)
+        shared_result = shared.correct(TEXTS, **options)
+        print(shared_result)
+        assert shared_result == private_result
+
+
+def _file_mappings(path):
+    """/proc/self/smaps에서 path를 매핑한 (시작 주소, 끝 주소, 익명 페이지 kB) 목록"""
+    mappings = []
+    current = None
+    with open("/proc/self/smaps") as f:
+        for line in f:
+            fields = line.split()
+            if "-" in fields[0] and not fields[0].endswith(":"):
+                current = None
+                if fields[-1] == path:
+                    start, end = (int(address, 16) for address in fields[0].split("-"))
+                    current = [start, end, 0]
+                    mappings.append(current)
+            elif current is not None and fields[0] == "Anonymous:":
+                current[2] = int(fields[1])
+    return mappings
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/smaps"), reason="Linux /proc/self/smaps 필요")
+def test_shared_weights_are_file_backed():
+    """공유 가중치가 내보낸 파일의 mmap 영역을 그대로 사용하고, 추론 후에도 복사되지 않는지 테스트"""
+    print("=== 공유 가중치 mmap 테스트 ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        model_dir = os.path.join(tmp, "tiny-bart")
+        weights_dir = os.path.join(tmp, "shared")
+        _save_tiny_model(model_dir)
+
+        private = TorchSeq2SeqBackend.from_pretrained(model_dir, "cpu")
+        shared = TorchSeq2SeqBackend.from_pretrained(model_dir, "cpu", weights_dir=weights_dir)
+        shared.correct(TEXTS, num_beams=2, max_new_tokens=20)
+
+        weights_path = os.path.realpath(os.path.join(shared_weights_dir(weights_dir, model_dir), "state_dict.pt"))
+        mappings = _file_mappings(weights_path)
+        print(f"매핑 {len(mappings)}개, 복사된 익명 페이지 {sum(copied for _, _, copied in mappings)}kB")
+        assert mappings
+
+        def file_backed(tensor):
+            return any(start <= tensor.data_ptr() < end for start, end, _ in mappings)
+
+        # 모든 가중치가 파일 매핑 안에 있음 (워커마다 익명 메모리로 복사되지 않음)
+        assert all(file_backed(tensor) for tensor in shared.model.state_dict().values())
+        assert not any(file_backed(tensor) for tensor in private.model.state_dict().values())
+        # 쓰기로 복사된(copy-on-write) 익명 페이지가 없으면 페이지 캐시를 다른 워커와 그대로 공유
+        assert sum(copied for _, _, copied in mappings) == 0
+
+
+def test_prepare_skipped_off_cpu(monkeypatch):
+    """CUDA에서는 mmap 공유가 적용되지 않으므로 공유 가중치를 내보내지 않는지 테스트"""
+    print("=== CUDA 공유 가중치 생략 테스트 ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        weights_dir = os.path.join(tmp, "shared")
+        monkeypatch.setattr(settings, "SHARED_WEIGHTS_DIR", weights_dir)
+        service = AdvancedSpellCheckService()
+        service.device = "cuda"
+        service.prepare_shared_weights()
+        assert not os.path.exists(weights_dir)
+
+
+def test_shared_weights_are_exported_once():
+    """두 번째 로드(다른 워커)는 저장된 파일을 다시 사용하는지 테스트"""
+    print("=== 공유 가중치 재사용 테스트 ===")
+    with tempfile.TemporaryDirectory() as tmp:
+        model_dir = os.path.join(tmp, "tiny-bart")
+        weights_dir = os.path.join(tmp, "shared")
+        _save_tiny_model(model_dir)
+
+        TorchSeq2SeqBackend.from_pretrained(model_dir, "cpu", weights_dir=weights_dir)
+        weights_path = os.path.join(shared_weights_dir(weights_dir, model_dir), "state_dict.pt")
+        exported_at = os.path.getmtime(weights_path)
+
+        # 원본 모델이 없어도 저장된 가중치만으로 로드
+        os.rename(model_dir, model_dir + "-moved")
+        backend = TorchSeq2SeqBackend.from_pretrained(model_dir, "cpu", weights_dir=weights_dir)
+        assert os.path.getmtime(weights_path) == exported_at
+        assert backend.correct(TEXTS, max_new_tokens=20)
+
+        bf16_dir = shared_weights_dir(weights_dir, model_dir, torch.bfloat16)
+        assert bf16_dir != os.path.dirname(weights_path)
+
+
+if __name__ == "__main__":
+    print("공유 가중치 로드 테스트")
+    print("=" * 50)
+
+    test_shared_weights_match_private_load()
+    print()
+
+    test_shared_weights_are_file_backed()
+    print()
+
+    test_shared_weights_are_exported_once()
+
+    print("\n테스트 완료!")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+스트리밍 교정 API 테스트
+/api/v1/spellcheck/stream이 청크별 이벤트를 청크 순서대로 보내고,
+마지막 요약 이벤트가 correct_text 결과와 같으며, 교정 중 예외는 error 이벤트로 끝나는지 확인합니다.
+"""
+
+import sys
+import os
+import json
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.utils.text_processor import TextProcessor
+
+TEXT = " ".join(
+    f"{i}번째 문장은 스트리밍으로 교정되는 긴 문서의 일부이며 맞춤밥 검사를 기다립니다." for i in range(20)
+)
+
+
+@pytest.fixture
+def service(stub_service, monkeypatch):
+    service = stub_service(GENERATION_BATCH_SIZE=2)
+    service.nodes.refine_backend.transform = lambda chunk: chunk.replace("문서", "글")
+    monkeypatch.setattr(main, "spellcheck_service", service)
+    return service
+
+
+def _stream(text):
+    """스트리밍 API를 호출하여 (응답, [(이벤트 이름, 데이터), ...])를 반환"""
+    client = TestClient(main.app)
+    with client.stream("POST", "/api/v1/spellcheck/stream", json={"text": text}) as response:
+        body = "".join(response.iter_text())
+
+    events = []
+    for message in body.split("\n\n"):
+        if not message.strip():
+            continue
+        fields = dict(line.split(": ", 1) for line in message.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return response, events
+
+
+def test_chunk_events_and_summary(service):
+    """청크 이벤트가 청크 순서대로 오고 요약 이벤트가 correct_text 결과와 같은지 테스트"""
+    print("=== 스트리밍 이벤트 테스트 ===")
+    chunks = TextProcessor.smart_split_text(TEXT)
+    response, events = _stream(TEXT)
+    print(f"청크 {len(chunks)}개, 이벤트 {[name for name, _ in events]}")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert len(chunks) > 2
+
+    chunk_events = [data for name, data in events if name == "chunk"]
+    assert [name for name, _ in events] == ["chunk"] * len(chunks) + ["summary"]
+    assert [data["index"] for data in chunk_events] == list(range(len(chunks)))
+    assert [data["original"] for data in chunk_events] == chunks
+    assert all(data["total"] == len(chunks) for data in chunk_events)
+
+    summary = events[-1][1]
+    expected = service.correct_text(TEXT, use_cache=False)
+    assert summary["corrected_text"] == expected["corrected_text"]
+    assert summary["corrections"] == expected["corrections"]
+    assert summary["suggestions"] == expected["suggestions"]
+    assert "글" in summary["corrected_text"]
+
+
+def test_error_event(service, monkeypatch):
+    """교정 중 예외가 나면 그때까지의 청크 이벤트 뒤에 error 이벤트를 보내고 끝나는지 테스트"""
+    print("=== 스트리밍 오류 이벤트 테스트 ===")
+    correct_and_refine_chunks = service.nodes.correct_and_refine_chunks
+    calls = []
+
+    def failing(batch):
+        calls.append(batch)
+        if len(calls) > 1:
+            raise RuntimeError("모델 추론 실패")
+        return correct_and_refine_chunks(batch)
+
+    monkeypatch.setattr(service.nodes, "correct_and_refine_chunks", failing)
+    response, events = _stream(TEXT)
+    print(f"이벤트: {events[-1]}")
+
+    assert response.status_code == 200
+    # 첫 청크는 단독 배치로 먼저 전송되고, 두 번째 배치에서 실패
+    assert [name for name, _ in events] == ["chunk", "error"]
+    assert "모델 추론 실패" in events[-1][1]["error"]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+문체 변환 규칙 테스트 스크립트
+컴파일된 단일 스캔 변환이 규칙을 순서대로 적용한 결과와 같은지 테스트합니다.
+"""
+
+import sys
+import os
+import random
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.utils.style_utils import StyleTone, StyleTransformer
+
+
+def sequential_transform(text, tone):
+    """규칙을 하나씩 순서대로 적용하는 기존 방식"""
+    return StyleTransformer._cleanup(StyleTransformer._apply_rules_sequentially(text, tone))
+
+
+def test_transform_examples():
+    """대표 문장 변환 테스트"""
+    print("=== 문체 변환 예시 테스트 ===")
+
+    test_cases = [
+        ("고마워 그리고 미안해", StyleTone.POLITE, "감사합니다 또한 죄송합니다"),
+        ("근데 진짜 좋습니다.", StyleTone.FRIENDLY, "그런데 정말 좋아요."),
+        ("그냥 막 짜증나 .", StyleTone.BUSINESS, "불편하다."),
+        ("감사드립니다, 하겠습니다", StyleTone.CASUAL, "고마워, 할게"),
+        # 제거 대상으로 시작하는 단어는 앞부분만 제거됨
+        ("막상 해보니 완전 쉬워", StyleTone.FORMAL, "상 해보니 매우 간단하다"),
+    ]
+
+    for i, (text, tone, expected) in enumerate(test_cases, 1):
+        result = StyleTransformer.transform_style(text, tone)
+        status = "PASS" if result == expected else "FAIL"
+        print(f"테스트 {i}: {status} [{tone.value}] {text} -> {result}")
+        assert result == expected
+
+
+def test_matches_sequential_rules():
+    """무작위 문장에서 기존 순차 적용 결과와 비교"""
+    print("=== 순차 적용 결과 비교 테스트 ===")
+
+    words = set(StyleTransformer.CONJUNCTION_IMPROVEMENTS) | set(StyleTransformer.REFINEMENT_RULES)
+    for rules in StyleTransformer.STYLE_RULES.values():
+        words |= set(rules) | set(rules.values())
+    words = sorted(words) + ["막상", "그냥저냥", "그냥막", "오늘", "3", "abc"]
+    separators = [" ", "  ", ", ", ".", "!", "\n", "", " ?"]
+
+    rng = random.Random(0)
+    mismatches = 0
+    for _ in range(2000):
+        text = "".join(
+            rng.choice(words) + rng.choice(separators) for _ in range(rng.randint(1, 8))
+        )
+        for tone in StyleTone:
+            if StyleTransformer.transform_style(text, tone) != sequential_transform(text, tone):
+                mismatches += 1
+
+    print(f"불일치: {mismatches}건")
+    assert mismatches == 0
+
+
+def test_all_styles_single_scan():
+    """모든 톤을 한 번에 변환한 결과가 톤별 변환 결과와 같은지 테스트"""
+    print("=== 전체 톤 단일 스캔 테스트 ===")
+
+    test_texts = [
+        "근데 진짜 고마워 그리고 미안해 .",
+        "  그냥막 하겠습니다,  좋아요!  ",
+        "막상 해보니 완전 쉬워  \n 짜증나",
+        "규칙에 해당하는 단어가 없는 문장입니다.",
+    ]
+
+    for text in test_texts:
+        all_styles = StyleTransformer.transform_all_styles(text)
+        for tone in StyleTone:
+            expected = StyleTransformer.transform_style(text, tone)
+            print(f"[{tone.value}] {all_styles[tone]}")
+            assert all_styles[tone] == expected
+
+    suggestions = StyleTransformer.get_style_suggestions(test_texts[0])
+    assert list(suggestions) == [tone.value for tone in StyleTone]
+
+
+if __name__ == "__main__":
+    print("문체 변환 규칙 테스트")
+    print("=" * 50)
+
+    test_transform_examples()
+    print()
+
+    test_matches_sequential_rules()
+    print()
+
+    test_all_styles_single_scan()
+
+    print("\n테스트 완료!")